@@ -1,6 +1,7 @@
 from bam_masterdata.checker.masterdata_validator import MasterdataValidator
 from bam_masterdata.checker.source_loader import SourceLoader
-from bam_masterdata.logger import logger
+from bam_masterdata.logger import collect_logs, logger
+from bam_masterdata.metadata.bundle import load_bundle
 from bam_masterdata.metadata.entities_dict import EntitiesDict
 from bam_masterdata.utils import load_validation_rules
 
@@ -16,15 +17,39 @@ class MasterdataChecker:
         self.new_entities: dict = None
         self.logger = logger
         self.validation_rules: dict = {}
-
-    def load_current_model(self, datamodel_dir: str = "./bam_masterdata/datamodel/"):
+        self.logs: list[dict] = []
+
+    def load_current_model(
+        self,
+        datamodel_dir: str = "./bam_masterdata/datamodel/",
+        workers: int = 1,
+        use_cache: bool = False,
+        bundle_path: str | None = None,
+    ):
         """
         Load and transform the current data model (Pydantic classes) into JSON.
 
-        Uses the default datamodel directory unless overridden.
+        Uses the default datamodel directory unless overridden. The Python modules are loaded in `workers`
+        processes if it is larger than 1. If `use_cache` is True, the modules whose source did not change since
+        the last run are read from the on-disk cache of `EntitiesDict`. If `bundle_path` is set, the current
+        model is read from the datamodel bundle file, unless it is outdated with respect to `datamodel_dir`.
         """
+        if bundle_path:
+            bundle = load_bundle(
+                bundle_path, python_path=datamodel_dir, logger=self.logger
+            )
+            if bundle is not None:
+                self.logger.info(f"Loading current data model from: {bundle_path}")
+                self.current_model = bundle.entities
+                return
+
         self.logger.info(f"Loading current data model from: {datamodel_dir}")
-        entities_dict = EntitiesDict(python_path=datamodel_dir, logger=self.logger)
+        entities_dict = EntitiesDict(
+            python_path=datamodel_dir,
+            workers=workers,
+            use_cache=use_cache,
+            logger=self.logger,
+        )
         self.current_model = entities_dict.single_json()
 
     def load_new_entities(self, source: str):
@@ -47,7 +72,8 @@ class MasterdataChecker:
         - "all" -> Run both validation types.
         - "individual" -> Run individual repositories validations.
 
-        Before running, ensure that required models are loaded based on the mode.
+        Before running, ensure that required models are loaded based on the mode. The log messages emitted
+        during the validation are stored in `self.logs`.
 
         Returns:
             dict: Validation results.
@@ -82,7 +108,11 @@ class MasterdataChecker:
         validator = MasterdataValidator(
             self.new_entities, self.current_model, self.validation_rules
         )
-        return validator.validate(mode)
+        # Keep the log messages of this run, independently of the global `log_storage`
+        with collect_logs() as logs:
+            validation_results = validator.validate(mode)
+        self.logs = logs
+        return validation_results
 
 
 def no_validation_errors(validation_results: dict) -> bool:
@@ -1,8 +1,143 @@
 import re
+from collections.abc import Callable
+from typing import Any
 
 from bam_masterdata.logger import logger
 from bam_masterdata.metadata.definitions import DataType
-from bam_masterdata.utils import is_reduced_version, store_log_message
+from bam_masterdata.utils import store_log_message
+
+# A compiled field validator returns the list of `(message suffix, level)` failures for a value
+FieldValidator = Callable[[Any], list[tuple[str, str]]]
+
+_DATA_TYPE_VALUES = frozenset(dt.value for dt in DataType)
+_BOOL_VALUES = frozenset({"true", "false"})
+
+
+def _is_valid_data_type(value: str) -> bool:
+    """
+    Checks if `value` is one of the openBIS data types or follows the format 'SAMPLE:<CODE>' or
+    'OBJECT:<CODE>'.
+    """
+    if value in _DATA_TYPE_VALUES:
+        return True
+    if value.startswith("OBJECT") or value.startswith("SAMPLE"):
+        els = value.split(":")
+        return len(els) == 2 and bool(els[1].strip())
+    return False
+
+
+def _fails_data_type(value: Any) -> bool:
+    return not _is_valid_data_type(str(value))
+
+
+def _fails_bool(value: Any) -> bool:
+    return str(value).strip().lower() not in _BOOL_VALUES
+
+
+def compile_field_rule(rule: dict) -> FieldValidator | None:
+    """
+    Compiles the validation `rule` of a field into a validator. The regex pattern of the rule is compiled
+    once and only the checks that can fail are kept (e.g., the pattern `.*` matches any value).
+
+    Args:
+        rule (dict): The validation rule of the field, as defined in `validation_rules.json`.
+
+    Returns:
+        FieldValidator | None: A function returning the list of `(message suffix, level)` failures for a
+        value, or None if the rule cannot fail.
+    """
+    checks: list[tuple[Callable[[Any], bool], str, str]] = []
+
+    if "pattern" in rule and rule["pattern"] != ".*":
+        match = re.compile(rule["pattern"]).match
+        pattern_message = "Invalid format."
+        pattern_level = "error"
+        if "is_description" in rule:
+            pattern_message = f"{pattern_message} Description should follow the schema: English Description + '//' + German Description. "
+            pattern_level = "warning"
+        if "is_section" in rule:
+            pattern_message = f"{pattern_message} First letter of every word starts with capitalized lettter."
+            pattern_level = "warning"
+
+        def _fails_pattern(value: Any) -> bool:
+            return value is not None and not match(str(value))
+
+        checks.append((_fails_pattern, pattern_message, pattern_level))
+
+    if "is_bool" in rule:
+        checks.append((_fails_bool, "Expected a boolean.", "error"))
+
+    if "is_data" in rule:
+        checks.append(
+            (
+                _fails_data_type,
+                f"The Data Type should be one of the following: {[dt.value for dt in DataType]} "
+                "or follow the format 'SAMPLE:<CODE>' or 'OBJECT:<CODE>'",
+                "error",
+            )
+        )
+
+    # TODO `extra_validation` (e.g., `is_reduced_version` for the generated code prefix) is not
+    # applied, as it was never resolved to a validation function
+    if not checks:
+        return None
+
+    allow_empty = "allow_empty" in rule
+
+    def validate(value: Any) -> list[tuple[str, str]]:
+        # Skip check if empty fields are allowed
+        if allow_empty and not value:
+            return []
+        return [(message, level) for fails, message, level in checks if fails(value)]
+
+    return validate
+
+
+def compile_validation_rules(
+    validation_rules: dict,
+) -> dict[str, dict[str, FieldValidator]]:
+    """
+    Compiles the validation rules into validators per rule type and field. Fields whose rules cannot fail
+    are not included.
+
+    Args:
+        validation_rules (dict): The validation rules, as loaded by `load_validation_rules`.
+
+    Returns:
+        dict[str, dict[str, FieldValidator]]: The validators of each field for each rule type
+        ("defs_validation", "properties_validation", or "terms_validation").
+    """
+    compiled_rules: dict[str, dict[str, FieldValidator]] = {}
+    for rule_type, rules in validation_rules.items():
+        if not isinstance(rules, dict):
+            continue
+        compiled_rules[rule_type] = {}
+        for field, rule in rules.items():
+            validator = compile_field_rule(rule) if rule else None
+            if validator is not None:
+                compiled_rules[rule_type][field] = validator
+    return compiled_rules
+
+
+class AssignmentsIndex:
+    """
+    Index of the assigned properties (or terms) of the entities of one entity type, so that comparing an
+    incoming entity against all the existing ones is a hash lookup instead of a scan of the model.
+
+    Args:
+        entities (dict): The entities of one entity type, keyed by their codes.
+        assignments_key (str): The key of the assignments in the entities ("properties" or "terms").
+    """
+
+    def __init__(self, entities: dict, assignments_key: str = "properties"):
+        # Assigned properties or terms of each entity, keyed by their codes
+        self.assignments: dict[str, dict[str, dict]] = {}
+        # Entities (in the order of `entities`) sharing the same set of assigned codes
+        self.entities_by_codes: dict[frozenset[str], list[str]] = {}
+        for entity_code, entity in entities.items():
+            props = {prop["code"]: prop for prop in entity.get(assignments_key, [])}
+            self.assignments[entity_code] = props
+            self.entities_by_codes.setdefault(frozenset(props), []).append(entity_code)
 
 
 class MasterdataValidator:
@@ -18,9 +153,12 @@ class MasterdataValidator:
         self.new_entities = new_entities
         self.current_model = current_model
         self.validation_rules = validation_rules
+        self.compiled_rules = compile_validation_rules(validation_rules)
         self.logger = logger
         self.log_msgs: list = []
         self.validation_results: dict = {}
+        # Indices of the assigned properties or terms in `current_model`, built once per comparison
+        self._assignments_index: dict[tuple[str, str], AssignmentsIndex] = {}
 
     def validate(self, mode: str = "all") -> dict:
         """
@@ -254,84 +392,28 @@ class MasterdataValidator:
             "properties_validation": "in 'properties'.",
             "terms_validation": "in 'terms'.",
         }.get(rule_type, ".")
+        extra_location_str = f" {extra_location} " if extra_location else " "
 
+        validators = self.compiled_rules.get(rule_type, {})
         for field, value in data.items():
-            rule = self.validation_rules.get(rule_type, {}).get(field)
+            validator = validators.get(field)
+            if validator is None:
+                continue  # Skip fields with no validation rules
 
-            extra_location_str = f" {extra_location} " if extra_location else " "
+            failures = validator(value)
+            if not failures:
+                continue
 
+            # The message is only built for failing fields
             log_message = (
                 f"Invalid '{value}' value found in the '{field}' field at line {row_location} "
                 f"in entity '{entity_name}' of '{entity_type}'{extra_location_str}"
             )
-
-            if not rule:
-                continue  # Skip fields with no validation rules
-
-            # Handle empty fields
-            if "allow_empty" in rule and (value is None or value == "" or not value):
-                continue  # Skip check if empty fields are allowed
-
-            # Validate pattern (regex)
-            if "pattern" in rule and value is not None:
-                if not re.match(rule["pattern"], str(value)):
-                    log_message = f"{log_message}Invalid format."
-                    level = "error"
-                    if "is_description" in rule:
-                        log_message = f"{log_message} Description should follow the schema: English Description + '//' + German Description. "
-                        level = "warning"
-                    if "is_section" in rule:
-                        log_message = f"{log_message} First letter of every word starts with capitalized lettter."
-                        level = "warning"
-                    store_log_message(logger, parent_entity, log_message, level=level)
-
-            # Validate boolean fields
-            if "is_bool" in rule and str(value).strip().lower() not in [
-                "true",
-                "false",
-            ]:
+            for message, level in failures:
                 store_log_message(
-                    logger,
-                    parent_entity,
-                    f"{log_message}Expected a boolean.",
-                    level="error",
+                    logger, parent_entity, f"{log_message}{message}", level=level
                 )
 
-            # Validate data types
-            if "is_data" in rule:
-                str_val = str(value)
-                is_valid_standard = str_val in [dt.value for dt in DataType]
-                is_valid_dynamic = False
-
-                if not is_valid_standard and (
-                    str_val.startswith("OBJECT") or str_val.startswith("SAMPLE")
-                ):
-                    els = str_val.split(":")
-
-                    if len(els) == 2 and els[1].strip():
-                        is_valid_dynamic = True
-
-                if not is_valid_standard and not is_valid_dynamic:
-                    store_log_message(
-                        logger,
-                        parent_entity,
-                        f"{log_message}The Data Type should be one of the following: {[dt.value for dt in DataType]} or follow the format 'SAMPLE:<CODE>' or 'OBJECT:<CODE>'",
-                        level="error",
-                    )
-
-            # Validate special cases (e.g., extra validation functions)
-            if "extra_validation" in rule:
-                validation_func = getattr(self, rule["extra_validation"], None)
-                if validation_func == "is_reduced_version" and not is_reduced_version(
-                    value, entity_name
-                ):
-                    store_log_message(
-                        logger,
-                        parent_entity,
-                        f"{log_message}The generated code should be a part of the code.",
-                        level="warning",
-                    )
-
     def _compare_with_current_model(self, mode) -> dict:
         """
         Compare new entities against the current model using validation rules.
@@ -341,6 +423,7 @@ class MasterdataValidator:
         new_entity = False
 
         all_props = self.extract_property_codes(self.current_model)
+        self._assignments_index = {}
 
         for entity_type, incoming_entities in self.new_entities.items():
             if entity_type not in self.current_model:
@@ -466,22 +549,17 @@ class MasterdataValidator:
         """
         Compares assigned properties (for ObjectType, CollectionType, etc.) or terms (for VocabularyType).
         """
+        assignments_key = "properties" if not is_terms else "terms"
+        index = self._get_assignments_index(entity_type, assignments_key)
+
         incoming_props = {
-            prop["code"]: prop
-            for prop in incoming_entity.get(
-                "properties" if not is_terms else "terms", []
-            )
+            prop["code"]: prop for prop in incoming_entity.get(assignments_key, [])
         }
 
         incoming_prop_codes = set(incoming_props.keys())
 
         if not new_entity:
-            current_props = {
-                prop["code"]: prop
-                for prop in current_entity.get(
-                    "properties" if not is_terms else "terms", []
-                )
-            }
+            current_props = index.assignments[entity_code]
 
             # Check for non-existing assigned properties
             current_prop_codes = set(current_props.keys())
@@ -536,26 +614,41 @@ class MasterdataValidator:
                         )
 
         # Check if assigned properties match another entity's properties
-        for other_entity_code, other_entity in self.current_model.get(
-            entity_type, {}
-        ).items():
+        if not incoming_prop_codes:
+            return
+        for other_entity_code in index.entities_by_codes.get(
+            frozenset(incoming_prop_codes), ()
+        ):
             if other_entity_code != entity_code:
-                other_entity_properties = (
-                    other_entity.get("properties", [])
-                    if not is_terms
-                    else other_entity.get("terms", [])
+                log_message = (
+                    "Entity will not be imported in openBIS. "
+                    f"The entity {entity_code} at row {incoming_entity['defs'].get('row_location')} has the same properties defined as {other_entity_code}. "
+                    "Maybe they are representing the same entity?"
                 )
-                other_entity_props = {prop["code"] for prop in other_entity_properties}
+                store_log_message(logger, incoming_entity, log_message, level="warning")
 
-                if (incoming_prop_codes == other_entity_props) and incoming_prop_codes:
-                    log_message = (
-                        "Entity will not be imported in openBIS. "
-                        f"The entity {entity_code} at row {incoming_entity['defs'].get('row_location')} has the same properties defined as {other_entity_code}. "
-                        "Maybe they are representing the same entity?"
-                    )
-                    store_log_message(
-                        logger, incoming_entity, log_message, level="warning"
-                    )
+    def _get_assignments_index(
+        self, entity_type: str, assignments_key: str
+    ) -> AssignmentsIndex:
+        """
+        Returns the index of the assigned properties or terms of the entities of `entity_type` in the
+        current model, building it on first use during the comparison.
+
+        Args:
+            entity_type (str): The entity type in the current model.
+            assignments_key (str): The key of the assignments in the entities ("properties" or "terms").
+
+        Returns:
+            AssignmentsIndex: The index of the assigned properties or terms.
+        """
+        key = (entity_type, assignments_key)
+        index = self._assignments_index.get(key)
+        if index is None:
+            index = AssignmentsIndex(
+                self.current_model.get(entity_type, {}), assignments_key
+            )
+            self._assignments_index[key] = index
+        return index
 
     def _extract_log_messages(self, model: dict, target_dict: dict) -> None:
         """
@@ -1,7 +1,6 @@
 import glob
 import os
 
-from bam_masterdata.excel.excel_to_entities import MasterdataExcelExtractor
 from bam_masterdata.logger import logger
 from bam_masterdata.metadata.entities_dict import EntitiesDict
 from bam_masterdata.utils import convert_enums, format_json_id
@@ -53,6 +52,8 @@ class SourceLoader:
         Returns:
             dict: A dictionary containing the transformed entities.
         """
+        # openpyxl is only needed for Excel sources
+        from bam_masterdata.excel.excel_to_entities import MasterdataExcelExtractor
 
         excel_entities = MasterdataExcelExtractor(
             excel_path=self.source_path, row_cell_info=self.row_cell_info
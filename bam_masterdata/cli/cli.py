@@ -8,26 +8,24 @@ from pathlib import Path
 
 import click
 from decouple import config as environ
-from openpyxl import Workbook
-from rdflib import Graph
-
-from bam_masterdata.checker import MasterdataChecker
-from bam_masterdata.cli.entities_to_excel import entities_to_excel
-from bam_masterdata.cli.entities_to_rdf import entities_to_rdf
-from bam_masterdata.cli.fill_masterdata import MasterdataCodeGenerator
-from bam_masterdata.cli.run_parser import run_parser
+
 from bam_masterdata.logger import logger
-from bam_masterdata.metadata.entities_dict import EntitiesDict
+from bam_masterdata.metadata.bundle import BUNDLE_FILE_NAME, build_bundle
+from bam_masterdata.metadata.entities_dict import EntitiesDict, clear_entities_cache
+from bam_masterdata.metadata.vocabulary_index import clear_vocabulary_indexes
 from bam_masterdata.openbis.login import ologin
+from bam_masterdata.openbis.snapshot import OpenbisSnapshot
 from bam_masterdata.utils import (
     DATAMODEL_DIR,
     delete_and_create_dir,
     duplicated_property_types,
     import_module,
+    invalidate_module_cache,
     listdir_py_modules,
 )
 
-URL = environ("OPENBIS_URL")
+# ! Heavy dependencies (pyBIS, openpyxl, rdflib, the checker, the parsers...) are imported inside the
+# ! commands using them, so that `bam_masterdata --help` and the offline commands start fast
 
 
 @click.group(help="Entry point to run `bam_masterdata` CLI commands.")
@@ -74,6 +72,8 @@ def cli():
     """,
 )
 def fill_masterdata(url, excel_file, export_dir, row_cell_info):
+    from bam_masterdata.cli.fill_masterdata import MasterdataCodeGenerator
+
     start_time = time.time()
 
     # Define output directory
@@ -119,6 +119,9 @@ def fill_masterdata(url, excel_file, export_dir, row_cell_info):
 
         if code != "":
             output_file.write_text(code + "\n", encoding="utf-8")
+            invalidate_module_cache(str(output_file))
+            if module_name == "vocabulary":
+                clear_vocabulary_indexes()
             module_elapsed_time = time.perf_counter() - module_start_time
             click.echo(
                 f"Generated {module_name} types in {module_elapsed_time:.2f} seconds in {output_file}\n"
@@ -180,7 +183,13 @@ def fill_masterdata(url, excel_file, export_dir, row_cell_info):
     default=False,
     help="Whether the export to JSON is done to a single JSON file. Default is False.",
 )
-def export_to_json(force_delete, python_path, export_dir, single_json):
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes used to load the Python modules of the datamodel. Default is 1.",
+)
+def export_to_json(force_delete, python_path, export_dir, single_json, workers):
     # Delete and create the export directory
     if force_delete:
         click.confirm(
@@ -194,7 +203,9 @@ def export_to_json(force_delete, python_path, export_dir, single_json):
     )
 
     # Instantiating the class to get the entities in a dictionary from Python
-    entities_dict = EntitiesDict(python_path=python_path, logger=logger)
+    entities_dict = EntitiesDict(
+        python_path=python_path, workers=workers, logger=logger
+    )
 
     full_data = entities_dict.single_json()
     if single_json:
@@ -215,6 +226,43 @@ def export_to_json(force_delete, python_path, export_dir, single_json):
     click.echo(f"All entity artifacts have been generated and saved to {export_dir}")
 
 
+@cli.command(
+    name="build_bundle",
+    help="Build the datamodel bundle file, which is loaded without executing the Python modules of the datamodel.",
+)
+@click.option(
+    "--python-path",
+    type=str,
+    required=False,
+    default=DATAMODEL_DIR,
+    help="""
+    (Optional) The path to the individual Python module or the directory containing the Python modules to process the datamodel.
+    Default is the `/datamodel/` directory.
+    """,
+)
+@click.option(
+    "--export-dir",
+    type=str,
+    required=False,
+    default="./artifacts",
+    help=f"The directory where the bundle file `{BUNDLE_FILE_NAME}` is exported. Default is `./artifacts`.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes used to load the Python modules of the datamodel. Default is 1.",
+)
+def build_bundle_command(python_path, export_dir, workers):
+    bundle_path = build_bundle(
+        python_path=python_path,
+        bundle_path=os.path.join(export_dir, BUNDLE_FILE_NAME),
+        workers=workers,
+        logger=logger,
+    )
+    click.echo(f"Datamodel bundle has been generated and saved to {bundle_path}")
+
+
 @cli.command(
     name="export_to_excel",
     help="Export entities to an Excel file in the path `./artifacts/masterdata.xlsx`.",
@@ -246,6 +294,10 @@ def export_to_json(force_delete, python_path, export_dir, single_json):
     help="The directory where the Excel file will be exported. Default is `./artifacts`.",
 )
 def export_to_excel(force_delete, python_path, export_dir):
+    from openpyxl import Workbook
+
+    from bam_masterdata.cli.entities_to_excel import entities_to_excel
+
     # Delete and create the export directory
     if force_delete:
         click.confirm(
@@ -326,6 +378,10 @@ def export_to_excel(force_delete, python_path, export_dir):
     help="The directory where the RDF/XML file will be exported. Default is `./artifacts`.",
 )
 def export_to_rdf(force_delete, python_path, export_dir):
+    from rdflib import Graph
+
+    from bam_masterdata.cli.entities_to_rdf import entities_to_rdf
+
     # Delete and create the export directory
     if force_delete:
         click.confirm(
@@ -361,7 +417,15 @@ def export_to_rdf(force_delete, python_path, export_dir):
     )
 
 
-def run_checker(file_path: str, mode: str = "all", datamodel_path: str = DATAMODEL_DIR):
+def run_checker(
+    file_path: str,
+    mode: str = "all",
+    datamodel_path: str = DATAMODEL_DIR,
+    *,
+    workers: int = 1,
+    use_cache: bool = False,
+    bundle_path: str | None = None,
+):
     """
 
     Run the masterdata checker on the specified file path and mode.
@@ -376,12 +440,23 @@ def run_checker(file_path: str, mode: str = "all", datamodel_path: str = DATAMOD
             "all" -> Run all validations and comparison. (Default).
             "individual" -> Run individual repositories validations.
         datamodel_path (str, optional): Path to the directory containing the Python modules defining the datamodel. Defaults to DATAMODEL_DIR.
+        workers (int, optional): Number of worker processes used to load the datamodel. Defaults to 1.
+        use_cache (bool, optional): Whether to use the on-disk cache of the datamodel. Defaults to False.
+        bundle_path (str, optional): Path to the datamodel bundle file used instead of the Python modules in
+            `datamodel_path` if it is up to date. Defaults to None.
     """
+    from bam_masterdata.checker import MasterdataChecker
+
     # Instantiate the checker class and run validation
     checker = MasterdataChecker()
 
     # Load current model from datamodel path
-    checker.load_current_model(datamodel_dir=datamodel_path)
+    checker.load_current_model(
+        datamodel_dir=datamodel_path,
+        workers=workers,
+        use_cache=use_cache,
+        bundle_path=bundle_path,
+    )
 
     # Load new entities from the specified file path (could be a Python file, directory, or Excel)
     checker.load_new_entities(source=file_path)
@@ -499,8 +574,47 @@ def run_checker(file_path: str, mode: str = "all", datamodel_path: str = DATAMOD
     default=DATAMODEL_DIR,
     help="""Path to the directory containing the Python modules defining the datamodel (defaults to './bam_masterdata/datamodel/').""",
 )
-def checker(file_path, mode, datamodel_path):
-    run_checker(file_path=file_path, mode=mode, datamodel_path=datamodel_path)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="""Number of worker processes used to load the Python modules of the datamodel (defaults to 1).""",
+)
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help="""Load the datamodel from the Python modules without using the on-disk cache of previous runs.""",
+)
+@click.option(
+    "--clear-cache",
+    "clear_cache",
+    is_flag=True,
+    default=False,
+    help="""Delete the on-disk cache of the datamodel before loading it.""",
+)
+@click.option(
+    "--bundle-path",
+    "bundle_path",  # alias
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="""Path to the datamodel bundle file created with `build_bundle`. It is used instead of the Python modules in `--datamodel-path` unless it is outdated.""",
+)
+def checker(
+    file_path, mode, datamodel_path, *, workers, no_cache, clear_cache, bundle_path
+):
+    if clear_cache:
+        n_deleted = clear_entities_cache()
+        click.echo(f"Deleted {n_deleted} cached datamodel files.")
+    run_checker(
+        file_path=file_path,
+        mode=mode,
+        datamodel_path=datamodel_path,
+        workers=workers,
+        use_cache=not no_cache,
+        bundle_path=bundle_path,
+    )
 
 
 @cli.command(
@@ -525,7 +639,28 @@ def checker(file_path, mode, datamodel_path):
     default=DATAMODEL_DIR,
     help="""Path to the directory containing the Python modules defining the datamodel (defaults to './bam_masterdata/datamodel/').""",
 )
-def push_to_openbis(file_path, datamodel_path):
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help="""Load the datamodel from the Python modules without using the on-disk cache of previous runs.""",
+)
+@click.option(
+    "--clear-cache",
+    "clear_cache",
+    is_flag=True,
+    default=False,
+    help="""Delete the on-disk cache of the datamodel before loading it.""",
+)
+def push_to_openbis(file_path, datamodel_path, no_cache, clear_cache):
+    from bam_masterdata.checker import MasterdataChecker
+    from bam_masterdata.cli.fill_masterdata import MasterdataCodeGenerator
+
+    if clear_cache:
+        n_deleted = clear_entities_cache()
+        click.echo(f"Deleted {n_deleted} cached datamodel files.")
+
     # Check if the path is a single .py file OR a directory containing .py files
     if file_path.endswith(".py") or (
         os.path.isdir(file_path) and any(glob.glob(os.path.join(file_path, "*.py")))
@@ -560,6 +695,7 @@ def push_to_openbis(file_path, datamodel_path):
 
             if code != "":
                 output_file.write_text(code + "\n", encoding="utf-8")
+                invalidate_module_cache(str(output_file))
                 click.echo(f"Generated {module_name} types in {output_file}\n")
             else:
                 click.echo(f"Skipping {module_name}_types.py (empty entity data)")
@@ -569,7 +705,7 @@ def push_to_openbis(file_path, datamodel_path):
     # Instantiate the checker class and run validation
     checker = MasterdataChecker()
     # Load current model from datamodel path
-    checker.load_current_model(datamodel_dir=datamodel_path)
+    checker.load_current_model(datamodel_dir=datamodel_path, use_cache=not no_cache)
     # Load new entities from the specified file path (could be a Python file, directory, or Excel)
     checker.load_new_entities(source=file_path)
     # Run the checker in the specified mode
@@ -588,6 +724,8 @@ def push_to_openbis(file_path, datamodel_path):
         url = environ("OPENBIS_URL")
         openbis = ologin(url=url)
         click.echo(f"Using the openBIS instance: {url}\n")
+        # The existing entities are listed once and shared by all the pushed entities
+        snapshot = OpenbisSnapshot(openbis)
 
         # Push each entity type
         for module_path in listdir_py_modules(tmp_dir):
@@ -595,7 +733,9 @@ def push_to_openbis(file_path, datamodel_path):
             for _, obj in inspect.getmembers(module, inspect.isclass):
                 if hasattr(obj, "defs") and callable(getattr(obj, "to_openbis")):
                     obj_instance = obj()
-                    obj_instance.to_openbis(openbis=openbis, logger=logger)
+                    obj_instance.to_openbis(
+                        openbis=openbis, logger=logger, snapshot=snapshot
+                    )
 
     else:
         logger.error(
@@ -657,7 +797,17 @@ def push_to_openbis(file_path, datamodel_path):
     default="COLLECTION",
     help="Type of collection to create in openBIS. Options are 'COLLECTION' or 'DEFAULT_EXPERIMENT'. Defaults to 'COLLECTION'.",
 )
-def parser(files_parser, project_name, collection_name, space_name, collection_type):
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes running the parsers. Default is 1.",
+)
+def parser(
+    files_parser, project_name, collection_name, space_name, collection_type, *, workers
+):
+    from bam_masterdata.cli.run_parser import run_parser
+
     parser_map = {}  # TODO load from configuration from yaml file
     parse_file_dict = {}
     for parser_key, filepath in files_parser:
@@ -677,6 +827,7 @@ def parser(files_parser, project_name, collection_name, space_name, collection_t
         collection_name=collection_name,
         files_parser=parse_file_dict,
         collection_type=collection_type.upper(),
+        parser_workers=workers,
     )
 
 
@@ -710,8 +861,11 @@ def parser(files_parser, project_name, collection_name, space_name, collection_t
     help="""Whether to run the `checker` before pushing to openBIS. Default is `True`.""",
 )
 def masterdata_sync(file_path, entity, check):
-    openbis = ologin(url=URL)
-    click.echo(f"Using the openBIS instance: {URL}\n")
+    url = environ("OPENBIS_URL")
+    openbis = ologin(url=url)
+    click.echo(f"Using the openBIS instance: {url}\n")
+    # The existing entities are listed once and shared by all the synchronized entities
+    snapshot = OpenbisSnapshot(openbis)
 
     if not check:
         logger.warning(
@@ -724,12 +878,16 @@ def masterdata_sync(file_path, entity, check):
             for _, obj in inspect.getmembers(module, inspect.isclass):
                 if hasattr(obj, "defs") and callable(getattr(obj, "to_openbis")):
                     obj_instance = obj()
-                    obj_instance.to_openbis(openbis=openbis, logger=logger)
+                    obj_instance.to_openbis(
+                        openbis=openbis, logger=logger, snapshot=snapshot
+                    )
         else:
             obj = getattr(module, entity, None)
             if obj and hasattr(obj, "defs") and callable(getattr(obj, "to_openbis")):
                 obj_instance = obj()
-                obj_instance.to_openbis(openbis=openbis, logger=logger)
+                obj_instance.to_openbis(
+                    openbis=openbis, logger=logger, snapshot=snapshot
+                )
             else:
                 logger.error(
                     f"Entity {entity} not found in the module {file_path} or it does not have the method `to_openbis`."
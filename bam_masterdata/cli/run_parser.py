@@ -1,21 +1,66 @@
-from pybis import Openbis
+import queue
+import threading
+import time
+import weakref
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from bam_masterdata.logger import logger
 from bam_masterdata.metadata.entities import (
     CollectionType,
     ObjectType,
     PropertyTypeAssignment,
+    generate_dict_id,
+    generate_object_id,
 )
-from bam_masterdata.parsing import AbstractParser
+from bam_masterdata.metadata.relationship_graph import RelationshipGraph
+from bam_masterdata.parsing import AbstractParser, StreamingParser
+
+if TYPE_CHECKING:
+    from pybis import Openbis
+
+# Maximum number of codes searched in openBIS in a single request by `_get_existing_objects`
+EXISTING_OBJECTS_CHUNK_SIZE = 500
+
+# Default maximum number of objects committed in a single openBIS transaction by `run_parser_with_transactions`
+TRANSACTION_CHUNK_SIZE = 500
+
+# Default number of threads registering datasets in openBIS concurrently
+DATASET_UPLOAD_WORKERS = 4
+
+# Default maximum number of parsed items waiting to be uploaded by `run_parser_pipelined`
+PIPELINE_QUEUE_SIZE = 1000
+
+
+def _parse_files(parser: AbstractParser, files: list[str]) -> CollectionType:
+    """
+    Run `parser` on `files`, storing the results in a new `CollectionType`. Used by the worker processes of
+    `_parser_init`.
+
+    Args:
+        parser (AbstractParser): The parser instance.
+        files (list[str]): The file paths to parse.
+
+    Returns:
+        CollectionType: The collection type filled by the parser.
+    """
+    collection = CollectionType()
+    parser.parse(files, collection, logger=logger)
+    return collection
 
 
 def _parser_init(
-    openbis: Openbis | None = None,
+    openbis: "Openbis | None" = None,
     space_name: str = "",
     project_name: str = "PROJECT",
     collection_name: str = "",
     files_parser: dict[AbstractParser, list[str]] = {},
     collection_type: str = "COLLECTION",
+    *,
+    parser_workers: int = 1,
+    split_files: bool = False,
+    run_parsers: bool = True,
 ) -> tuple[CollectionType, any, any, any] | None:
     """
     Initialize the parser by setting up spaces, projects, and collections in openBIS.
@@ -27,6 +72,14 @@ def _parser_init(
         collection_name (str): The collection in openBIS where the entities will be stored.
         files_parser (dict[AbstractParser, list[str]]): A dictionary mapping parser instances to lists of file paths.
         collection_type (str): The type of collection to create. Options are "COLLECTION" or "DEFAULT_EXPERIMENT".
+        parser_workers (int): The number of worker processes running the parsers. If larger than 1, each parser
+            fills its own `CollectionType` in a worker process, and the results are merged in the order of
+            `files_parser`. The parsers and the object types they create must then be picklable.
+        split_files (bool): If True and `parser_workers` is larger than 1, each file is parsed on its own, so
+            that the files of a single parser are also parsed in parallel. Only valid for parsers that do not
+            relate the objects of different files.
+        run_parsers (bool): If False, only the space, project, and collection are set up in openBIS, and the
+            returned `CollectionType` is empty.
 
     Returns:
         tuple: A tuple containing (collection, space, project, collection_openbis) if successful, None otherwise.
@@ -108,9 +161,27 @@ def _parser_init(
 
     # Create a bam_masterdata CollectionType instance for storing parsed results
     collection = CollectionType()
-    # Iterate over each parser and its associated files and store them in `collection`
+    if not run_parsers:
+        return collection, space, project, collection_openbis
+    tasks = []
     for parser, files in files_parser.items():
-        parser.parse(files, collection, logger=logger)
+        if parser_workers > 1 and split_files and files:
+            tasks.extend((parser, [file]) for file in files)
+        else:
+            # parsers without files still run once, as in the serial path
+            tasks.append((parser, files))
+    # a single task is parsed in this process, and an empty pool cannot be created
+    if parser_workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(parser_workers, len(tasks))
+        ) as executor:
+            # `map` returns the results in the order of `tasks`, so merging them is deterministic
+            for parsed_collection in executor.map(_parse_files, *zip(*tasks)):
+                collection.merge(parsed_collection)
+    else:
+        # Iterate over each parser and its associated files and store them in `collection`
+        for parser, files in tasks:
+            parser.parse(files, collection, logger=logger)
 
     return collection, space, project, collection_openbis
 
@@ -118,12 +189,14 @@ def _parser_init(
 def _load_object_props(
     object_id: any,
     object_instance: ObjectType,
-    openbis: Openbis,
+    openbis: "Openbis",
     collection: CollectionType,
     openbis_id_map: dict,
     collection_name: str,
     space_name: str,
     project_name: str,
+    *,
+    committed_identifiers: dict[int, tuple[weakref.ref, str]] | None = None,
 ) -> dict:
     """
     Load and map object properties, resolving OBJECT type references to openBIS identifiers.
@@ -137,6 +210,9 @@ def _load_object_props(
         collection_name (str): The name of the collection in openBIS.
         space_name (str): The name of the space in openBIS.
         project_name (str): The name of the project in openBIS.
+        committed_identifiers (dict[int, tuple[weakref.ref, str]] | None): The openBIS identifiers of the
+            objects committed before and no longer attached to `collection`, keyed by the `id()` of the
+            object instances, together with a weak reference to check the identity.
 
     Returns:
         dict: A dictionary of object properties with resolved references.
@@ -172,11 +248,14 @@ def _load_object_props(
                     continue
                 # Construct the identifier path
                 # Try to find this object in the openbis_id_map first (if it's being created in the same batch)
-                referenced_identifier = None
-                for obj_id, obj_inst in collection.attached_objects.items():
-                    if obj_inst is value and obj_id in openbis_id_map:
-                        referenced_identifier = openbis_id_map[obj_id]
-                        break
+                referenced_identifier = openbis_id_map.get(collection.id_of(value))
+                if not referenced_identifier and committed_identifiers:
+                    # Or in the objects committed in an earlier batch
+                    weak_value, identifier = committed_identifiers.get(
+                        id(value), (None, None)
+                    )
+                    if weak_value is not None and weak_value() is value:
+                        referenced_identifier = identifier
                 if not referenced_identifier:
                     # Construct identifier from the object's code
                     # Assume it's in the same space/project as the current object
@@ -249,13 +328,435 @@ def _get_entity(
     return openbis.get_object(identifier)
 
 
+def _get_existing_objects(
+    openbis: "Openbis",
+    codes: list[str],
+    *,
+    space,
+    project,
+    collection_openbis=None,
+    chunk_size: int = EXISTING_OBJECTS_CHUNK_SIZE,
+) -> dict:
+    """
+    Search in bulk which of the object `codes` already exist in openBIS under the space, project, and
+    (optionally) collection. The codes are searched in chunks of `chunk_size` to respect the request-size
+    limits of the openBIS server, instead of fetching each object with its own request.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+        codes (list[str]): The codes of the objects to search for.
+        space: The pyBIS space where the objects are stored.
+        project: The pyBIS project where the objects are stored.
+        collection_openbis: The pyBIS collection where the objects are stored, or None if they are attached
+            directly to the project.
+        chunk_size (int): The maximum number of codes searched in a single request.
+
+    Returns:
+        dict: A dictionary mapping the (uppercase) codes of the existing objects to their pyBIS objects.
+    """
+    codes = list(dict.fromkeys(code.upper() for code in codes if code))
+    existing_objects = {}
+    for start in range(0, len(codes), chunk_size):
+        chunk = codes[start : start + chunk_size]
+        try:
+            found_objects = openbis.get_objects(
+                space=space,
+                project=project,
+                collection=collection_openbis,
+                code=chunk,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to search {len(chunk)} objects in openBIS, they will be created: {e}"
+            )
+            continue
+        for found_object in found_objects:
+            existing_objects[found_object.code] = found_object
+    return existing_objects
+
+
+def _commit_objects(
+    openbis: "Openbis",
+    objects: list[tuple[str, any]],
+    max_retries: int = 0,
+    retry_delay: float = 1.0,
+) -> list[str]:
+    """
+    Commit the pyBIS `objects` in a single openBIS transaction. A failed commit is retried up to
+    `max_retries` times, waiting `retry_delay` seconds doubled on every attempt. If it still fails, the
+    objects are split in halves and committed separately (without retries), so that only the objects
+    causing the failure are not saved.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+        objects (list[tuple[str, any]]): The openBIS identifiers and the pyBIS objects to commit.
+        max_retries (int): The number of times a failed commit is retried before splitting the objects.
+        retry_delay (float): The delay in seconds before the first retry.
+
+    Returns:
+        list[str]: The identifiers of the objects that could not be committed.
+    """
+    error = None
+    for attempt in range(max_retries + 1):
+        transaction = openbis.new_transaction()
+        for _, obj in objects:
+            transaction.add(obj)
+        try:
+            transaction.commit()
+            return []
+        except Exception as e:
+            error = e
+            if attempt < max_retries:
+                delay = retry_delay * 2**attempt
+                logger.warning(
+                    f"Failed to commit transaction of {len(objects)} objects "
+                    f"(attempt {attempt + 1} of {max_retries + 1}), retrying in {delay:.1f} s: {e}"
+                )
+                time.sleep(delay)
+
+    if len(objects) == 1:
+        logger.error(f"Failed to commit object {objects[0][0]}: {error}")
+        return [objects[0][0]]
+
+    logger.warning(
+        f"Failed to commit transaction of {len(objects)} objects, splitting it to isolate the failing ones: {error}"
+    )
+    middle = len(objects) // 2
+    return _commit_objects(openbis, objects[:middle]) + _commit_objects(
+        openbis, objects[middle:]
+    )
+
+
+def _upload_datasets(
+    openbis: "Openbis",
+    datasets: list[dict],
+    workers: int = DATASET_UPLOAD_WORKERS,
+) -> list[tuple[float, Exception | None]]:
+    """
+    Register and upload `datasets` in openBIS using a pool of `workers` threads, as the uploads are dominated
+    by network and disk I/O. The datasets do not depend on each other, so they are uploaded in any order.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+        datasets (list[dict]): The keyword arguments passed to `openbis.new_dataset` for each dataset.
+        workers (int): The maximum number of datasets uploaded at the same time. If 1, they are uploaded
+            sequentially.
+
+    Returns:
+        list[tuple[float, Exception | None]]: The upload time in seconds and the error raised, if any, of each
+        dataset, in the same order as `datasets`.
+    """
+
+    def upload(dataset_kwargs: dict) -> tuple[float, Exception | None]:
+        start_time = time.perf_counter()
+        try:
+            openbis.new_dataset(**dataset_kwargs).save()
+        except Exception as e:
+            return time.perf_counter() - start_time, e
+        return time.perf_counter() - start_time, None
+
+    if workers <= 1 or len(datasets) <= 1:
+        return [upload(dataset_kwargs) for dataset_kwargs in datasets]
+    with ThreadPoolExecutor(max_workers=min(workers, len(datasets))) as executor:
+        return list(executor.map(upload, datasets))
+
+
+def _get_objects_by_identifier(
+    openbis: "Openbis",
+    identifiers: list[str],
+    chunk_size: int = EXISTING_OBJECTS_CHUNK_SIZE,
+) -> dict:
+    """
+    Fetch the objects with the given openBIS `identifiers` in bulk, in requests of at most `chunk_size`
+    identifiers, instead of fetching each object with its own request.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+        identifiers (list[str]): The openBIS identifiers of the objects to fetch.
+        chunk_size (int): The maximum number of objects fetched in a single request.
+
+    Returns:
+        dict: A dictionary mapping the identifiers to their pyBIS objects. Objects not found are missing.
+    """
+    identifiers = list(dict.fromkeys(identifiers))
+    objects = {}
+    for start in range(0, len(identifiers), chunk_size):
+        chunk = identifiers[start : start + chunk_size]
+        try:
+            found_objects = openbis.get_object(chunk)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {len(chunk)} objects from openBIS: {e}")
+            continue
+        # openBIS may return the identifiers in a different form, so the objects are matched by code
+        found_by_code = {obj.code: obj for obj in found_objects}
+        for identifier in chunk:
+            obj = found_by_code.get(identifier.rsplit("/", 1)[-1].upper())
+            if obj is not None:
+                objects[identifier] = obj
+    return objects
+
+
+def _link_parents(
+    openbis: "Openbis",
+    relationships: Iterable[tuple[str | dict, str | dict]],
+    openbis_id_map: dict[str, str],
+    chunk_size: int = TRANSACTION_CHUNK_SIZE,
+) -> list[str]:
+    """
+    Link the objects in openBIS following the parent-child `relationships`, e.g., the values of
+    `CollectionType.relationships`. The relationships are grouped by child, the children are fetched in bulk,
+    all the parents of a child are added at once, and the children are saved in transactions of at most
+    `chunk_size` objects.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+        relationships (Iterable[tuple[str | dict, str | dict]]): The (parent, child) pairs of local object IDs
+            or dictionaries readable by `openbis.get_object`.
+        openbis_id_map (dict[str, str]): A mapping from local object IDs to openBIS identifiers.
+        chunk_size (int): The maximum number of children saved in a single transaction.
+
+    Returns:
+        list[str]: The identifiers of the children that could not be saved.
+    """
+    # Relationships grouped by child, skipping those with endpoints not found attached or in openBIS
+    graph = RelationshipGraph()
+    children = {}
+    for parent, child in relationships:
+        if any(
+            not isinstance(obj, dict) and obj not in openbis_id_map
+            for obj in (parent, child)
+        ):
+            logger.warning(
+                f"Skipping relationship with parent {parent} and child {child} "
+                "because one of them is not found attached or in OpenBIS."
+            )
+            continue
+        parent_key = generate_dict_id(parent) if isinstance(parent, dict) else parent
+        child_key = generate_dict_id(child) if isinstance(child, dict) else child
+        graph.add_edge(parent_key, child_key, parent_value=parent, child_value=child)
+        children.setdefault(child_key, child)
+
+    # Dictionary endpoints are fetched once each, attached objects are fetched in bulk or linked by identifier
+    fetched_dicts = {}
+
+    def resolve_dict(obj: dict, object_role: str):
+        key = generate_dict_id(obj)
+        if key not in fetched_dicts:
+            try:
+                fetched_dicts[key] = _get_entity(
+                    openbis, openbis_id_map, obj, object_role
+                )
+            except Exception:
+                fetched_dicts[key] = None
+        return fetched_dicts[key]
+
+    fetched_children = _get_objects_by_identifier(
+        openbis,
+        [
+            openbis_id_map[child]
+            for child in children.values()
+            if isinstance(child, str)
+        ],
+    )
+
+    linked_children = []
+    for child_key, child in children.items():
+        if isinstance(child, dict):
+            child_obj = resolve_dict(child, "child")
+        else:
+            child_obj = fetched_children.get(openbis_id_map[child])
+        if child_obj is None:
+            logger.warning(
+                f"Child object {child} not found in openBIS, skipping its parents."
+            )
+            continue
+
+        parents = []
+        for parent in graph.parents(child_key):
+            if isinstance(parent, dict):
+                parent = resolve_dict(parent, "parent")
+            else:
+                parent = openbis_id_map[parent]
+            if parent is not None:
+                parents.append(parent)
+        if not parents:
+            continue
+
+        child_obj.add_parents(parents)
+        linked_children.append((child_obj.identifier, child_obj))
+        logger.info(
+            f"Prepared relationships: {child_obj.identifier} -> parents "
+            f"{[getattr(parent, 'identifier', parent) for parent in parents]}"
+        )
+
+    failed_identifiers = []
+    for start in range(0, len(linked_children), chunk_size):
+        failed_identifiers += _commit_objects(
+            openbis, linked_children[start : start + chunk_size]
+        )
+    return failed_identifiers
+
+
+def _prepare_objects(
+    openbis: "Openbis",
+    objects: dict[str, ObjectType],
+    *,
+    collection: CollectionType,
+    openbis_id_map: dict[str, str],
+    code_counter: dict,
+    space,
+    project,
+    collection_openbis,
+    space_name: str,
+    project_name: str,
+    collection_name: str,
+    committed_identifiers: dict[int, tuple[weakref.ref, str]] | None = None,
+) -> list[tuple[str, any]]:
+    """
+    Prepare the pyBIS objects to create or update in openBIS for the attached `objects`. Duplicated codes are
+    renamed with `make_unique_code`, and the existing objects are searched in bulk with `_get_existing_objects`.
+    The openBIS identifier of each object is stored in `openbis_id_map`.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+        objects (dict[str, ObjectType]): The objects to prepare, keyed by their local object IDs.
+        collection (CollectionType): The CollectionType instance used to resolve OBJECT references.
+        openbis_id_map (dict[str, str]): A mapping from local object IDs to openBIS identifiers, updated in place.
+        code_counter (dict): The codes seen so far and their occurrence counts, updated in place.
+        space: The pyBIS space where the objects are stored.
+        project: The pyBIS project where the objects are stored.
+        collection_openbis: The pyBIS collection where the objects are stored.
+        space_name (str): The name of the space in openBIS.
+        project_name (str): The name of the project in openBIS.
+        collection_name (str): The name of the collection in openBIS.
+        committed_identifiers (dict[int, tuple[weakref.ref, str]] | None): The openBIS identifiers of the
+            objects committed in earlier batches, used to resolve the OBJECT references to them. See
+            `_load_object_props`.
+
+    Returns:
+        list[tuple[str, any]]: The openBIS identifiers and the pyBIS objects to commit, in the order of `objects`.
+    """
+    prepared_objects = []
+
+    # Codes of the objects, renamed if duplicated, to search the existing ones in bulk
+    unique_codes = {}
+    for object_id, object_instance in objects.items():
+        original_code = object_instance.code
+        unique_code = make_unique_code(original_code, code_counter)
+
+        if unique_code != original_code:
+            logger.warning(
+                f"Duplicate local code {original_code} → renamed to {unique_code}"
+            )
+        unique_codes[object_id] = unique_code
+
+    existing_objects = _get_existing_objects(
+        openbis,
+        codes=[code for code in unique_codes.values() if isinstance(code, str)],
+        space=space,
+        project=project,
+        collection_openbis=collection_openbis if collection_name else None,
+    )
+
+    for object_id, object_instance in objects.items():
+        obj_props = _load_object_props(
+            object_id,
+            object_instance,
+            openbis,
+            collection,
+            openbis_id_map,
+            collection_name,
+            space_name,
+            project_name,
+            committed_identifiers=committed_identifiers,
+        )
+
+        unique_code = unique_codes[object_id]
+        identifier = (
+            f"/{space_name}/{project_name}/{unique_code}"
+            if not collection_name
+            else f"/{space_name}/{project_name}/{collection_name}/{unique_code}"
+        )
+
+        object = (
+            existing_objects.get(unique_code.upper())
+            if isinstance(unique_code, str)
+            else None
+        )
+        # if object exists branch in updating
+
+        if object:
+            obj = object
+            obj.set_props(obj_props)
+            logger.info(f"{identifier} will be UPDATED in transaction")
+
+        else:
+            obj = openbis.new_object(
+                type=object_instance.defs.code,
+                code=unique_code,
+                space=space,
+                project=project,
+                collection=collection_openbis if collection_name else None,
+                props=obj_props,
+            )
+            logger.info(f"{identifier} will be CREATED in transaction")
+
+        prepared_objects.append((identifier, obj))
+        openbis_id_map[object_id] = identifier
+
+    return prepared_objects
+
+
+def _commit_chunks(
+    openbis: "Openbis",
+    prepared_objects: list[tuple[str, any]],
+    chunk_size: int = TRANSACTION_CHUNK_SIZE,
+    max_retries: int = 0,
+    retry_delay: float = 1.0,
+) -> set[str]:
+    """
+    Commit the prepared pyBIS objects in order, in transactions of at most `chunk_size` objects committed with
+    `_commit_objects`, and log the throughput of each transaction.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+        prepared_objects (list[tuple[str, any]]): The openBIS identifiers and the pyBIS objects to commit.
+        chunk_size (int): The maximum number of objects committed in a single transaction.
+        max_retries (int): The number of times the commit of a failed chunk is retried before splitting it.
+        retry_delay (float): The delay in seconds before the first retry of a failed chunk.
+
+    Returns:
+        set[str]: The identifiers of the objects that could not be committed.
+    """
+    failed_identifiers = set()
+    num_chunks = -(-len(prepared_objects) // chunk_size)
+    for chunk_index, start in enumerate(range(0, len(prepared_objects), chunk_size)):
+        chunk = prepared_objects[start : start + chunk_size]
+        start_time = time.perf_counter()
+        failed_chunk = _commit_objects(
+            openbis, chunk, max_retries=max_retries, retry_delay=retry_delay
+        )
+        elapsed = time.perf_counter() - start_time
+        failed_identifiers.update(failed_chunk)
+        committed = len(chunk) - len(failed_chunk)
+        logger.info(
+            f"Transaction {chunk_index + 1} of {num_chunks} committed: {committed} of {len(chunk)} objects "
+            f"in {elapsed:.2f} s ({committed / max(elapsed, 1e-9):.1f} objects/s)"
+        )
+    return failed_identifiers
+
+
 def run_parser(
-    openbis: Openbis | None = None,
+    openbis: "Openbis | None" = None,
     space_name: str = "",
     project_name: str = "PROJECT",
     collection_name: str = "",
     files_parser: dict[AbstractParser, list[str]] = {},
     collection_type: str = "COLLECTION",
+    *,
+    dataset_workers: int = DATASET_UPLOAD_WORKERS,
+    parser_workers: int = 1,
+    split_files: bool = False,
 ) -> None:
     """
     Run the parsers on the specified files and save objects immediately without using transactions.
@@ -276,6 +777,9 @@ def run_parser(
         collection_name (str): The collection in openBIS where the entities will be stored.
         files_parser (dict): A dictionary where keys are parser instances and values are lists of file paths to be parsed. E.g., {MasterdataParserExample(): ["path/to/file.json", "path/to/another_file.json"]}
         collection_type (str): The type of collection to create in openBIS. Options are "COLLECTION" or "DEFAULT_EXPERIMENT". Defaults to "COLLECTION".
+        dataset_workers (int): The maximum number of datasets uploaded concurrently. Defaults to `DATASET_UPLOAD_WORKERS`.
+        parser_workers (int): The number of worker processes running the parsers. Defaults to 1.
+        split_files (bool): If True, the files of each parser are parsed on their own when `parser_workers` is larger than 1. Defaults to False.
     """
     collection, space, project, collection_openbis = _parser_init(
         openbis=openbis,
@@ -284,6 +788,8 @@ def run_parser(
         project_name=project_name,
         files_parser=files_parser,
         collection_type=collection_type,
+        parser_workers=parser_workers,
+        split_files=split_files,
     )
 
     # Map the objects added to CollectionType to objects in openBIS using pyBIS
@@ -357,56 +863,64 @@ def run_parser(
         openbis_id_map[object_id] = object_openbis.identifier
 
     # Storing files as datasets in openBIS
-    for files in files_parser.values():
-        try:
-            if not collection_name:
-                # ! This won't work on a project -> datasets only attached to collections in pyBIS
-                dataset = openbis.new_dataset(
-                    type="RAW_DATA",
-                    files=files,
-                    project=project,
-                )
-            else:
-                dataset = openbis.new_dataset(
-                    type="RAW_DATA",
-                    files=files,
-                    collection=collection_openbis,
-                )
-            dataset.save()
-        except Exception as e:
-            logger.warning(f"Error uploading files {files} to openBIS: {e}")
+    # ! This won't work on a project -> datasets only attached to collections in pyBIS
+    dataset_owner = (
+        {"collection": collection_openbis} if collection_name else {"project": project}
+    )
+    upload_results = _upload_datasets(
+        openbis,
+        [
+            {"type": "RAW_DATA", "files": files, **dataset_owner}
+            for files in files_parser.values()
+        ],
+        workers=dataset_workers,
+    )
+    for files, (elapsed, error) in zip(files_parser.values(), upload_results):
+        if error is not None:
+            logger.warning(f"Error uploading files {files} to openBIS: {error}")
             continue
-        logger.info(f"Files uploaded to openBIS collection {collection_name}.")
+        logger.info(
+            f"Files uploaded to openBIS collection {collection_name} in {elapsed:.2f} s."
+        )
 
     # Map parent-child relationships
-    for parent_id, child_id in collection.relationships.values():
-        if parent_id in openbis_id_map and child_id in openbis_id_map:
-            parent_openbis_id = openbis_id_map[parent_id]
-            child_openbis_id = openbis_id_map[child_id]
-
-            child_openbis = openbis.get_object(child_openbis_id)
-            child_openbis.add_parents(parent_openbis_id)
-            child_openbis.save()
-
-            logger.info(
-                f"Linked child {child_openbis_id} to parent {parent_openbis_id} in collection {collection_name}."
-            )
+    failed_children = _link_parents(
+        openbis, collection.relationships.values(), openbis_id_map
+    )
+    if failed_children:
+        logger.error(
+            f"Failed to link the parents of {len(failed_children)} objects in collection {collection_name}: "
+            f"{failed_children}"
+        )
+    else:
+        logger.info(
+            f"Linked parent-child relationships in collection {collection_name}."
+        )
 
 
 def run_parser_with_transactions(
-    openbis: Openbis | None = None,
+    openbis: "Openbis | None" = None,
     space_name: str = "",
     project_name: str = "PROJECT",
     collection_name: str = "",
     files_parser: dict[AbstractParser, list[str]] = {},
     collection_type: str = "COLLECTION",
+    *,
+    chunk_size: int = TRANSACTION_CHUNK_SIZE,
+    max_retries: int = 2,
+    retry_delay: float = 1.0,
+    dataset_workers: int = DATASET_UPLOAD_WORKERS,
+    parser_workers: int = 1,
+    split_files: bool = False,
 ) -> None:
     """
     Run the parsers on the specified files and save objects using openBIS transactions.
 
     This function parses files and creates/updates objects in openBIS using transactions for atomicity.
-    Operations are batched and committed together, ensuring consistency. If any operation fails,
-    all changes within that transaction are rolled back.
+    Operations are batched in chunks of `chunk_size` objects, and the chunks are committed in order. If a
+    chunk fails, all changes within its transaction are rolled back and the commit is retried with an
+    increasing delay. If it keeps failing, the chunk is split in halves until the failing objects are
+    isolated, so that the rest of the objects are saved.
 
     Args:
         openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
@@ -415,7 +929,17 @@ def run_parser_with_transactions(
         collection_name (str): The collection in openBIS where the entities will be stored.
         files_parser (dict): A dictionary where keys are parser instances and values are lists of file paths to be parsed. E.g., {MasterdataParserExample(): ["path/to/file.json", "path/to/another_file.json"]}
         collection_type (str): The type of collection to create in openBIS. Options are "COLLECTION" or "DEFAULT_EXPERIMENT". Defaults to "COLLECTION".
+        chunk_size (int): The maximum number of objects committed in a single transaction. Defaults to `TRANSACTION_CHUNK_SIZE`.
+        max_retries (int): The number of times the commit of a failed chunk is retried before splitting it. Defaults to 2.
+        retry_delay (float): The delay in seconds before the first retry of a failed chunk, doubled on every retry. Defaults to 1.0.
+        dataset_workers (int): The maximum number of datasets uploaded concurrently. Defaults to `DATASET_UPLOAD_WORKERS`.
+        parser_workers (int): The number of worker processes running the parsers. Defaults to 1.
+        split_files (bool): If True, the files of each parser are parsed on their own when `parser_workers` is larger than 1. Defaults to False.
     """
+    if chunk_size < 1:
+        logger.error(f"Invalid chunk_size {chunk_size}. It must be a positive integer.")
+        return None
+
     collection, space, project, collection_openbis = _parser_init(
         openbis=openbis,
         space_name=space_name,
@@ -423,153 +947,360 @@ def run_parser_with_transactions(
         project_name=project_name,
         files_parser=files_parser,
         collection_type=collection_type,
+        parser_workers=parser_workers,
+        split_files=split_files,
     )
 
-    obj_transaction = openbis.new_transaction()
-
     openbis_id_map = {}
-    code_counter = {}
+    prepared_objects = _prepare_objects(
+        openbis,
+        collection.attached_objects,
+        collection=collection,
+        openbis_id_map=openbis_id_map,
+        code_counter={},
+        space=space,
+        project=project,
+        collection_openbis=collection_openbis,
+        space_name=space_name,
+        project_name=project_name,
+        collection_name=collection_name,
+    )
+    failed_identifiers = _commit_chunks(
+        openbis,
+        prepared_objects,
+        chunk_size=chunk_size,
+        max_retries=max_retries,
+        retry_delay=retry_delay,
+    )
 
-    for object_id, object_instance in collection.attached_objects.items():
-        obj_props = _load_object_props(
-            object_id,
-            object_instance,
-            openbis,
-            collection,
-            openbis_id_map,
-            collection_name,
-            space_name,
-            project_name,
+    if failed_identifiers:
+        logger.error(
+            f"Failed to commit {len(failed_identifiers)} of {len(prepared_objects)} objects: "
+            f"{sorted(failed_identifiers)}"
         )
+        if len(failed_identifiers) == len(prepared_objects):
+            return None
+        # the relationships of the objects not saved are skipped
+        for object_id in [
+            object_id
+            for object_id, identifier in openbis_id_map.items()
+            if identifier in failed_identifiers
+        ]:
+            del openbis_id_map[object_id]
+    else:
+        logger.info("Transaction committed successfully")
 
-        original_code = object_instance.code
-        unique_code = make_unique_code(original_code, code_counter)
-
-        if unique_code != original_code:
-            logger.warning(
-                f"Duplicate local code {original_code} → renamed to {unique_code}"
+    # TODO (May 2026) if later transactions support datasets change it to transaction.
+    # Datasets of each saved object and of the parsed files, uploaded concurrently after the objects exist
+    object_datasets = [
+        (object_instance.datasets, openbis_id_map[object_id])
+        for object_id, object_instance in collection.attached_objects.items()
+        if object_instance.datasets and object_id in openbis_id_map
+    ]
+    dataset_owner = (
+        {"collection": collection_openbis} if collection_name else {"project": project}
+    )
+    upload_results = _upload_datasets(
+        openbis,
+        [
+            {"type": "RAW_DATA", "sample": identifier, "files": files}
+            for files, identifier in object_datasets
+        ]
+        + [
+            {"type": "RAW_DATA", "files": files, **dataset_owner}
+            for files in files_parser.values()
+        ],
+        workers=dataset_workers,
+    )
+    for (files, _), (elapsed, error) in zip(object_datasets, upload_results):
+        if error is not None:
+            logger.warning(f"Error saving dataset for files {files}: {error}")
+        else:
+            logger.info(
+                f"Dataset for files {files} saved successfully in {elapsed:.2f} s"
+            )
+    for files, (elapsed, error) in zip(
+        files_parser.values(), upload_results[len(object_datasets) :]
+    ):
+        if error is not None:
+            logger.warning(f"Error preparing dataset {files}: {error}")
+        else:
+            logger.info(
+                f"Dataset for files {files} saved successfully in {elapsed:.2f} s"
             )
 
-        identifier = (
-            f"/{space_name}/{project_name}/{unique_code}"
-            if not collection_name
-            else f"/{space_name}/{project_name}/{collection_name}/{unique_code}"
+    # ---- RELATIONSHIPS IN TRANSACTION ----
+    failed_children = _link_parents(
+        openbis, collection.relationships.values(), openbis_id_map
+    )
+    if failed_children:
+        logger.error(
+            f"Failed to commit relationships of {len(failed_children)} objects: {failed_children}"
         )
+    else:
+        logger.info("Datasets and relationships committed successfully")
 
-        try:
-            object = openbis.get_object(identifier)
-        except Exception:
-            object = None
-        # if object exists branch in updating
 
-        if object:
-            obj = object
-            obj.set_props(obj_props)
-            obj_transaction.add(obj)
-            logger.info(f"{identifier} will be UPDATED in transaction")
+def _stream_parsed_items(
+    files_parser: dict[AbstractParser, list[str]],
+) -> Iterator[tuple]:
+    """
+    Run the parsers on their files and yield the parsed objects and relationships as they are produced. The
+    items of a `StreamingParser` are yielded as soon as `parse_stream()` yields them, while other parsers
+    fill a `CollectionType` first whose objects and relationships are then yielded.
 
-        else:
-            obj = openbis.new_object(
-                type=object_instance.defs.code,
-                code=unique_code,
-                space=space,
-                project=project,
-                collection=collection_openbis if collection_name else None,
-                props=obj_props,
-            )
-            obj_transaction.add(obj)
-            logger.info(f"{identifier} will be CREATED in transaction")
+    Args:
+        files_parser (dict[AbstractParser, list[str]]): A dictionary mapping parser instances to lists of file paths.
 
-        openbis_id_map[object_id] = identifier
+    Yields:
+        tuple: Either `("object", object_id, object_type)` for each parsed object, with a new local object ID,
+        or `("relationship", parent, child)` for each relationship, with the endpoints as local object IDs or
+        dictionaries readable by `openbis.get_object`.
+    """
+    for parser, files in files_parser.items():
+        if not isinstance(parser, StreamingParser):
+            collection = CollectionType()
+            parser.parse(files, collection, logger=logger)
+            for object_id, object_instance in collection.attached_objects.items():
+                yield "object", object_id, object_instance
+            for parent, child in collection.relationships.values():
+                yield "relationship", parent, child
+            continue
 
-    try:
-        obj_transaction.commit()
-        logger.info("Transaction committed successfully")
-    except Exception as e:
-        logger.error(f"Failed to commit object transaction: {e}")
-        return None
+        # Local object IDs of the yielded objects by identity, without keeping them alive once uploaded
+        object_ids: dict[int, tuple[weakref.ref, str]] = {}
 
-    # TODO (May 2026) if later transactions support datasets change it to transaction.
-    for object_instance in collection.attached_objects.values():
-        try:
-            if object_instance.datasets != []:
-                attached_datasets = openbis.new_dataset(
-                    type="RAW_DATA",
-                    sample=identifier,
-                    files=object_instance.datasets,
+        def resolve(obj: ObjectType | dict) -> str | dict:
+            if isinstance(obj, dict):
+                return obj
+            weak_obj, object_id = object_ids.get(id(obj), (None, None))
+            if weak_obj is None or weak_obj() is not obj:
+                raise ValueError(
+                    f"The relationship endpoint {obj} must be yielded by the parser before the relationship."
                 )
+            return object_id
 
-                attached_datasets.save()
-                logger.info(
-                    f"Dataset for files {attached_datasets.files} saved successfully"
-                )
-        except Exception as e:
-            logger.warning(
-                f"Error saving dataset for files {attached_datasets.files}: {e}"
-            )
+        for item in parser.parse_stream(files, logger=logger):
+            if isinstance(item, tuple):
+                parent, child = item
+                yield "relationship", resolve(parent), resolve(child)
+                continue
+            CollectionType.check_object_type(item)
+            object_id = generate_object_id(item)
+            object_ids[id(item)] = (weakref.ref(item), object_id)
+            yield "object", object_id, item
 
-    rel_transaction = openbis.new_transaction()
 
-    # ---- DATASETS IN TRANSACTION ----
-    for files in files_parser.values():
-        try:
-            if collection_name:
-                dataset = openbis.new_dataset(
-                    type="RAW_DATA",
-                    files=files,
-                    collection=collection_openbis,
-                )
-            else:
-                dataset = openbis.new_dataset(
-                    type="RAW_DATA",
-                    files=files,
-                    project=project,
-                )
+def run_parser_pipelined(
+    openbis: "Openbis | None" = None,
+    space_name: str = "",
+    project_name: str = "PROJECT",
+    collection_name: str = "",
+    files_parser: dict[AbstractParser, list[str]] = {},
+    *,
+    collection_type: str = "COLLECTION",
+    chunk_size: int = TRANSACTION_CHUNK_SIZE,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+    max_retries: int = 2,
+    retry_delay: float = 1.0,
+    dataset_workers: int = DATASET_UPLOAD_WORKERS,
+) -> None:
+    """
+    Run the parsers on the specified files and save the objects in openBIS while the files are still being
+    parsed.
+
+    The parsers run in a background thread and put the parsed objects and relationships in a queue of at most
+    `queue_size` items, waiting when it is full until the uploader catches up (backpressure). The uploader
+    commits the objects in transactions of `chunk_size` objects as in `run_parser_with_transactions`, so parse
+    and upload times overlap, and the memory used is bounded by the queue size instead of the size of the
+    parsed data when the parsers are `StreamingParser`. The relationships are linked at the end, once all the
+    objects exist in openBIS.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+        space_name (str): The space in openBIS where the entities will be stored.
+        project_name (str): The project in openBIS where the entities will be stored.
+        collection_name (str): The collection in openBIS where the entities will be stored.
+        files_parser (dict): A dictionary where keys are parser instances and values are lists of file paths to be parsed. E.g., {MasterdataParserExample(): ["path/to/file.json", "path/to/another_file.json"]}
+        collection_type (str): The type of collection to create in openBIS. Options are "COLLECTION" or "DEFAULT_EXPERIMENT". Defaults to "COLLECTION".
+        chunk_size (int): The maximum number of objects committed in a single transaction. Defaults to `TRANSACTION_CHUNK_SIZE`.
+        queue_size (int): The maximum number of parsed items waiting to be uploaded. Defaults to `PIPELINE_QUEUE_SIZE`.
+        max_retries (int): The number of times the commit of a failed chunk is retried before splitting it. Defaults to 2.
+        retry_delay (float): The delay in seconds before the first retry of a failed chunk, doubled on every retry. Defaults to 1.0.
+        dataset_workers (int): The maximum number of datasets uploaded concurrently. Defaults to `DATASET_UPLOAD_WORKERS`.
+    """
+    if chunk_size < 1 or queue_size < 1:
+        logger.error(
+            f"Invalid chunk_size {chunk_size} or queue_size {queue_size}. They must be positive integers."
+        )
+        return None
+
+    # The parsers are run by the producer thread, so `_parser_init` only sets up openBIS
+    init = _parser_init(
+        openbis=openbis,
+        space_name=space_name,
+        collection_name=collection_name,
+        project_name=project_name,
+        files_parser=files_parser,
+        collection_type=collection_type,
+        run_parsers=False,
+    )
+    if init is None:
+        return None
+    _, space, project, collection_openbis = init
+
+    items: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    end_of_stream = object()
 
-            dataset.save()
-            logger.info(f"Dataset for files {files} added to transaction")
+    def put(item) -> bool:
+        # blocks while the queue is full, unless the uploader stopped
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
 
+    def produce() -> None:
+        try:
+            for item in _stream_parsed_items(files_parser):
+                if not put(item):
+                    return
         except Exception as e:
-            logger.warning(f"Error preparing dataset {files}: {e}")
+            put(("error", e, None))
+        finally:
+            put(end_of_stream)
 
-    # ---- RELATIONSHIPS IN TRANSACTION ----
-    for parent, child in collection.relationships.values():
-        if (
-            not isinstance(parent, dict)
-            and not isinstance(child, dict)
-            and (parent not in openbis_id_map or child not in openbis_id_map)
-        ):
-            logger.warning(
-                f"Skipping relationship with parent {parent} and child {child} "
-                "because one of them is not found attached or in OpenBIS."
+    producer = threading.Thread(target=produce, name="parser-producer", daemon=True)
+    producer.start()
+
+    openbis_id_map = {}
+    # openBIS identifiers of the uploaded objects by identity, without keeping them alive
+    committed_identifiers: dict[int, tuple[weakref.ref, str]] = {}
+    code_counter = {}
+    relationships = []
+    num_objects = 0
+    failed_identifiers = set()
+
+    def upload(batch: dict[str, ObjectType]) -> None:
+        # objects referenced through OBJECT properties are resolved within the batch, in the earlier
+        # batches, or by their code
+        batch_collection = CollectionType()
+        for object_id, object_instance in batch.items():
+            batch_collection._attach(object_id, object_instance)
+        prepared_objects = _prepare_objects(
+            openbis,
+            batch,
+            collection=batch_collection,
+            openbis_id_map=openbis_id_map,
+            code_counter=code_counter,
+            space=space,
+            project=project,
+            collection_openbis=collection_openbis,
+            space_name=space_name,
+            project_name=project_name,
+            collection_name=collection_name,
+            committed_identifiers=committed_identifiers,
+        )
+        for object_id, object_instance in batch.items():
+            committed_identifiers[id(object_instance)] = (
+                weakref.ref(object_instance),
+                openbis_id_map[object_id],
             )
-            continue
-        parent_obj = _get_entity(
+        failed_batch = _commit_chunks(
             openbis,
-            openbis_id_map,
-            parent,
-            "parent",
+            prepared_objects,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
         )
-        child_obj = _get_entity(
+        failed_identifiers.update(failed_batch)
+
+        object_datasets = [
+            (object_instance.datasets, openbis_id_map[object_id])
+            for object_id, object_instance in batch.items()
+            if object_instance.datasets
+            and openbis_id_map[object_id] not in failed_batch
+        ]
+        upload_results = _upload_datasets(
             openbis,
-            openbis_id_map,
-            child,
-            "child",
+            [
+                {"type": "RAW_DATA", "sample": identifier, "files": files}
+                for files, identifier in object_datasets
+            ],
+            workers=dataset_workers,
         )
+        for (files, _), (elapsed, error) in zip(object_datasets, upload_results):
+            if error is not None:
+                logger.warning(f"Error saving dataset for files {files}: {error}")
+            else:
+                logger.info(
+                    f"Dataset for files {files} saved successfully in {elapsed:.2f} s"
+                )
 
-        if parent_obj is None or child_obj is None:
-            continue
+    batch = {}
+    try:
+        while True:
+            item = items.get()
+            if item is end_of_stream:
+                break
+            kind, first, second = item
+            if kind == "error":
+                raise first
+            if kind == "relationship":
+                relationships.append((first, second))
+                continue
+            batch[first] = second
+            num_objects += 1
+            if len(batch) >= chunk_size:
+                upload(batch)
+                batch = {}
+        if batch:
+            upload(batch)
+    finally:
+        stop.set()
+        producer.join()
+
+    if failed_identifiers:
+        logger.error(
+            f"Failed to commit {len(failed_identifiers)} of {num_objects} objects: "
+            f"{sorted(failed_identifiers)}"
+        )
+        # the relationships of the objects not saved are skipped
+        for object_id in [
+            object_id
+            for object_id, identifier in openbis_id_map.items()
+            if identifier in failed_identifiers
+        ]:
+            del openbis_id_map[object_id]
+    else:
+        logger.info(f"{num_objects} objects committed successfully")
 
-        child_obj.add_parents(parent_obj)
-        rel_transaction.add(child_obj)
+    dataset_owner = (
+        {"collection": collection_openbis} if collection_name else {"project": project}
+    )
+    upload_results = _upload_datasets(
+        openbis,
+        [
+            {"type": "RAW_DATA", "files": files, **dataset_owner}
+            for files in files_parser.values()
+        ],
+        workers=dataset_workers,
+    )
+    for files, (elapsed, error) in zip(files_parser.values(), upload_results):
+        if error is not None:
+            logger.warning(f"Error preparing dataset {files}: {error}")
+        else:
+            logger.info(
+                f"Dataset for files {files} saved successfully in {elapsed:.2f} s"
+            )
 
-        logger.info(
-            f"Prepared relationship: "
-            f"{child_obj.identifier} -> parent {parent_obj.identifier}"
+    failed_children = _link_parents(openbis, relationships, openbis_id_map)
+    if failed_children:
+        logger.error(
+            f"Failed to commit relationships of {len(failed_children)} objects: {failed_children}"
         )
-
-    try:
-        rel_transaction.commit()
+    else:
         logger.info("Datasets and relationships committed successfully")
-    except Exception as e:
-        logger.error(f"Failed to commit datasets/relationships: {e}")
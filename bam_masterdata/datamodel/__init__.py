@@ -0,0 +1,4 @@
+from bam_masterdata.utils.lazy_modules import install_lazy_modules
+
+# The classes of the datamodel modules are built on first use instead of on import
+install_lazy_modules(__name__)
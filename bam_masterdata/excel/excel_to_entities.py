@@ -1,6 +1,7 @@
 import os
 import re
 import sys
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from bam_masterdata.utils import is_reduced_version, load_validation_rules
@@ -9,22 +10,145 @@ if TYPE_CHECKING:
     from openpyxl.worksheet.worksheet import Worksheet
 
 import openpyxl
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.utils.cell import coordinate_from_string
 
 from bam_masterdata.logger import logger
 from bam_masterdata.metadata.definitions import DataType
 from bam_masterdata.utils import VALIDATION_RULES_DIR
 
 
+class MaterializedCell:
+    """
+    Lightweight cell of a `MaterializedSheet` exposing the `value` and the `coordinate` of the cell as
+    the openpyxl cells do.
+    """
+
+    __slots__ = ("value", "row", "column")
+
+    def __init__(self, value: Any, row: int, column: int):
+        self.value = value
+        self.row = row
+        self.column = column
+
+    @property
+    def coordinate(self) -> str:
+        return f"{get_column_letter(self.column)}{self.row}"
+
+
+class MaterializedColumn(Sequence):
+    """
+    Column of a `MaterializedSheet`. The cells are created only when accessed, so that slicing a column
+    (e.g. `sheet["A"][3:10]`) does not create the cells of the whole column.
+    """
+
+    def __init__(self, sheet: "MaterializedSheet", column: int):
+        self.sheet = sheet
+        self.column = column
+
+    def __len__(self) -> int:
+        return self.sheet.max_row
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return tuple(
+                self.sheet.cell(row + 1, self.column)
+                for row in range(*index.indices(len(self)))
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        return self.sheet.cell(index + 1, self.column)
+
+
+class MaterializedSheet:
+    """
+    In-memory copy of the values of a worksheet, read once as row tuples with `iter_rows(values_only=True)`.
+    It supports the subset of the openpyxl `Worksheet` interface used by `MasterdataExcelExtractor`
+    (`title`, `max_row`, `max_column`, `cell()` and `sheet[...]` access by row, column or coordinate),
+    and stores which rows are empty so that the blocks of the sheet can be found in a single pass.
+    """
+
+    def __init__(self, worksheet: "Worksheet"):
+        self.title = worksheet.title
+        rows = [tuple(row) for row in worksheet.iter_rows(values_only=True)]
+        self.max_row = len(rows)
+        self.max_column = max((len(row) for row in rows), default=0)
+        self._rows = [
+            row + (None,) * (self.max_column - len(row))
+            if len(row) < self.max_column
+            else row
+            for row in rows
+        ]
+        self._empty_rows = [
+            all(value in (None, "") for value in row) for row in self._rows
+        ]
+
+    def is_row_empty(self, row: int) -> bool:
+        """
+        Checks if all the cells of a row are empty.
+
+        Args:
+            row: The row number (1-based index).
+
+        Returns:
+            True if all the cells in the row are None or empty strings, False otherwise.
+        """
+        if 1 <= row <= self.max_row:
+            return self._empty_rows[row - 1]
+        return True
+
+    def is_empty(self) -> bool:
+        """
+        Checks if all the cells of the sheet are empty.
+        """
+        return all(self._empty_rows)
+
+    def cell(self, row: int, column: int) -> MaterializedCell:
+        value = None
+        if 1 <= row <= self.max_row and 1 <= column <= self.max_column:
+            value = self._rows[row - 1][column - 1]
+        return MaterializedCell(value, row, column)
+
+    def __getitem__(
+        self, key: int | str
+    ) -> MaterializedCell | MaterializedColumn | tuple[MaterializedCell, ...]:
+        # Row access, e.g. `sheet[5]`
+        if isinstance(key, int):
+            return tuple(
+                self.cell(key, column) for column in range(1, self.max_column + 1)
+            )
+        # Column access, e.g. `sheet["A"]`
+        if key.isalpha():
+            return MaterializedColumn(self, column_index_from_string(key))
+        # Cell access, e.g. `sheet["A5"]`
+        column_letter, row = coordinate_from_string(key)
+        return self.cell(row, column_index_from_string(column_letter))
+
+
 class MasterdataExcelExtractor:
     # TODO move these validation rules to a separate json
     VALIDATION_RULES: dict[str, dict[str, dict[str, Any]]] = {}
 
     def __init__(self, excel_path: str, **kwargs):
-        """Initialize the MasterdataExtractor."""
+        """
+        Initialize the MasterdataExtractor. By default, the workbook is streamed in read-only mode and
+        each sheet is read only once; pass `read_only=False` to load the full workbook instead. The workbook
+        is closed once its sheets are read by `excel_to_entities()`.
+        """
         self.excel_path = excel_path
         self.row_cell_info = kwargs.get("row_cell_info", False)
-        self.workbook = openpyxl.load_workbook(excel_path)
+        if kwargs.get("read_only", True):
+            self.workbook = openpyxl.load_workbook(
+                excel_path, read_only=True, data_only=True
+            )
+        else:
+            self.workbook = openpyxl.load_workbook(excel_path)
         self.logger = kwargs.get("logger", logger)
+        # Sheets read by `materialize_sheets()` and the workbook they were read from
+        self._sheets: dict[str, MaterializedSheet] = {}
+        self._sheets_workbook = None
 
         # Load validation rules at initialization
         if not MasterdataExcelExtractor.VALIDATION_RULES:
@@ -73,16 +197,31 @@ class MasterdataExcelExtractor:
 
         last_non_empty_row = None
         for row in range(start_index, sheet.max_row + 1):
-            if all(
-                sheet.cell(row=row, column=col).value in (None, "")
-                for col in range(1, sheet.max_column + 1)
-            ):
+            if self.is_row_empty(sheet, row):
                 return last_non_empty_row  # Return the last non-empty row before the current empty row
 
             last_non_empty_row = row  # Update the last non-empty row
 
         return last_non_empty_row  # If no empty row is encountered, return the last non-empty row
 
+    def is_row_empty(self, sheet: "Worksheet | MaterializedSheet", row: int) -> bool:
+        """
+        Checks if all the cells of a row are empty.
+
+        Args:
+            sheet: The worksheet object.
+            row: The row number to check (1-based index).
+
+        Returns:
+            True if all the cells in the row are None or empty strings, False otherwise.
+        """
+        if isinstance(sheet, MaterializedSheet):
+            return sheet.is_row_empty(row)
+        return all(
+            sheet.cell(row=row, column=col).value in (None, "")
+            for col in range(1, sheet.max_column + 1)
+        )
+
     def str_to_bool(
         self,
         value: str | bool | None,
@@ -711,6 +850,25 @@ class MasterdataExcelExtractor:
         # Return sorted dictionary
         return dict(sorted(complete_dict.items(), key=lambda item: item[0].count(".")))
 
+    def materialize_sheets(self) -> dict[str, MaterializedSheet]:
+        """
+        Reads the values of all the sheets of the workbook once and closes the workbook, so that the file
+        handle kept open by openpyxl in read-only mode is released. Later calls return the same sheets.
+
+        Returns:
+            dict[str, MaterializedSheet]: The sheets of the workbook keyed by their names.
+        """
+        if self._sheets_workbook is not self.workbook:
+            try:
+                self._sheets = {
+                    sheet_name: MaterializedSheet(self.workbook[sheet_name])
+                    for sheet_name in self.workbook.sheetnames
+                }
+            finally:
+                self.workbook.close()
+            self._sheets_workbook = self.workbook
+        return self._sheets
+
     def excel_to_entities(self) -> dict[str, dict[str, Any]]:
         """
         Extracts entities from an Excel file and returns them as a dictionary.
@@ -720,20 +878,18 @@ class MasterdataExcelExtractor:
             containing the extracted entities. Returns an empty dictionary if all sheets are empty.
         """
         sheets_dict: dict[str, dict[str, Any]] = {}
-        sheet_names = self.workbook.sheetnames
+        # Read the sheet values only once
+        sheets = self.materialize_sheets()
+        sheet_names = list(sheets)
         has_content = False  # Track if any sheet has valid content
 
         for i, sheet_name in enumerate(sheet_names):
             normalized_sheet_name = sheet_name.lower().replace(" ", "_")
-            sheet = self.workbook[sheet_name]
+            sheet = sheets[sheet_name]
             start_row = 1
 
             # **Check if the sheet is empty**
-            if all(
-                sheet.cell(row=row, column=col).value in (None, "")
-                for row in range(1, sheet.max_row + 1)
-                for col in range(1, sheet.max_column + 1)
-            ):
+            if sheet.is_empty():
                 self.logger.info(f"Skipping empty sheet: {sheet_name}")
                 continue  # Move to the next sheet
 
@@ -742,10 +898,7 @@ class MasterdataExcelExtractor:
             consecutive_empty_rows = 0  # Track consecutive empty rows
             while start_row <= sheet.max_row:
                 # **Check for two consecutive empty rows**
-                is_row_empty = all(
-                    sheet.cell(row=start_row, column=col).value in (None, "")
-                    for col in range(1, sheet.max_column + 1)
-                )
+                is_row_empty = sheet.is_row_empty(start_row)
 
                 if is_row_empty:
                     consecutive_empty_rows += 1
@@ -1,14 +1,119 @@
-import copy
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 import structlog
 
-# List to store log messages
-log_storage = []
+# Default maximum number of log messages kept in `log_storage`
+DEFAULT_MAX_LOG_ENTRIES = 10_000
+
+
+class LogStorage:
+    """
+    Sink storing the last log messages as dictionaries. It behaves as a read-only list, and can be
+    disabled or bounded to a maximum number of entries, in which case the oldest messages are dropped
+    (ring buffer).
+    """
+
+    def __init__(
+        self, enabled: bool = True, max_entries: int | None = DEFAULT_MAX_LOG_ENTRIES
+    ):
+        self.enabled = enabled
+        self._entries: deque[dict] = deque(maxlen=max_entries)
+
+    @property
+    def max_entries(self) -> int | None:
+        """
+        Maximum number of log messages stored. None means that the storage is unbounded.
+        """
+        return self._entries.maxlen
+
+    def configure(
+        self, enabled: bool = True, max_entries: int | None = DEFAULT_MAX_LOG_ENTRIES
+    ) -> None:
+        """
+        Configures the storage, keeping the most recent messages that fit in the new bounds.
+
+        Args:
+            enabled (bool): If False, new log messages are not stored. Default is True.
+            max_entries (int | None): Maximum number of log messages stored. If None, the storage is
+                unbounded. Default is `DEFAULT_MAX_LOG_ENTRIES`.
+        """
+        self.enabled = enabled
+        self._entries = deque(self._entries, maxlen=max_entries)
+
+    def append(self, event_dict: dict) -> None:
+        if self.enabled:
+            self._entries.append(event_dict)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._entries)
+
+    def __getitem__(self, index: int | slice) -> dict | list[dict]:
+        if isinstance(index, slice):
+            return list(self._entries)[index]
+        return self._entries[index]
+
+    def __repr__(self) -> str:
+        return f"LogStorage({list(self._entries)!r})"
+
+
+# Storage of the last log messages
+log_storage = LogStorage()
+
+# Lists collecting the log messages in the active `collect_logs` scopes
+_LOG_COLLECTORS: ContextVar[tuple[list[dict], ...]] = ContextVar(
+    "log_collectors", default=()
+)
+
+
+def configure_log_storage(
+    enabled: bool = True, max_entries: int | None = DEFAULT_MAX_LOG_ENTRIES
+) -> None:
+    """
+    Configures the global `log_storage`.
+
+    Args:
+        enabled (bool): If False, log messages are not stored globally. Default is True.
+        max_entries (int | None): Maximum number of log messages stored. If None, the storage is unbounded.
+            Default is `DEFAULT_MAX_LOG_ENTRIES`.
+    """
+    log_storage.configure(enabled=enabled, max_entries=max_entries)
+
+
+@contextmanager
+def collect_logs() -> Iterator[list[dict]]:
+    """
+    Context manager collecting the log messages emitted inside its scope (in the current thread or asyncio
+    task) into a list, independently of the configuration of the global `log_storage`.
+
+    Example:
+        with collect_logs() as logs:
+            logger.info("message")
+        assert logs[0]["event"] == "message"
+
+    Yields:
+        list[dict]: The log messages emitted inside the scope.
+    """
+    logs: list[dict] = []
+    token = _LOG_COLLECTORS.set(_LOG_COLLECTORS.get() + (logs,))
+    try:
+        yield logs
+    finally:
+        _LOG_COLLECTORS.reset(token)
 
 
 def store_log_message(_, __, event_dict):
     """
-    Custom processor to store log messages in a list of dictionaries containing the log messages as:
+    Custom processor to store log messages in `log_storage` and in the active `collect_logs` scopes as
+    dictionaries containing the log messages as:
 
         {
             'event': <the log message>,
@@ -16,7 +121,15 @@ def store_log_message(_, __, event_dict):
             'level': <the log level (info, debug, warning, etc)>,
         }
     """
-    log_storage.append(copy.deepcopy(event_dict))
+    collectors = _LOG_COLLECTORS.get()
+    if not log_storage.enabled and not collectors:
+        return event_dict
+
+    # shallow copy, as the renderer pops keys from `event_dict` afterwards
+    stored_event = dict(event_dict)
+    log_storage.append(stored_event)
+    for logs in collectors:
+        logs.append(stored_event)
     return event_dict
 
 
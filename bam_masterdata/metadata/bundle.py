@@ -0,0 +1,161 @@
+import gzip
+import inspect
+import json
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from bam_masterdata.logger import logger
+from bam_masterdata.metadata.entities_dict import EntitiesDict, module_source_hash
+from bam_masterdata.utils import DATAMODEL_DIR, import_module, listdir_py_modules
+
+if TYPE_CHECKING:
+    from structlog._config import BoundLoggerLazyProxy
+
+# Version of the layout of the bundle file. Bundles with a different version are considered stale.
+BUNDLE_VERSION = 1
+
+# Default name of the bundle file
+BUNDLE_FILE_NAME = "datamodel_bundle.json.gz"
+
+
+def _module_hashes(python_path: str) -> dict[str, str]:
+    """
+    Returns the source hash of each Python module of the datamodel in `python_path`, keyed by the path of the
+    module relative to `python_path`.
+    """
+    root = python_path if os.path.isdir(python_path) else os.path.dirname(python_path)
+    return {
+        Path(os.path.relpath(module_path, root)).as_posix(): module_source_hash(
+            module_path
+        )
+        for module_path in listdir_py_modules(directory_path=python_path)
+    }
+
+
+def _collect_inheritance(python_path: str) -> dict[str, dict[str, list[str]]]:
+    """
+    Returns the codes of the parent entities of each entity in the datamodel defined in `python_path`, keyed by the
+    module name and the entity code. The parents are ordered from the closest to the most generic one.
+    """
+    inheritance: dict[str, dict[str, list[str]]] = {}
+    for module_path in listdir_py_modules(directory_path=python_path):
+        module = import_module(module_path=module_path)
+        name = os.path.basename(module_path).replace(".py", "")
+        module_inheritance = inheritance.setdefault(name, {})
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if "defs" not in obj.__dict__:
+                continue
+            module_inheritance[obj.defs.code] = [
+                base.defs.code for base in obj.__mro__[1:] if "defs" in base.__dict__
+            ]
+    return inheritance
+
+
+class DatamodelBundle:
+    """
+    Precompiled datamodel loaded from a bundle file written by `build_bundle`. It contains the same dictionary
+    of entities as `EntitiesDict.single_json` (definitions, assigned properties, terms and row locations), the
+    inheritance of the entities, and the source hashes of the Python modules it was built from.
+
+    Args:
+        data (dict): The decoded content of the bundle file.
+    """
+
+    def __init__(self, data: dict):
+        self.version: int = data["version"]
+        self.module_hashes: MappingProxyType[str, str] = MappingProxyType(
+            data["module_hashes"]
+        )
+        self.inheritance: MappingProxyType[str, dict[str, list[str]]] = (
+            MappingProxyType(data["inheritance"])
+        )
+        # Fresh for every loaded bundle, so that it can be modified by the caller (e.g., the checker logs)
+        self.entities: dict = data["entities"]
+
+    def is_stale(self, python_path: str) -> bool:
+        """
+        Checks if the bundle is outdated with respect to the Python modules of the datamodel in `python_path`, i.e.,
+        if the modules or their source code changed since the bundle was built.
+
+        Args:
+            python_path (str): The path to the Python module or the directory containing the Python modules.
+
+        Returns:
+            bool: True if the bundle is stale, False otherwise.
+        """
+        return self.version != BUNDLE_VERSION or dict(
+            self.module_hashes
+        ) != _module_hashes(python_path)
+
+
+def build_bundle(
+    python_path: str = DATAMODEL_DIR,
+    bundle_path: str | Path = BUNDLE_FILE_NAME,
+    workers: int = 1,
+    logger: "BoundLoggerLazyProxy" = logger,
+) -> Path:
+    """
+    Serializes the datamodel defined in the Python modules in `python_path` into a compressed JSON bundle file, which
+    can be loaded with `load_bundle` without executing the Python modules.
+
+    Args:
+        python_path (str): The path to the Python module or the directory containing the Python modules.
+        bundle_path (str | Path): The path of the bundle file. Default is `BUNDLE_FILE_NAME`.
+        workers (int): Number of worker processes used to load the Python modules. Default is 1.
+        logger (BoundLoggerLazyProxy): The logger to log messages. Default is `logger`.
+
+    Returns:
+        Path: The path of the written bundle file.
+    """
+    bundle_path = Path(bundle_path)
+    data = {
+        "version": BUNDLE_VERSION,
+        "module_hashes": _module_hashes(python_path),
+        "inheritance": _collect_inheritance(python_path),
+        "entities": EntitiesDict(
+            python_path=python_path, workers=workers, logger=logger
+        ).single_json(),
+    }
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(bundle_path, "wt", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    logger.info(f"Datamodel bundle of {python_path} written to {bundle_path}")
+    return bundle_path
+
+
+def load_bundle(
+    bundle_path: str | Path,
+    python_path: str | None = None,
+    logger: "BoundLoggerLazyProxy" = logger,
+) -> DatamodelBundle | None:
+    """
+    Loads the datamodel bundle file written by `build_bundle`. If `python_path` is set, the bundle is only returned
+    if it is up to date with the Python modules in `python_path`, so that the caller can fall back to them.
+
+    Args:
+        bundle_path (str | Path): The path of the bundle file.
+        python_path (str | None): The path to the Python modules used to check if the bundle is stale. If None,
+            the bundle is not checked.
+        logger (BoundLoggerLazyProxy): The logger to log messages. Default is `logger`.
+
+    Returns:
+        DatamodelBundle | None: The loaded bundle, or None if it does not exist, cannot be read, or is stale.
+    """
+    try:
+        with gzip.open(bundle_path, "rt", encoding="utf-8") as f:
+            bundle = DatamodelBundle(json.load(f))
+    except FileNotFoundError:
+        logger.info(f"Datamodel bundle {bundle_path} not found.")
+        return None
+    except (OSError, ValueError, KeyError) as err:
+        logger.warning(f"Could not read the datamodel bundle {bundle_path}: {err}")
+        return None
+
+    if python_path is not None and bundle.is_stale(python_path):
+        logger.warning(
+            f"Datamodel bundle {bundle_path} is outdated with respect to {python_path}."
+        )
+        return None
+    return bundle
@@ -1,13 +1,16 @@
 import datetime
+import functools
 import re
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pint import DefinitionSyntaxError, UndefinedUnitError, UnitRegistry
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from bam_masterdata.utils import code_to_class_name
 
+if TYPE_CHECKING:
+    from pint import Unit, UnitRegistry
+
 
 class DataType(str, Enum):
     """Enumeration of the data types available in openBIS."""
@@ -51,7 +54,94 @@ class DataType(str, Enum):
         return mapping.get(self, None)
 
 
-_UNIT_REGISTRY = UnitRegistry()
+# Maximum number of unit strings and pairs of units kept in the caches of `parse_units` and
+# `units_conversion_factor`
+UNITS_CACHE_SIZE = 1024
+
+
+@functools.cache
+def get_unit_registry() -> "UnitRegistry":
+    """
+    Returns the pint unit registry shared by the whole package. It is created on the first call, as parsing
+    the default definitions of pint is slow.
+
+    Returns:
+        UnitRegistry: The shared pint unit registry.
+    """
+    from pint import UnitRegistry
+
+    return UnitRegistry()
+
+
+@functools.lru_cache(maxsize=UNITS_CACHE_SIZE)
+def _parse_units(units: str) -> "Unit | None":
+    """
+    Parses `units` with the shared unit registry, returning None if it is not a valid units string. Invalid
+    strings are cached as well, as they are usually repeated in the same datamodel or masterdata file.
+    """
+    from pint import DefinitionSyntaxError, UndefinedUnitError
+
+    try:
+        return get_unit_registry().Unit(units)
+    except (UndefinedUnitError, DefinitionSyntaxError):
+        return None
+
+
+def parse_units(units: str) -> "Unit":
+    """
+    Parses a units string in pint format, e.g., `'mm'` or `'l/minute'`. The result is cached, so repeated
+    units strings are parsed only once.
+
+    Args:
+        units (str): Units string in pint format.
+
+    Raises:
+        ValueError: If the units string is not recognized by pint.
+
+    Returns:
+        Unit: The parsed pint unit.
+    """
+    unit = _parse_units(units)
+    if unit is None:
+        raise ValueError(f"Invalid units format: {units}")
+    return unit
+
+
+@functools.lru_cache(maxsize=UNITS_CACHE_SIZE)
+def units_conversion_factor(from_units: str, to_units: str) -> float:
+    """
+    Returns the factor converting values in `from_units` into values in `to_units`, e.g., 10 for `'cm'` to
+    `'mm'`. The factor is cached for each pair of units strings.
+
+    Args:
+        from_units (str): Units string in pint format of the values to convert.
+        to_units (str): Units string in pint format of the converted values.
+
+    Raises:
+        ValueError: If any of the units strings is invalid, if the units are not compatible, or if the
+            conversion is not a multiplication (e.g., `'degC'` to `'K'`).
+
+    Returns:
+        float: The conversion factor.
+    """
+    from pint import DimensionalityError, OffsetUnitCalculusError
+
+    registry = get_unit_registry()
+    source, target = parse_units(from_units), parse_units(to_units)
+    try:
+        offset = registry.Quantity(0.0, source).to(target).magnitude
+        factor = registry.Quantity(1.0, source).to(target).magnitude - offset
+    except (DimensionalityError, OffsetUnitCalculusError) as exc:
+        raise ValueError(
+            f"Units {from_units} cannot be converted to {to_units}: {exc}"
+        ) from exc
+    if offset:
+        raise ValueError(
+            f"Units {from_units} cannot be converted to {to_units} with a factor, as they have different offsets."
+        )
+    return factor
+
+
 _UNIT_LABEL_PATTERN = re.compile(r"\[[^\]]+\]")
 _UNIT_SUFFIX_PATTERN = re.compile(r"\bin \[[^\]]+\]")
 _EXCEL_NAME_MAP = {
@@ -443,12 +533,8 @@ class PropertyTypeDef(EntityDef):
         Raises:
             ValueError: If the units string is not recognized by pint.
         """
-        if value is None:
-            return value
-        try:
-            _UNIT_REGISTRY.Unit(value)
-        except (UndefinedUnitError, DefinitionSyntaxError) as exc:
-            raise ValueError(f"Invalid units format: {value}") from exc
+        if value is not None:
+            parse_units(value)
         return value
 
     @model_validator(mode="after")
@@ -3,18 +3,17 @@ import inspect
 import json
 import warnings
 from collections import OrderedDict
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, no_type_check
+from collections.abc import Callable, Iterator, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, no_type_check
 
-import h5py
-from pydantic import BaseModel, ConfigDict, Field, model_validator
-from rdflib import BNode, Literal
-from rdflib.namespace import DC, OWL, RDF, RDFS
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
-from bam_masterdata.utils import DATAMODEL_DIR, import_module, listdir_py_modules
+from bam_masterdata.utils import DATAMODEL_DIR, import_module
 from bam_masterdata.utils.decorators import deprecated
 
 if TYPE_CHECKING:
+    import h5py
     from pybis import Openbis
     from rdflib import Graph, Namespace, URIRef
     from structlog._config import BoundLoggerLazyProxy
@@ -30,12 +29,15 @@ from bam_masterdata.metadata._maps import (
 from bam_masterdata.metadata.definitions import (
     CollectionTypeDef,
     DatasetTypeDef,
+    DataType,
     ObjectTypeDef,
     PropertyTypeAssignment,
     VocabularyTerm,
     VocabularyTypeDef,
 )
-from bam_masterdata.openbis import OpenbisEntities
+from bam_masterdata.metadata.relationship_graph import RelationshipGraph
+from bam_masterdata.metadata.vocabulary_index import get_vocabulary_index
+from bam_masterdata.openbis.snapshot import OpenbisSnapshot
 from bam_masterdata.utils import code_to_class_name
 
 
@@ -52,27 +54,33 @@ class BaseEntity(BaseModel):
         """,
     )
 
+    # Attribute names mapped to the `PropertyTypeAssignment` of the class and to their native Python
+    # types. They are computed once per class in `__pydantic_init_subclass__` and shared read-only by
+    # all the instances.
+    _property_metadata: ClassVar[Mapping[str, PropertyTypeAssignment]] = (
+        MappingProxyType({})
+    )
+    _property_pytypes: ClassVar[Mapping[str, type | None]] = MappingProxyType({})
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        prop_meta_dict = cls._collect_property_metadata()
+        cls._property_metadata = MappingProxyType(prop_meta_dict)
+        cls._property_pytypes = MappingProxyType(
+            {key: prop.data_type.pytype for key, prop in prop_meta_dict.items()}
+        )
+
     def __init__(self, **kwargs):
         super().__init__()
 
-        # We store the `_property_metadata` during instantiation of the class
-        self._property_metadata = self.get_property_metadata()
-
         for key, value in kwargs.items():
             setattr(self, key, value)
 
     def __setattr__(self, key, value):
-        # Allow initialization before metadata exists
-        if not hasattr(self, "_property_metadata"):
-            return object.__setattr__(self, key, value)
-
-        if key == "_property_metadata":
-            super().__setattr__(key, value)
-            return
-
         if key in self._property_metadata:
             # TODO add CONTROLLEDVOCABULARY and OBJECT cases
-            expected_type = self._property_metadata[key].data_type.pytype
+            expected_type = self._property_pytypes[key]
             if expected_type and not isinstance(value, expected_type):
                 raise TypeError(
                     f"Invalid type for '{key}': Expected {expected_type.__name__}, got {type(value).__name__}"
@@ -143,20 +151,23 @@ class BaseEntity(BaseModel):
         type_map: dict,
         get_type: Callable[..., Any],
         create_type: Callable[..., Any],
+        *,
+        snapshot: "OpenbisSnapshot | None" = None,
     ) -> None:
         """
         Simplified function to add or update the entity type in openBIS.
         """
-        # Get all existing entities from openBIS
-        openbis_entities = getattr(
-            OpenbisEntities(url=openbis.url), f"get_{type}_dict"
-        )()
         defs = getattr(self, "defs")
 
         is_vocab = isinstance(self, VocabularyType)
+        entity_name = "vocabularies" if is_vocab else f"{type}_types"
+
+        # Get all existing entities from openBIS
+        if snapshot is None:
+            snapshot = OpenbisSnapshot(openbis)
 
         # Check if the entity already exists
-        if defs.code in openbis_entities:
+        if snapshot.exists(entity_name, defs.code):
             logger.info(f"Entity '{defs.code}' already exists in openBIS.")
             # Retrieve the existing entity
             entity = get_type(openbis, defs.code)
@@ -261,6 +272,7 @@ class BaseEntity(BaseModel):
             logger.info(f"Adding new terms {term_codes} to {defs.code}.")
             entity = create_type(openbis, defs, terms)
             entity.save()
+        snapshot.add(entity_name, defs.code)
 
         # Save the entity after assigning properties
         if not is_vocab:
@@ -289,11 +301,20 @@ class BaseEntity(BaseModel):
                 ),
             }
         """
-        cls_attrs = self.__class__.__dict__
+        return dict(self._property_metadata)
+
+    @classmethod
+    def _collect_property_metadata(cls) -> dict:
+        """
+        Collects the `PropertyTypeAssignment` attributes of the class and all its bases by walking
+        the MRO.
 
-        # Store property metadata at class level
+        Returns:
+            dict: A dictionary containing the keys of the `PropertyTypeAssignment` attribute names and the
+            values of the definitions of `PropertyTypeAssignment`.
+        """
         prop_meta_dict: dict = {}
-        for base in type(self).__mro__:
+        for base in cls.__mro__:
             cls_attrs = getattr(base, "__dict__", {})
             for attr_name, attr_value in cls_attrs.items():
                 if isinstance(attr_value, PropertyTypeAssignment):
@@ -332,7 +353,7 @@ class BaseEntity(BaseModel):
         dump_json = self.to_json()
         return json.loads(dump_json)
 
-    def to_hdf5(self, hdf_file: h5py.File, group_name: str = "") -> h5py.File:
+    def to_hdf5(self, hdf_file: "h5py.File", group_name: str = "") -> "h5py.File":
         """
         Serialize the entity to a HDF5 file under the group specified in the input.
 
@@ -410,6 +431,9 @@ class BaseEntity(BaseModel):
         Returns:
             URIRef: The URI reference of the property added to the RDF graph.
         """
+        from rdflib import BNode, Literal
+        from rdflib.namespace import DC, OWL, RDF, RDFS
+
         prop_uri = namespace[prop.id]
 
         # Define the property as an OWL class inheriting from PropertyType
@@ -470,6 +494,9 @@ class BaseEntity(BaseModel):
             graph (Graph): The RDF graph to which the entity is added.
             logger (BoundLoggerLazyProxy): The logger to log messages.
         """
+        from rdflib import BNode, Literal
+        from rdflib.namespace import DC, OWL, RDF, RDFS
+
         entity_uri = namespace[self.defs.id]
 
         # Define the entity as an OWL class inheriting from the specific namespace type
@@ -538,6 +565,20 @@ class VocabularyType(BaseEntity):
         """,
     )
 
+    # Vocabulary terms of the class and its bases, computed once per class and copied into `terms`
+    # for each instance
+    _ordered_terms: ClassVar[tuple[VocabularyTerm, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._ordered_terms = tuple(
+            attr_val
+            for base in cls.__mro__
+            for attr_val in base.__dict__.values()
+            if isinstance(attr_val, VocabularyTerm)
+        )
+
     @property
     def base_name(self) -> str:
         """
@@ -558,17 +599,29 @@ class VocabularyType(BaseEntity):
             Any: The data with the validated fields.
         """
         # Add all the vocabulary terms defined in the vocabulary type to the `terms` list.
-        for base in cls.__mro__:
-            for _, attr_val in base.__dict__.items():
-                if isinstance(attr_val, VocabularyTerm):
-                    data.terms.append(attr_val)
+        data.terms = list(cls._ordered_terms)
 
         return data
 
-    def to_openbis(self, logger: "BoundLoggerLazyProxy", openbis: "Openbis") -> None:
-        openbis_entities = OpenbisEntities(url=openbis.url).get_vocabulary_dict()
+    def to_openbis(
+        self,
+        logger: "BoundLoggerLazyProxy",
+        openbis: "Openbis",
+        snapshot: "OpenbisSnapshot | None" = None,
+    ) -> None:
+        """
+        Create the vocabulary type in openBIS, or add its missing terms if it already exists.
+
+        Args:
+            logger (BoundLoggerLazyProxy): The logger to log messages.
+            openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+            snapshot (OpenbisSnapshot | None): The existing entities in openBIS, shared by all the entities
+                pushed in the same run. If None, the existing vocabularies are listed from openBIS.
+        """
+        if snapshot is None:
+            snapshot = OpenbisSnapshot(openbis)
 
-        if self.defs.code in openbis_entities:
+        if snapshot.exists("vocabularies", self.defs.code):
             logger.info(f"Vocabulary '{self.defs.code}' already exists in openBIS.")
             entity = openbis.get_vocabulary(self.defs.code)
 
@@ -621,9 +674,94 @@ class VocabularyType(BaseEntity):
                 terms=obis_terms,
             )
         entity.save()
+        snapshot.add("vocabularies", self.defs.code)
         return entity
 
 
+def _set_timestamp_value(instance: "ObjectType", key: str, value: Any) -> str:
+    """
+    Setter for TIMESTAMP properties. Datetimes are stored as strings and strings are validated to be
+    in ISO format.
+    """
+    if isinstance(value, datetime.datetime):
+        try:
+            return value.strftime("%Y-%m-%d %H:%M:%S")  # create string
+        except ValueError:
+            raise ValueError(
+                f"Invalid datetime format for '{key}': Expected ISO format string, got '{value}'"
+            )
+    if isinstance(value, str):
+        try:
+            datetime.datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(
+                f"Invalid datetime format for '{key}': Expected ISO format string, got '{value}'"
+            )
+        return value
+    raise TypeError(
+        f"Invalid type for '{key}': Expected datetime or ISO format string, got {type(value).__name__}"
+    )
+
+
+def _set_object_reference_value(instance: "ObjectType", key: str, value: Any) -> Any:
+    """
+    Setter for OBJECT properties.
+    """
+    return instance._set_object_value(key, value)
+
+
+def _set_controlled_vocabulary_value(
+    instance: "ObjectType", key: str, value: Any
+) -> Any:
+    """
+    Setter for CONTROLLEDVOCABULARY properties.
+    """
+    instance._validate_controlled_vocabulary(instance._property_metadata, key, value)
+    return value
+
+
+def _set_untyped_value(instance: "ObjectType", key: str, value: Any) -> Any:
+    """
+    Setter for properties without a native Python type (e.g., XML).
+    """
+    return value
+
+
+def _compile_property_setter(
+    prop: PropertyTypeAssignment,
+) -> Callable[["ObjectType", str, Any], Any]:
+    """
+    Returns the setter used to validate the values assigned to an attribute with the property `prop`. The
+    setter returns the value to be stored or raises an error if the value is not valid.
+
+    Args:
+        prop (PropertyTypeAssignment): The property assigned to the attribute.
+
+    Returns:
+        Callable[[ObjectType, str, Any], Any]: The setter specialised for the data type of `prop`.
+    """
+    data_type = prop.data_type
+    if data_type == DataType.TIMESTAMP:
+        return _set_timestamp_value
+    if data_type == DataType.OBJECT:
+        return _set_object_reference_value
+    if data_type == DataType.CONTROLLEDVOCABULARY:
+        return _set_controlled_vocabulary_value
+
+    expected_type = data_type.pytype
+    if expected_type is None:
+        return _set_untyped_value
+
+    def _set_typed_value(instance: "ObjectType", key: str, value: Any) -> Any:
+        if not isinstance(value, expected_type):
+            raise TypeError(
+                f"Invalid type for '{key}': Expected {expected_type.__name__}, got {type(value).__name__}"
+            )
+        return value
+
+    return _set_typed_value
+
+
 class ObjectType(BaseEntity):
     """
     Base class used to define object types. All object types must inherit from this class. The
@@ -660,13 +798,30 @@ class ObjectType(BaseEntity):
         """,
     )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    # Attribute names mapped to the `DataType` of the assigned properties and to the setters used to
+    # validate the assigned values, shared by all the instances
+    _properties: ClassVar[Mapping[str, DataType]] = MappingProxyType({})
+    _property_setters: ClassVar[
+        Mapping[str, Callable[["ObjectType", str, Any], Any]]
+    ] = MappingProxyType({})
+
+    # Properties of the class and its bases grouped by section, computed once per class and copied
+    # into `properties` for each instance
+    _ordered_properties: ClassVar[tuple[PropertyTypeAssignment, ...]] = ()
 
-        # Initialize the properties list to store PropertyTypeAssignment instances
-        self._properties = {}
-        for key, prop in self._property_metadata.items():
-            self._properties[key] = prop.data_type
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._ordered_properties = cls._collect_ordered_properties()
+        cls._properties = MappingProxyType(
+            {key: prop.data_type for key, prop in cls._property_metadata.items()}
+        )
+        cls._property_setters = MappingProxyType(
+            {
+                key: _compile_property_setter(prop)
+                for key, prop in cls._property_metadata.items()
+            }
+        )
 
     def _set_object_value(self, key, value):
         """
@@ -720,7 +875,7 @@ class ObjectType(BaseEntity):
                 f"The attribute '{key}' uses the institutional vocabulary '{vocabulary_code}'. "
                 "This value will not be validated against internal vocabulary definitions.",
                 UserWarning,
-                stacklevel=3,
+                stacklevel=4,
             )
             return None
 
@@ -728,97 +883,30 @@ class ObjectType(BaseEntity):
             raise ValueError(
                 f"Property '{key}' of type CONTROLLEDVOCABULARY must have a vocabulary_code defined."
             )
-        vocab_path = None
-        for file in listdir_py_modules(DATAMODEL_DIR):
-            if "vocabulary_types.py" in file:
-                vocab_path = file
-                break
-        if vocab_path is None:
-            raise FileNotFoundError(
-                f"The file 'vocabulary_types.py' was not found in the directory specified by {DATAMODEL_DIR}."
-            )
-        vocabulary_class = self.get_vocabulary_class(vocabulary_code, vocab_path)
-        if vocabulary_class is None:
+        vocabulary_index = get_vocabulary_index(DATAMODEL_DIR)
+        if vocabulary_index.terms(vocabulary_code) is None:
             raise ValueError(
                 f"No matching vocabulary class found for vocabulary_code '{vocabulary_code}'."
             )
-        codes = [term.code for term in vocabulary_class.terms]
-        if value not in codes:
+        if not vocabulary_index.is_term(vocabulary_code, value):
             raise ValueError(
                 f"{value} for {key} is not in the list of allowed terms for vocabulary."
             )
 
     def __setattr__(self, key, value):
-        if not hasattr(self, "_property_metadata"):
-            return object.__setattr__(self, key, value)
-
-        if key in [
-            "_property_metadata",
-            "_properties",
-            "code",
-            "properties",
-            "datasets",
-        ]:
+        if key in ("code", "properties", "datasets"):
             super().__setattr__(key, value)
             return
 
-        # key search in every nested class
-        for base in type(self).__mro__:
-            prop_meta = getattr(base, "get_property_metadata", None)
-            if callable(prop_meta):
-                meta = (
-                    prop_meta(self)
-                    if base is not type(self)
-                    else self._property_metadata
-                )
-                if key in meta:
-                    # Type check
-                    expected_type = meta[key].data_type.pytype
-                    if expected_type is datetime.datetime:
-                        if isinstance(value, datetime.datetime):
-                            try:
-                                value = value.strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                )  # create string
-                                expected_type = str
-                            except ValueError:
-                                raise ValueError(
-                                    f"Invalid datetime format for '{key}': Expected ISO format string, got '{value}'"
-                                )
-                        elif isinstance(value, str):
-                            try:
-                                datetime.datetime.fromisoformat(value)
-                                expected_type = str
-                            except ValueError:
-                                raise ValueError(
-                                    f"Invalid datetime format for '{key}': Expected ISO format string, got '{value}'"
-                                )
-                        else:
-                            raise TypeError(
-                                f"Invalid type for '{key}': Expected datetime or ISO format string, got {type(value).__name__}"
-                            )
-                    if expected_type and not isinstance(value, expected_type):
-                        raise TypeError(
-                            f"Invalid type for '{key}': Expected {expected_type.__name__}, got {type(value).__name__}"
-                        )
-
-                    # Get data type for additional checks
-                    data_type = meta[key].data_type
-                    # OBJECT check and attr assignment
-                    if data_type == "OBJECT":
-                        return object.__setattr__(
-                            self, key, self._set_object_value(key, value)
-                        )
-                    # CONTROLLEDVOCABULARY check
-                    if data_type == "CONTROLLEDVOCABULARY":
-                        self._validate_controlled_vocabulary(meta, key, value)
-
-                    # Setting attribute value after all checks
-                    return object.__setattr__(self, key, value)
+        # `_property_setters` already contains the assignments of all the nested classes
+        setter = self._property_setters.get(key)
+        if setter is None:
+            raise KeyError(
+                f"Key '{key}' not found in any property_metadata of {type(self).__name__} or its bases."
+            )
 
-        raise KeyError(
-            f"Key '{key}' not found in any property_metadata of {type(self).__name__} or its bases."
-        )
+        # Setting attribute value after all checks
+        object.__setattr__(self, key, setter(self, key, value))
 
     def get_vocabulary_class(
         self, vocabulary_code: str, vocab_path: str
@@ -850,17 +938,14 @@ class ObjectType(BaseEntity):
         """
         return "ObjectType"
 
-    @model_validator(mode="after")
     @classmethod
-    def model_validator_after_init(cls, data: Any) -> Any:
+    def _collect_ordered_properties(cls) -> tuple[PropertyTypeAssignment, ...]:
         """
-        Validate the model after instantiation of the class.
-
-        Args:
-            data (Any): The data containing the fields values to validate.
+        Collects the `PropertyTypeAssignment` attributes of the class and its bases, from parent to child,
+        grouped by section in order of first appearance.
 
         Returns:
-            Any: The data with the validated fields.
+            tuple[PropertyTypeAssignment, ...]: The ordered properties assigned to the class.
         """
         # ordered parent -> child properties
         collected_properties = []
@@ -880,11 +965,41 @@ class ObjectType(BaseEntity):
         ordered_properties = []
         for props in grouped_sections.values():
             ordered_properties.extend(props)
-        data.properties = ordered_properties
+        return tuple(ordered_properties)
+
+    @model_validator(mode="after")
+    @classmethod
+    def model_validator_after_init(cls, data: Any) -> Any:
+        """
+        Validate the model after instantiation of the class.
+
+        Args:
+            data (Any): The data containing the fields values to validate.
+
+        Returns:
+            Any: The data with the validated fields.
+        """
+        data.properties = list(cls._ordered_properties)
 
         return data
 
-    def to_openbis(self, logger: "BoundLoggerLazyProxy", openbis: "Openbis") -> None:
+    def to_openbis(
+        self,
+        logger: "BoundLoggerLazyProxy",
+        openbis: "Openbis",
+        snapshot: "OpenbisSnapshot | None" = None,
+    ) -> None:
+        """
+        Create the object type in openBIS with its property types, or assign the missing properties if it
+        already exists.
+
+        Args:
+            logger (BoundLoggerLazyProxy): The logger to log messages.
+            openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+            snapshot (OpenbisSnapshot | None): The existing entities in openBIS, shared by all the entities
+                pushed in the same run. If None, the existing object and property types are listed from openBIS.
+        """
+
         def _assign_property(prop, entity, openbis) -> None:
             """
             Assign the property to the entity, adding the `vocabulary` parameter if the `vocabulary_code`
@@ -900,7 +1015,7 @@ class ObjectType(BaseEntity):
                 prop.data_type = "SAMPLE"
 
             # If property does not exist in openBIS, create it before assigning to the entity
-            if not openbis.get_property_types(prop.code):
+            if not snapshot.exists("property_types", prop.code):
                 # For CONTROLLEDVOCABULARY properties with a defined vocabulary_code, we need to create the property with the vocabulary assigned
                 if prop.data_type == "CONTROLLEDVOCABULARY" and prop.vocabulary_code:
                     openbis.new_property_type(
@@ -917,6 +1032,7 @@ class ObjectType(BaseEntity):
                         description=prop.description,
                         dataType=prop.data_type.value,
                     ).save()
+                snapshot.add("property_types", prop.code)
 
             # Assign the property to the entity, adding the `vocabulary` parameter if the `vocabulary_code` is defined for the property
             # TODO check what happens when dataType="SAMPLE" and how to use pyBIS for this
@@ -936,9 +1052,10 @@ class ObjectType(BaseEntity):
                 )
 
         # Get all existing entities from openBIS
-        openbis_entities = OpenbisEntities(url=openbis.url).get_object_dict()
+        if snapshot is None:
+            snapshot = OpenbisSnapshot(openbis)
 
-        if self.defs.code in openbis_entities:
+        if snapshot.exists("object_types", self.defs.code):
             logger.info(f"Object type '{self.defs.code}' already exists in openBIS.")
             entity = openbis.get_object_type(self.defs.code)
 
@@ -971,6 +1088,7 @@ class ObjectType(BaseEntity):
                 autoGeneratedCode=self.defs.auto_generate_codes,
             )
             entity.save()  # we need to save this before assigning properties
+            snapshot.add("object_types", self.defs.code)
 
             # Assign properties to the new entity
             for prop in self.properties:
@@ -1071,6 +1189,24 @@ class CollectionType(ObjectType):
         """,
     )
 
+    # Reverse index of `attached_objects` mapping the identity (`id()`) of each attached instance to its
+    # object identifier, kept consistent by `add` and `remove`. `_object_ids_stamp` records the identity
+    # and the size of the indexed `attached_objects`, so that `id_of` rebuilds the index only when it is
+    # stale, e.g., in a copy of the collection type or after objects are placed directly in `attached_objects`
+    _object_ids: dict[int, str] = PrivateAttr(default_factory=dict)
+    _object_ids_stamp: list[int] = PrivateAttr(default_factory=lambda: [0, 0])
+
+    # Adjacency lists of `relationships` between the attached objects, kept consistent by `add`, `remove`,
+    # `add_relationship`, and `remove_relationship`. Dictionary endpoints are keyed by their `generate_dict_id`.
+    # `_relationship_graph_stamp` records the identity and the size of `attached_objects` and `relationships`,
+    # so that the graph is rebuilt when it is read after they were changed directly
+    _relationship_graph: RelationshipGraph = PrivateAttr(
+        default_factory=RelationshipGraph
+    )
+    _relationship_graph_stamp: list[int] = PrivateAttr(
+        default_factory=lambda: [0, 0, 0, 0]
+    )
+
     def __repr__(self):
         return f"{self.base_name}(attached_objects={self.attached_objects}, relationships={self.relationships})"
 
@@ -1091,6 +1227,7 @@ class CollectionType(ObjectType):
         openbis: "Openbis",
         type: str = "collection",
         type_map: dict = COLLECTION_TYPE_MAP,
+        snapshot: "OpenbisSnapshot | None" = None,
     ) -> None:
         def get_type(openbis: "Openbis", code: str):
             return openbis.get_collection_type(code)
@@ -1118,6 +1255,7 @@ class CollectionType(ObjectType):
             type_map=type_map,
             get_type=get_type,
             create_type=create_type,
+            snapshot=snapshot,
         )
 
     def add(self, object_type: ObjectType) -> str:
@@ -1130,6 +1268,20 @@ class CollectionType(ObjectType):
         Returns:
             str: The unique identifier of the object type assigned in openBIS.
         """
+        self.check_object_type(object_type)
+        object_id = generate_object_id(object_type)
+        self._attach(object_id, object_type)
+        return object_id
+
+    @staticmethod
+    def check_object_type(object_type: ObjectType) -> None:
+        """
+        Check that `object_type` can be attached to a collection type, i.e., that it is an `ObjectType`
+        instance with all its mandatory properties filled.
+
+        Args:
+            object_type (ObjectType): The object type to check.
+        """
         if not isinstance(object_type, ObjectType):
             raise TypeError(
                 f"Expected an ObjectType instance, got `{type(object_type).__name__}`"
@@ -1147,9 +1299,47 @@ class CollectionType(ObjectType):
                 f"The following mandatory fields are missing for ObjectType '{object_type.cls_name}': {', '.join(missing_fields)}"
             )
 
-        object_id = generate_object_id(object_type)
+    def _attach(self, object_id: str, object_type: ObjectType) -> None:
+        """
+        Attach an object type with the unique identifier `object_id`, updating the indexes of the collection type.
+        """
+        object_ids = self._sync_object_ids()
+        graph = self._sync_relationship_graph()
         self.attached_objects[object_id] = object_type
-        return object_id
+        # an instance attached several times is identified by its first object identifier
+        object_ids.setdefault(id(object_type), object_id)
+        graph.add_node(object_id)
+        self._object_ids_stamp[:] = self._attached_objects_stamp()
+        self._relationship_graph_stamp[:] = self._relationships_stamp()
+
+    def merge(self, other: "CollectionType") -> dict[str, str]:
+        """
+        Merge the attached objects and the relationships of another collection type into this one, e.g., the
+        results of a parser run in a different process. The objects keep their unique identifiers unless they
+        already exist in this collection type, in which case new ones are generated and the relationships
+        are remapped accordingly.
+
+        Args:
+            other (CollectionType): The collection type to merge into this one.
+
+        Returns:
+            dict[str, str]: The mapping from the unique identifiers of the objects in `other` to their unique
+            identifiers in this collection type.
+        """
+        id_map = {}
+        for object_id, object_type in other.attached_objects.items():
+            new_id = object_id
+            while new_id in self.attached_objects:
+                new_id = generate_object_id(object_type)
+            self._attach(new_id, object_type)
+            id_map[object_id] = new_id
+
+        for parent, child in other.relationships.values():
+            self.add_relationship(
+                id_map.get(parent, parent) if isinstance(parent, str) else parent,
+                id_map.get(child, child) if isinstance(child, str) else child,
+            )
+        return id_map
 
     def remove(self, object_id: str = "") -> None:
         """
@@ -1166,7 +1356,59 @@ class CollectionType(ObjectType):
             raise ValueError(
                 f"Object with ID '{object_id}' does not exist in the collection."
             )
-        del self.attached_objects[object_id]
+        object_ids = self._sync_object_ids()
+        graph = self._sync_relationship_graph()
+        object_type = self.attached_objects.pop(object_id)
+        if object_ids.get(id(object_type)) == object_id:
+            del object_ids[id(object_type)]
+        # the relationships of the removed object are kept in `relationships`, but not in the graph
+        graph.remove_node(object_id)
+        self._object_ids_stamp[:] = self._attached_objects_stamp()
+        self._relationship_graph_stamp[:] = self._relationships_stamp()
+
+    def _attached_objects_stamp(self) -> list[int]:
+        """
+        Returns the identity and the size of `attached_objects`, used to detect that the indexes built from it
+        are stale.
+        """
+        return [id(self.attached_objects), len(self.attached_objects)]
+
+    def _sync_object_ids(self) -> dict[int, str]:
+        """
+        Returns the reverse index of `attached_objects`, rebuilding it first if it is stale.
+        """
+        object_ids = self._object_ids
+        stamp = self._attached_objects_stamp()
+        if self._object_ids_stamp != stamp:
+            object_ids.clear()
+            for object_id, attached_object in self.attached_objects.items():
+                object_ids.setdefault(id(attached_object), object_id)
+            self._object_ids_stamp[:] = stamp
+        return object_ids
+
+    def id_of(self, object_type: ObjectType) -> str | None:
+        """
+        Get the unique identifier of an object type instance attached to the collection type. The lookup
+        is done by identity and in constant time, instead of scanning `attached_objects`. The index is only
+        rebuilt if `attached_objects` was replaced or resized without `add` or `remove`, e.g., in a copy of the
+        collection type.
+
+        Args:
+            object_type (ObjectType): The object type instance attached with `add`.
+
+        Returns:
+            str | None: The unique identifier of the object type, or None if the instance is not attached
+            to the collection type.
+        """
+        object_ids = self._sync_object_ids()
+        object_id = object_ids.get(id(object_type))
+        if object_id is None:
+            return None
+        if self.attached_objects.get(object_id) is not object_type:
+            # an entry left behind by a value replaced in place, so the index is rebuilt
+            self._object_ids_stamp[:] = [0, 0]
+            object_id = self._sync_object_ids().get(id(object_type))
+        return object_id
 
     def add_relationship(self, parent: str | dict, child: str | dict) -> str:
         """
@@ -1196,22 +1438,17 @@ class CollectionType(ObjectType):
                     "Both `parent` and `child` must be assigned to objects attached to the collection or being a dict readable by the system."
                 )
 
-        if not isinstance(parent, dict) and not isinstance(child, dict):
-            relationship_id = generate_object_relationship_id(parent, child)
-            self.relationships[relationship_id] = (parent, child)
-        else:
-            resolved_parent = (
-                generate_dict_id(parent) if isinstance(parent, dict) else parent
-            )
-
-            resolved_child = (
-                generate_dict_id(child) if isinstance(child, dict) else child
-            )
-
-            relationship_id = generate_object_relationship_id(
-                resolved_parent, resolved_child
-            )
-            self.relationships[relationship_id] = (parent, child)
+        resolved_parent = self._relationship_key(parent)
+        resolved_child = self._relationship_key(child)
+        relationship_id = generate_object_relationship_id(
+            resolved_parent, resolved_child
+        )
+        graph = self._sync_relationship_graph()
+        self.relationships[relationship_id] = (parent, child)
+        graph.add_edge(
+            resolved_parent, resolved_child, parent_value=parent, child_value=child
+        )
+        self._relationship_graph_stamp[:] = self._relationships_stamp()
 
         return relationship_id
 
@@ -1230,7 +1467,103 @@ class CollectionType(ObjectType):
             raise ValueError(
                 f"Relationship with ID '{relationship_id}' does not exist in the collection type."
             )
-        del self.relationships[relationship_id]
+        graph = self._sync_relationship_graph()
+        parent, child = self.relationships.pop(relationship_id)
+        graph.remove_edge(self._relationship_key(parent), self._relationship_key(child))
+        self._relationship_graph_stamp[:] = self._relationships_stamp()
+
+    @staticmethod
+    def _relationship_key(obj: str | dict) -> str:
+        """
+        Returns the key of an endpoint of a relationship: the object unique identifier, or the
+        `generate_dict_id` of a dictionary representation of an object.
+        """
+        return generate_dict_id(obj) if isinstance(obj, dict) else obj
+
+    def _relationships_stamp(self) -> list[int]:
+        """
+        Returns the identity and the size of `attached_objects` and `relationships`, used to detect that the
+        graph built from them is stale.
+        """
+        return self._attached_objects_stamp() + [
+            id(self.relationships),
+            len(self.relationships),
+        ]
+
+    def _sync_relationship_graph(self) -> RelationshipGraph:
+        """
+        Returns the graph of the relationships, rebuilding it first from `attached_objects` and `relationships`
+        if it is stale. The relationships of objects which are no longer attached are left out of the graph.
+        """
+        graph = self._relationship_graph
+        stamp = self._relationships_stamp()
+        if self._relationship_graph_stamp != stamp:
+            graph.clear()
+            for object_id in self.attached_objects:
+                graph.add_node(object_id)
+            for parent, child in self.relationships.values():
+                if any(
+                    isinstance(obj, str) and obj not in self.attached_objects
+                    for obj in (parent, child)
+                ):
+                    continue
+                graph.add_edge(
+                    self._relationship_key(parent),
+                    self._relationship_key(child),
+                    parent_value=parent,
+                    child_value=child,
+                )
+            self._relationship_graph_stamp[:] = stamp
+        return graph
+
+    def parents_of(self, obj: str | dict) -> list[str | dict]:
+        """
+        Get the parents of an object in the relationships of the collection type.
+
+        Args:
+            obj (str | dict): The unique identifier or the dictionary representation of the object.
+
+        Returns:
+            list[str | dict]: The parents of the object, in the order in which the relationships were added.
+        """
+        return self._sync_relationship_graph().parents(self._relationship_key(obj))
+
+    def children_of(self, obj: str | dict) -> list[str | dict]:
+        """
+        Get the children of an object in the relationships of the collection type.
+
+        Args:
+            obj (str | dict): The unique identifier or the dictionary representation of the object.
+
+        Returns:
+            list[str | dict]: The children of the object, in the order in which the relationships were added.
+        """
+        return self._sync_relationship_graph().children(self._relationship_key(obj))
+
+    def has_cycle(self) -> bool:
+        """
+        Checks if the relationships of the collection type contain a cycle.
+
+        Returns:
+            bool: True if an object is its own ancestor, False otherwise.
+        """
+        return self._sync_relationship_graph().has_cycle()
+
+    def topological_order(self) -> Iterator[str]:
+        """
+        Iterates over the unique identifiers of the attached objects with the parents before their children,
+        so that they can be registered in openBIS parents-first. Objects without pending parents keep the
+        order in which they were attached.
+
+        Raises:
+            ValueError: If the relationships contain a cycle.
+
+        Yields:
+            str: The unique identifier of each attached object.
+        """
+        for object_id in self._sync_relationship_graph().topological_order():
+            if isinstance(object_id, str) and object_id in self.attached_objects:
+                yield object_id
 
 
 class DatasetType(ObjectType):
@@ -1251,6 +1584,7 @@ class DatasetType(ObjectType):
         openbis: "Openbis",
         type: str = "dataset",
         type_map: dict = DATASET_TYPE_MAP,
+        snapshot: "OpenbisSnapshot | None" = None,
     ) -> None:
         def get_type(openbis: "Openbis", code: str):
             return openbis.get_dataset_type(code)
@@ -1272,4 +1606,5 @@ class DatasetType(ObjectType):
             type_map=type_map,
             get_type=get_type,
             create_type=create_type,
+            snapshot=snapshot,
         )
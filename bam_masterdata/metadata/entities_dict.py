@@ -1,26 +1,120 @@
+import functools
+import hashlib
 import inspect
+import json
+import math
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 import click
 
 from bam_masterdata.logger import logger
 from bam_masterdata.utils import (
+    get_cache_dir,
     import_module,
     listdir_py_modules,
 )
 
 CLASS_DEFINITION_PATTERN = re.compile(r"^\s*class\s+(\w+)\s*\(.*\):")
 
+# Version of the cached dictionaries of the modules. Increase it when the output of `to_dict` changes
+# without changes in the `bam_masterdata.metadata` package.
+ENTITIES_CACHE_VERSION = 1
+
+
+def get_entities_cache_dir() -> Path:
+    """
+    Returns the directory where the dictionaries of the datamodel modules are cached.
+    """
+    return get_cache_dir() / "entities_dict"
+
+
+def clear_entities_cache(cache_dir: str | Path | None = None) -> int:
+    """
+    Deletes the cached dictionaries of the datamodel modules.
+
+    Args:
+        cache_dir (str | Path | None): The cache directory. Defaults to `get_entities_cache_dir()`.
+
+    Returns:
+        int: The number of deleted cache files.
+    """
+    cache_dir = Path(cache_dir) if cache_dir else get_entities_cache_dir()
+    n_deleted = 0
+    for cache_file in cache_dir.glob("*.json"):
+        cache_file.unlink(missing_ok=True)
+        n_deleted += 1
+    return n_deleted
+
+
+@functools.cache
+def _metadata_fingerprint() -> bytes:
+    """
+    Returns the hash of the source code of `bam_masterdata.metadata`, which defines how the entities are
+    converted to dictionaries, so that the cached dictionaries are invalidated when it changes.
+    """
+    digest = hashlib.sha256(str(ENTITIES_CACHE_VERSION).encode())
+    for source_path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(source_path.read_bytes())
+    return digest.digest()
+
+
+def module_source_hash(module_path: str) -> str:
+    """
+    Returns the hash identifying the dictionary of the entities of the `module_path` Python file, computed from
+    its source code and the source code of `bam_masterdata.metadata`.
+
+    Args:
+        module_path (str): Path to the Python module file.
+
+    Returns:
+        str: The hexadecimal SHA-256 hash.
+    """
+    digest = hashlib.sha256(_metadata_fingerprint())
+    with open(module_path, "rb") as module_file:
+        digest.update(module_file.read())
+    return digest.hexdigest()
+
+
+def _module_chunk_to_dict(module_path: str, chunk: tuple[int, int]) -> dict:
+    """
+    Returns the dictionary of the entities of the `chunk` of the `module_path` Python file. Used as the task of
+    the worker processes in `EntitiesDict.single_json`.
+    """
+    return EntitiesDict().to_dict(module_path=module_path, chunk=chunk)
+
 
 class EntitiesDict:
     """
     Class to convert the entities in the datamodel defined in Python to a dictionary. The entities are read from the Python
     files defined in `python_path`.
+
+    The Python modules can be processed in parallel by setting `workers` to the number of worker processes. The
+    entities of each module are then split in chunks of at most `chunk_size` classes, so that large modules are
+    shared between several workers. If `chunk_size` is not set, the classes of the datamodel are evenly split
+    between the workers.
+
+    If `use_cache` is True, the dictionary of each module is stored in `cache_dir` (defaults to
+    `get_entities_cache_dir()`) keyed by the hash of the module source, and only the modules whose source changed
+    are processed again. Note that changes in other modules imported by a datamodel module are not detected.
     """
 
-    def __init__(self, python_path: str = "", **kwargs):
+    def __init__(
+        self,
+        python_path: str = "",
+        workers: int = 1,
+        chunk_size: int | None = None,
+        use_cache: bool = False,
+        cache_dir: str | Path | None = None,
+        **kwargs,
+    ):
         self.python_path = python_path
+        self.workers = max(1, workers)
+        self.chunk_size = chunk_size
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else get_entities_cache_dir()
         self.logger = kwargs.get("logger", logger)
         self.data: dict = {}
 
@@ -83,7 +177,7 @@ class EntitiesDict:
             )
             item["row_location"] = entity_locations.get(attr_name)
 
-    def to_dict(self, module_path: str) -> dict:
+    def to_dict(self, module_path: str, chunk: tuple[int, int] | None = None) -> dict:
         """
         Returns a dictionary containing entities read from the `module_path` Python file. The Python modules
         are imported using the function `import_module` and their contents are inspected (using `inspect`) to
@@ -91,6 +185,9 @@ class EntitiesDict:
 
         Args:
             module_path (str): Path to the Python module file.
+            chunk (tuple[int, int] | None): If set as `(index, n_chunks)`, only the classes of the `index`-th of
+                `n_chunks` contiguous chunks of the module are processed. Merging the dictionaries of all the chunks
+                in order results in the dictionary of the whole module.
 
         Returns:
             dict: A dictionary containing the entities in the datamodel defined in one Python module file.
@@ -111,7 +208,15 @@ class EntitiesDict:
         )
 
         # Process all classes in the module
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        members = inspect.getmembers(module, inspect.isclass)
+        if chunk is not None:
+            index, n_chunks = chunk
+            members = members[
+                index * len(members) // n_chunks : (index + 1)
+                * len(members)
+                // n_chunks
+            ]
+        for name, obj in members:
             if not hasattr(obj, "defs") or not callable(getattr(obj, "model_to_dict")):
                 continue
             try:
@@ -172,11 +277,106 @@ class EntitiesDict:
             directory_path=self.python_path, logger=self.logger
         )
 
+        # Read the dictionaries of the unchanged modules from the cache
+        modules_data: dict[str, dict] = {}
+        cache_files: dict[str, Path] = {}
+        if self.use_cache:
+            for module_path in py_modules:
+                cache_files[module_path] = self._cache_file(module_path)
+                cached_data = self._read_cache(cache_files[module_path])
+                if cached_data is not None:
+                    modules_data[module_path] = cached_data
+
         # Process each module using the `model_to_dict` method of each entity and store them in a single dictionary
+        pending_modules = [
+            module_path for module_path in py_modules if module_path not in modules_data
+        ]
+        if self.workers > 1 and pending_modules:
+            pending_data = self._modules_to_dict_parallel(pending_modules)
+        else:
+            pending_data = [
+                self.to_dict(module_path=module_path) for module_path in pending_modules
+            ]
+        for module_path, data in zip(pending_modules, pending_data):
+            modules_data[module_path] = data
+            if self.use_cache:
+                self._write_cache(cache_files[module_path], data)
+
         full_data: dict = {}
         for module_path in py_modules:
-            data = self.to_dict(module_path=module_path)
             # name can be collection_type, object_type, dataset_type, vocabulary_type, or property_type
             name = os.path.basename(module_path).replace(".py", "")
-            full_data[name] = data
+            full_data[name] = modules_data[module_path]
         return full_data
+
+    def _cache_file(self, module_path: str) -> Path:
+        """
+        Returns the path of the cache file of the `module_path` Python file, named after the module and the hash
+        of its source code.
+        """
+        name = os.path.basename(module_path).replace(".py", "")
+        return self.cache_dir / f"{name}-{module_source_hash(module_path)}.json"
+
+    def _read_cache(self, cache_file: Path) -> dict | None:
+        """
+        Returns the cached dictionary stored in `cache_file`, or None if it does not exist or cannot be read.
+        """
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            self.logger.warning(f"Ignoring unreadable cache file {cache_file}: {err}")
+            return None
+
+    def _write_cache(self, cache_file: Path, data: dict) -> None:
+        """
+        Stores `data` in `cache_file`. The file is written atomically, so that concurrent runs never read a
+        partially written cache file.
+        """
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as err:
+            tmp_file.unlink(missing_ok=True)
+            self.logger.warning(f"Could not write the cache file {cache_file}: {err}")
+
+    def _modules_to_dict_parallel(self, py_modules: list[str]) -> list[dict]:
+        """
+        Returns the dictionaries of the entities of each module in `py_modules` processing the chunks of all the
+        modules in a pool of `workers` processes. The chunks are merged in order, so that the result is the
+        same as when processing the modules one after another.
+
+        Args:
+            py_modules (list[str]): Paths to the Python module files.
+
+        Returns:
+            list[dict]: The dictionaries of the entities of each module, in the order of `py_modules`.
+        """
+        # Split the modules in chunks using the number of classes defined in their source code
+        n_classes = [
+            len(self._collect_class_locations(self._read_module_source(module_path)))
+            for module_path in py_modules
+        ]
+        chunk_size = self.chunk_size or math.ceil(sum(n_classes) / self.workers)
+        n_chunks = [max(1, math.ceil(n / max(1, chunk_size))) for n in n_classes]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                [
+                    executor.submit(_module_chunk_to_dict, module_path, (index, n))
+                    for index in range(n)
+                ]
+                for module_path, n in zip(py_modules, n_chunks)
+            ]
+            modules_data = []
+            for module_futures in futures:
+                data: dict = {}
+                for future in module_futures:
+                    data.update(future.result())
+                modules_data.append(data)
+        return modules_data
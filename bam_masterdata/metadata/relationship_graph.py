@@ -0,0 +1,198 @@
+from collections import deque
+from collections.abc import Hashable, Iterator
+from typing import Any
+
+
+class RelationshipGraph:
+    """
+    Directed graph of parent-child relationships stored as adjacency lists. Each node key is interned to an
+    integer id on first use, so that the parents and children of a node are O(1) lookups. The parents and
+    children of a node keep the order in which the relationships were added.
+
+    A node can carry a value different from its key, e.g., the dictionary used to fetch an object from
+    openBIS keyed by its `generate_dict_id` string, which is returned by the queries instead of the key.
+    """
+
+    def __init__(self):
+        self._ids: dict[Hashable, int] = {}
+        self._values: list[Any] = []
+        # ordered sets of the integer ids of the parents and children of each node
+        self._parents: list[dict[int, None]] = []
+        self._children: list[dict[int, None]] = []
+        # integer ids of the removed nodes, which are not reused
+        self._removed: set[int] = set()
+        self._num_edges = 0
+
+    def __len__(self) -> int:
+        return self._num_edges
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._ids
+
+    def add_node(self, key: Hashable, value: Any = None) -> int:
+        """
+        Adds a node to the graph, if it does not exist yet.
+
+        Args:
+            key (Hashable): The key of the node.
+            value (Any): The value returned for the node by the queries. If None, the key is used.
+
+        Returns:
+            int: The integer id of the node.
+        """
+        node = self._ids.get(key)
+        if node is None:
+            node = len(self._values)
+            self._ids[key] = node
+            self._values.append(key if value is None else value)
+            self._parents.append({})
+            self._children.append({})
+        return node
+
+    def add_edge(
+        self,
+        parent: Hashable,
+        child: Hashable,
+        parent_value: Any = None,
+        child_value: Any = None,
+    ) -> None:
+        """
+        Adds a parent-child relationship, adding the nodes if they do not exist yet.
+
+        Args:
+            parent (Hashable): The key of the parent node.
+            child (Hashable): The key of the child node.
+            parent_value (Any): The value of the parent node, if it is added. If None, the key is used.
+            child_value (Any): The value of the child node, if it is added. If None, the key is used.
+        """
+        parent_node = self.add_node(parent, parent_value)
+        child_node = self.add_node(child, child_value)
+        if child_node not in self._children[parent_node]:
+            self._children[parent_node][child_node] = None
+            self._parents[child_node][parent_node] = None
+            self._num_edges += 1
+
+    def remove_node(self, key: Hashable) -> None:
+        """
+        Removes a node and all its relationships, if it exists.
+
+        Args:
+            key (Hashable): The key of the node.
+        """
+        node = self._ids.pop(key, None)
+        if node is None:
+            return
+        for parent in self._parents[node]:
+            del self._children[parent][node]
+        for child in self._children[node]:
+            del self._parents[child][node]
+        self._num_edges -= len(self._parents[node]) + len(self._children[node])
+        self._parents[node] = {}
+        self._children[node] = {}
+        self._values[node] = None
+        self._removed.add(node)
+
+    def clear(self) -> None:
+        """
+        Removes all the nodes and relationships.
+        """
+        self._ids.clear()
+        self._values.clear()
+        self._parents.clear()
+        self._children.clear()
+        self._removed.clear()
+        self._num_edges = 0
+
+    def remove_edge(self, parent: Hashable, child: Hashable) -> None:
+        """
+        Removes a parent-child relationship. The nodes are kept in the graph.
+
+        Args:
+            parent (Hashable): The key of the parent node.
+            child (Hashable): The key of the child node.
+        """
+        parent_node = self._ids.get(parent)
+        child_node = self._ids.get(child)
+        if parent_node is None or child_node is None:
+            return
+        if self._children[parent_node].pop(child_node, False) is None:
+            del self._parents[child_node][parent_node]
+            self._num_edges -= 1
+
+    def parents(self, key: Hashable) -> list[Any]:
+        """
+        Returns the values of the parents of a node.
+
+        Args:
+            key (Hashable): The key of the node.
+
+        Returns:
+            list[Any]: The values of the parent nodes, empty if the node does not exist.
+        """
+        node = self._ids.get(key)
+        if node is None:
+            return []
+        return [self._values[parent] for parent in self._parents[node]]
+
+    def children(self, key: Hashable) -> list[Any]:
+        """
+        Returns the values of the children of a node.
+
+        Args:
+            key (Hashable): The key of the node.
+
+        Returns:
+            list[Any]: The values of the child nodes, empty if the node does not exist.
+        """
+        node = self._ids.get(key)
+        if node is None:
+            return []
+        return [self._values[child] for child in self._children[node]]
+
+    def _topological_nodes(self) -> Iterator[int]:
+        """
+        Yields the integer ids of the nodes with the parents before their children (Kahn's algorithm). Nodes
+        without pending parents are yielded in the order in which they were added. Nodes in a cycle, or
+        depending on one, are never yielded.
+        """
+        in_degree = [len(parents) for parents in self._parents]
+        queue = deque(
+            node
+            for node, degree in enumerate(in_degree)
+            if degree == 0 and node not in self._removed
+        )
+        while queue:
+            node = queue.popleft()
+            yield node
+            for child in self._children[node]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+
+    def has_cycle(self) -> bool:
+        """
+        Checks if the relationships contain a cycle, e.g., an object being its own ancestor.
+
+        Returns:
+            bool: True if there is a cycle, False otherwise.
+        """
+        return sum(1 for _ in self._topological_nodes()) != len(self._ids)
+
+    def topological_order(self) -> Iterator[Any]:
+        """
+        Iterates over the values of the nodes with every parent before its children.
+
+        Raises:
+            ValueError: If the relationships contain a cycle.
+
+        Yields:
+            Any: The value of each node.
+        """
+        visited = 0
+        for node in self._topological_nodes():
+            visited += 1
+            yield self._values[node]
+        if visited != len(self._ids):
+            raise ValueError(
+                "The relationships contain a cycle, so they cannot be ordered topologically."
+            )
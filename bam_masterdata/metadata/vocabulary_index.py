@@ -0,0 +1,184 @@
+import inspect
+import os
+import threading
+
+from bam_masterdata.metadata.definitions import VocabularyTerm, VocabularyTypeDef
+from bam_masterdata.utils import (
+    DATAMODEL_DIR,
+    code_to_class_name,
+    import_module,
+    listdir_py_modules,
+)
+
+
+class VocabularyIndex:
+    """
+    Index mapping each vocabulary type defined in a `vocabulary_types.py` module to the frozen set of
+    its term codes. The index is built lazily on first use, so that term membership checks are O(1)
+    lookups, and it is only rebuilt after calling `invalidate()`, e.g., when the module is rewritten.
+    """
+
+    def __init__(self, vocab_path: str):
+        self.vocab_path = os.path.abspath(vocab_path)
+        self._lock = threading.Lock()
+        self._built = False
+        self._reload = False
+        self._terms_by_code: dict[str, frozenset[str]] = {}
+        self._terms_by_class_name: dict[str, frozenset[str]] = {}
+        self._resolved: dict[str, frozenset[str] | None] = {}
+
+    def _build(self) -> None:
+        """
+        Imports the vocabulary module and stores the term codes of each vocabulary type, including the
+        terms inherited from parent vocabulary types.
+        """
+        module = import_module(self.vocab_path, reload=self._reload)
+        terms_by_code: dict[str, frozenset[str]] = {}
+        terms_by_class_name: dict[str, frozenset[str]] = {}
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            defs = getattr(obj, "defs", None)
+            if not isinstance(defs, VocabularyTypeDef):
+                continue
+            terms = frozenset(
+                attr_val.code
+                for base in obj.__mro__
+                for attr_val in base.__dict__.values()
+                if isinstance(attr_val, VocabularyTerm)
+            )
+            terms_by_code[defs.code] = terms
+            terms_by_class_name[name] = terms
+        self._terms_by_code = terms_by_code
+        self._terms_by_class_name = terms_by_class_name
+        self._resolved = {}
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        with self._lock:
+            if not self._built:
+                self._build()
+                self._built = True
+                self._reload = False
+
+    def invalidate(self) -> None:
+        """
+        Marks the index as outdated, so that the vocabulary module is executed again and the index rebuilt on
+        the next lookup.
+        """
+        with self._lock:
+            self._built = False
+            self._reload = True
+
+    @property
+    def vocabulary_codes(self) -> frozenset[str]:
+        """
+        Codes of all the vocabulary types stored in the index.
+        """
+        self._ensure_built()
+        return frozenset(self._terms_by_code)
+
+    def terms(self, vocabulary_code: str) -> frozenset[str] | None:
+        """
+        Returns the term codes of the vocabulary type defined by `vocabulary_code`. The vocabulary type is
+        first searched by its `code` and, if not found, by its class name as resolved by `code_to_class_name`.
+
+        Args:
+            vocabulary_code (str): Code of the vocabulary type.
+
+        Returns:
+            frozenset[str] | None: The term codes of the vocabulary type, or None if it is not found.
+        """
+        self._ensure_built()
+        try:
+            return self._resolved[vocabulary_code]
+        except KeyError:
+            pass
+        terms = self._terms_by_code.get(vocabulary_code)
+        if terms is None:
+            terms = self._terms_by_class_name.get(code_to_class_name(vocabulary_code))
+        self._resolved[vocabulary_code] = terms
+        return terms
+
+    def is_term(self, vocabulary_code: str, value) -> bool:
+        """
+        Checks if `value` is one of the term codes of the vocabulary type defined by `vocabulary_code`.
+
+        Args:
+            vocabulary_code (str): Code of the vocabulary type.
+            value: The value to check.
+
+        Returns:
+            bool: True if `value` is a term of the vocabulary type, False otherwise or if the vocabulary
+            type is not found.
+        """
+        terms = self.terms(vocabulary_code)
+        if terms is None:
+            return False
+        try:
+            return value in terms
+        except TypeError:  # unhashable values can never be term codes
+            return False
+
+
+# Process-wide indexes, one per datamodel directory
+_VOCABULARY_INDEXES: dict[str, VocabularyIndex] = {}
+_VOCABULARY_INDEXES_LOCK = threading.Lock()
+
+
+def get_vocabulary_index(datamodel_dir: str = DATAMODEL_DIR) -> VocabularyIndex:
+    """
+    Returns the process-wide `VocabularyIndex` for the `vocabulary_types.py` module found in `datamodel_dir`.
+
+    Args:
+        datamodel_dir (str): The directory containing the datamodel Python modules. Default is `DATAMODEL_DIR`.
+
+    Raises:
+        FileNotFoundError: If no `vocabulary_types.py` module is found in `datamodel_dir`.
+
+    Returns:
+        VocabularyIndex: The index of the vocabulary types defined in `datamodel_dir`.
+    """
+    key = os.path.abspath(datamodel_dir)
+    index = _VOCABULARY_INDEXES.get(key)
+    if index is not None:
+        return index
+
+    with _VOCABULARY_INDEXES_LOCK:
+        index = _VOCABULARY_INDEXES.get(key)
+        if index is None:
+            vocab_path = None
+            for file in listdir_py_modules(datamodel_dir):
+                if "vocabulary_types.py" in file:
+                    vocab_path = file
+                    break
+            if vocab_path is None:
+                raise FileNotFoundError(
+                    f"The file 'vocabulary_types.py' was not found in the directory specified by {datamodel_dir}."
+                )
+            index = VocabularyIndex(vocab_path)
+            _VOCABULARY_INDEXES[key] = index
+    return index
+
+
+def get_vocabulary_terms(
+    vocabulary_code: str, datamodel_dir: str = DATAMODEL_DIR
+) -> frozenset[str] | None:
+    """
+    Returns the term codes of the vocabulary type defined by `vocabulary_code` in `datamodel_dir`.
+
+    Args:
+        vocabulary_code (str): Code of the vocabulary type.
+        datamodel_dir (str): The directory containing the datamodel Python modules. Default is `DATAMODEL_DIR`.
+
+    Returns:
+        frozenset[str] | None: The term codes of the vocabulary type, or None if it is not found.
+    """
+    return get_vocabulary_index(datamodel_dir).terms(vocabulary_code)
+
+
+def clear_vocabulary_indexes() -> None:
+    """
+    Drops all the process-wide vocabulary indexes. They will be rebuilt on the next lookup.
+    """
+    with _VOCABULARY_INDEXES_LOCK:
+        _VOCABULARY_INDEXES.clear()
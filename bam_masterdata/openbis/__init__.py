@@ -1 +1,2 @@
 from .get_entities import OpenbisEntities
+from .snapshot import OpenbisSnapshot
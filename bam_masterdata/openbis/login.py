@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 from decouple import config as environ
-from pybis import Openbis
+
+if TYPE_CHECKING:
+    from pybis import Openbis
 
 
 # Connect to openBIS
-def ologin(url: str | Openbis = "") -> Openbis:
+def ologin(url: "str | Openbis" = "") -> "Openbis":
     """
     Connect to openBIS using the credentials stored in the environment variables.
 
@@ -16,8 +20,10 @@ def ologin(url: str | Openbis = "") -> Openbis:
     Returns:
         Openbis: Openbis object for the specific openBIS instance defined in `URL`.
     """
-    if not isinstance(url, Openbis):
-        o = Openbis(url)
+    # pyBIS (and pandas) are only imported when connecting to openBIS
+    from pybis import Openbis
+
+    o = url if isinstance(url, Openbis) else Openbis(url)
 
     if not o.is_session_active():
         o.login(
@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pybis import Openbis
+
+
+class OpenbisSnapshot:
+    """
+    Codes of the entity types existing in an openBIS instance. Each kind of entity type is listed once from
+    openBIS on first use, and its codes are then updated locally as new entity types are created, so that
+    synchronizing a whole datamodel does not download the listings of openBIS for every pushed entity.
+
+    Args:
+        openbis (Openbis): An instance of the Openbis class from pyBIS, already logged in.
+    """
+
+    def __init__(self, openbis: "Openbis"):
+        self.openbis = openbis
+        self._codes: dict[str, set[str]] = {}
+
+    def codes(self, entity_name: str) -> set[str]:
+        """
+        Returns the codes of the entity types of a kind existing in openBIS, listing them only the first time.
+
+        Args:
+            entity_name (str): The kind of entity types, i.e., `property_types`, `collection_types`,
+                `dataset_types`, `object_types`, or `vocabularies`.
+
+        Returns:
+            set[str]: The codes of the existing entity types.
+        """
+        codes = self._codes.get(entity_name)
+        if codes is None:
+            entities = getattr(self.openbis, f"get_{entity_name}")()
+            codes = {str(code) for code in entities.df.get("code", [])}
+            self._codes[entity_name] = codes
+        return codes
+
+    def exists(self, entity_name: str, code: str) -> bool:
+        """
+        Checks if an entity type exists in openBIS.
+
+        Args:
+            entity_name (str): The kind of entity types, e.g., `object_types`.
+            code (str): The code of the entity type.
+
+        Returns:
+            bool: True if the entity type exists, False otherwise.
+        """
+        return code in self.codes(entity_name)
+
+    def add(self, entity_name: str, code: str) -> None:
+        """
+        Records an entity type created in openBIS, without listing the entity types again.
+
+        Args:
+            entity_name (str): The kind of entity types, e.g., `object_types`.
+            code (str): The code of the created entity type.
+        """
+        self.codes(entity_name).add(code)
+
+    def refresh(self, entity_name: str | None = None) -> None:
+        """
+        Discards the listed codes, so that they are listed again from openBIS on the next use.
+
+        Args:
+            entity_name (str | None): The kind of entity types to refresh. If None, all of them are refreshed.
+        """
+        if entity_name is None:
+            self._codes.clear()
+        else:
+            self._codes.pop(entity_name, None)
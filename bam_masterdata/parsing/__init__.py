@@ -1 +1 @@
-from .parsing import AbstractParser
+from .parsing import AbstractParser, StreamingParser
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
-from bam_masterdata.metadata.entities import CollectionType
+from bam_masterdata.metadata.entities import CollectionType, ObjectType
 
 if TYPE_CHECKING:
     from structlog._config import BoundLoggerLazyProxy
@@ -30,3 +31,59 @@ class AbstractParser(ABC):
             logger (BoundLoggerLazyProxy): Logger for logging messages during parsing.
         """
         pass
+
+
+class StreamingParser(AbstractParser):
+    """
+    Abstract base class for parsers yielding the parsed objects and relationships incrementally, instead of
+    populating a whole `CollectionType` first. Each streaming parser should inherit from this class and
+    implement the `parse_stream()` method.
+
+    Streaming parsers can be used everywhere as any other parser, and with `run_parser_pipelined` the objects
+    are uploaded to openBIS while the rest of the files are still being parsed.
+    """
+
+    @abstractmethod
+    def parse_stream(
+        self,
+        files: list[str],
+        logger: "BoundLoggerLazyProxy",
+    ) -> Iterator[ObjectType | tuple[ObjectType | dict, ObjectType | dict]]:
+        """
+        Parse the input `files` and yield the parsed object types and their relationships.
+
+        Args:
+            files (list[str]): List of file paths to be parsed.
+            logger (BoundLoggerLazyProxy): Logger for logging messages during parsing.
+
+        Yields:
+            ObjectType | tuple[ObjectType | dict, ObjectType | dict]: Either a parsed object type, or a
+            (parent, child) relationship between object types yielded before or dictionaries readable by
+            `openbis.get_object` for objects already in openBIS.
+        """
+        pass
+
+    def parse(
+        self,
+        files: list[str],
+        collection: CollectionType,
+        logger: "BoundLoggerLazyProxy",
+    ) -> None:
+        """
+        Parse the input `files` and populate the provided `collection` with the object types and the
+        relationships yielded by `parse_stream()`.
+
+        Args:
+            files (list[str]): List of file paths to be parsed.
+            collection (CollectionType): Collection to be populated with parsed data.
+            logger (BoundLoggerLazyProxy): Logger for logging messages during parsing.
+        """
+        for item in self.parse_stream(files, logger=logger):
+            if isinstance(item, tuple):
+                parent, child = (
+                    obj if isinstance(obj, dict) else collection.id_of(obj)
+                    for obj in item
+                )
+                collection.add_relationship(parent, child)
+            else:
+                collection.add(item)
@@ -1,4 +1,4 @@
-from .paths import DATAMODEL_DIR, VALIDATION_RULES_DIR, find_dir
+from .paths import DATAMODEL_DIR, VALIDATION_RULES_DIR, find_dir, get_cache_dir
 from .utils import (
     code_to_class_name,
     convert_enums,
@@ -6,6 +6,7 @@ from .utils import (
     duplicated_property_types,
     format_json_id,
     import_module,
+    invalidate_module_cache,
     is_reduced_version,
     listdir_py_modules,
     load_validation_rules,
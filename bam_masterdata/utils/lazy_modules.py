@@ -0,0 +1,205 @@
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import re
+import sys
+import threading
+from types import ModuleType
+
+# Top-level class definition written in one line, as in the modules generated by `MasterdataCodeGenerator`
+TOP_LEVEL_CLASS_PATTERN = re.compile(r"^class\s+(\w+)\s*(?:\(([^()]*)\))?\s*:")
+
+
+class ClassSpan:
+    """
+    Lines of the source code of a top-level class of a module, and the names of its bases.
+
+    Args:
+        start (int): The first line (1-based) of the class definition.
+        end (int): The last line (1-based, inclusive) of the class definition.
+        bases (tuple[str, ...]): The names used in the list of bases of the class.
+    """
+
+    __slots__ = ("bases", "end", "start")
+
+    def __init__(self, start: int, end: int, bases: tuple[str, ...]):
+        self.start = start
+        self.end = end
+        self.bases = bases
+
+
+def index_class_spans(
+    source_lines: list[str],
+) -> tuple[int, dict[str, ClassSpan]] | None:
+    """
+    Indexes the top-level classes of a module source. The source must consist of a header (imports, docstring,
+    comments) followed only by class definitions without decorators.
+
+    Args:
+        source_lines (list[str]): The lines of the module source code.
+
+    Returns:
+        tuple[int, dict[str, ClassSpan]] | None: The number of lines of the header and the span of each class, or
+        None if the module contains other top-level statements after the first class and has to be executed
+        as a whole.
+    """
+    header_end = len(source_lines)
+    spans: dict[str, ClassSpan] = {}
+    current: tuple[str, int, tuple[str, ...]] | None = None
+    last_code_line = 0
+
+    for line_number, line in enumerate(source_lines, start=1):
+        if not line or line[0] in " \t\r\n#":
+            # indented lines belong to the current class, blank lines and comments are skipped
+            if line[:1] in (" ", "\t") and line.strip() and current is not None:
+                last_code_line = line_number
+            continue
+
+        match = TOP_LEVEL_CLASS_PATTERN.match(line)
+        if match is None:
+            if current is None:
+                continue  # header statement
+            return None
+
+        if current is None:
+            header_end = line_number - 1
+        else:
+            name, start, bases = current
+            spans[name] = ClassSpan(start, last_code_line, bases)
+        bases = tuple(re.findall(r"\w+", match.group(2) or ""))
+        current = (match.group(1), line_number, bases)
+        last_code_line = line_number
+
+    if current is not None:
+        name, start, bases = current
+        spans[name] = ClassSpan(start, last_code_line, bases)
+    return header_end, spans
+
+
+class LazyClassLoader(importlib.abc.Loader):
+    """
+    Loader executing only the header of a module on import, and each top-level class on first attribute access
+    through the module-level `__getattr__` (PEP 562). The bases of a class are built before the class itself.
+
+    Listing the module with `dir()` returns all the class names, so `inspect.getmembers` and `from module
+    import *` build and return every class as when the module is executed eagerly.
+
+    Args:
+        origin (str): The path of the module source file.
+    """
+
+    def __init__(self, origin: str):
+        self.origin = origin
+
+    def create_module(self, spec):
+        return None
+
+    def get_filename(self, fullname: str | None = None) -> str:
+        return self.origin
+
+    def get_source(self, fullname: str | None = None) -> str:
+        with open(self.origin, encoding="utf-8") as f:
+            return f.read()
+
+    def exec_module(self, module: ModuleType) -> None:
+        source_lines = self.get_source().splitlines(keepends=True)
+        index = index_class_spans(source_lines)
+        if index is None:
+            exec(compile("".join(source_lines), self.origin, "exec"), module.__dict__)
+            return
+
+        header_end, spans = index
+        namespace = module.__dict__
+        # classes built before a reload are rebuilt from the new source
+        for name in spans:
+            namespace.pop(name, None)
+        exec(
+            compile("".join(source_lines[:header_end]), self.origin, "exec"), namespace
+        )
+        header_names = [name for name in namespace if not name.startswith("_")]
+        lock = threading.RLock()
+
+        def build_class(name: str):
+            with lock:
+                if name in namespace:
+                    return namespace[name]
+                span = spans[name]
+                for base in span.bases:
+                    if base in spans and base != name:
+                        build_class(base)
+                # blank lines keep the line numbers of the source file in tracebacks and `inspect`
+                code = compile(
+                    "\n" * (span.start - 1)
+                    + "".join(source_lines[span.start - 1 : span.end]),
+                    self.origin,
+                    "exec",
+                )
+                while True:
+                    try:
+                        exec(code, namespace)
+                        break
+                    except NameError as err:
+                        # name used in the class body defined by another class of the module
+                        if err.name not in spans or err.name in namespace:
+                            raise
+                        build_class(err.name)
+                return namespace[name]
+
+        def __getattr__(name: str):
+            if name in spans:
+                return build_class(name)
+            raise AttributeError(
+                f"module {module.__name__!r} has no attribute {name!r}"
+            )
+
+        def __dir__() -> list[str]:
+            return sorted(set(namespace) | set(spans))
+
+        namespace["__getattr__"] = __getattr__
+        namespace["__dir__"] = __dir__
+        namespace["__all__"] = header_names + list(spans)
+
+
+class LazyModuleFinder(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder loading the (non-package) submodules of `package` with `LazyClassLoader`.
+
+    Args:
+        package (str): The name of the package, e.g., `bam_masterdata.datamodel`.
+    """
+
+    def __init__(self, package: str):
+        self.package = package
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        if not fullname.startswith(f"{self.package}."):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if (
+            spec is None
+            or spec.submodule_search_locations is not None
+            or not (spec.origin or "").endswith(".py")
+        ):
+            return spec
+        return importlib.util.spec_from_file_location(
+            fullname, spec.origin, loader=LazyClassLoader(spec.origin)
+        )
+
+
+def install_lazy_modules(package: str) -> None:
+    """
+    Loads the classes of the submodules of `package` lazily, unless the environment variable
+    `BAM_MASTERDATA_EAGER_DATAMODEL` is set. Submodules imported before calling this function are not affected.
+
+    Args:
+        package (str): The name of the package, e.g., `bam_masterdata.datamodel`.
+    """
+    if os.environ.get("BAM_MASTERDATA_EAGER_DATAMODEL"):
+        return
+    if any(
+        isinstance(finder, LazyModuleFinder) and finder.package == package
+        for finder in sys.meta_path
+    ):
+        return
+    sys.meta_path.insert(0, LazyModuleFinder(package))
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 
@@ -41,3 +42,18 @@ DATAMODEL_DIR = find_dir(possible_locations=DIRECTORIES["datamodel"])
 VALIDATION_RULES_DIR = find_dir(
     possible_locations=DIRECTORIES["validation_rules_checker"]
 )
+
+
+def get_cache_dir() -> Path:
+    """
+    Returns the directory where `bam_masterdata` stores its cached files. It can be set with the environment
+    variable `BAM_MASTERDATA_CACHE_DIR`, and defaults to `bam_masterdata` in the user cache directory
+    (`$XDG_CACHE_HOME` or `~/.cache`).
+
+    Returns:
+        Path: The path of the cache directory (it may not exist yet).
+    """
+    if cache_dir := os.environ.get("BAM_MASTERDATA_CACHE_DIR"):
+        return Path(cache_dir)
+    user_cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(user_cache_dir) / "bam_masterdata"
@@ -5,8 +5,10 @@ import json
 import os
 import re
 import shutil
+import threading
 from enum import Enum
 from itertools import chain
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 from bam_masterdata.logger import logger
@@ -93,23 +95,61 @@ def listdir_py_modules(
     )
 
 
-def import_module(module_path: str) -> Any:
+# Modules executed by `import_module`, keyed by their absolute path and storing the signature
+# (modification time and size) of the file when it was executed
+_IMPORTED_MODULES: dict[str, tuple[tuple[int, int], ModuleType]] = {}
+_IMPORTED_MODULES_LOCK = threading.Lock()
+
+
+def import_module(module_path: str, reload: bool = False) -> Any:
     """
-    Dynamically imports a module from the given file path.
+    Dynamically imports a module from the given file path. The module is executed only once and cached
+    while the modification time and the size of the file do not change. The module is not registered
+    in `sys.modules`.
 
     Args:
         module_path (str): Path to the Python module file.
+        reload (bool): If True, the module is executed again even if it is cached. Default is False.
 
     Returns:
         module: Imported module object.
     """
-    module_name = os.path.splitext(os.path.basename(module_path))[0]
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    key = os.path.abspath(module_path)
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _IMPORTED_MODULES.get(key)
+    if not reload and cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _IMPORTED_MODULES_LOCK:
+        cached = _IMPORTED_MODULES.get(key)
+        if not reload and cached is not None and cached[0] == signature:
+            return cached[1]
+        module_name = os.path.splitext(os.path.basename(module_path))[0]
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _IMPORTED_MODULES[key] = (signature, module)
     return module
 
 
+def invalidate_module_cache(module_path: str | None = None) -> None:
+    """
+    Drops the modules cached by `import_module`, so that they are executed again on the next import. This
+    is needed when a module is rewritten (e.g., by the code generator) without changing its modification
+    time or size.
+
+    Args:
+        module_path (str | None): Path to the Python module file to invalidate. If None, all the cached
+            modules are invalidated. Default is None.
+    """
+    with _IMPORTED_MODULES_LOCK:
+        if module_path is None:
+            _IMPORTED_MODULES.clear()
+        else:
+            _IMPORTED_MODULES.pop(os.path.abspath(module_path), None)
+
+
 def code_to_class_name(
     code: str | None,
     logger: "BoundLoggerLazyProxy" = logger,
@@ -274,12 +314,10 @@ def store_log_message(logger, entity_ref, message, level="error"):
         message (str): The log message.
         level (str): Log level ('error', 'warning', 'critical', 'info').
     """
-    log_function = {
-        "error": logger.error,
-        "warning": logger.warning,
-        "critical": logger.critical,
-        "info": logger.info,
-    }.get(level, logger.error)
+    # Only the logging method of `level` is resolved, as each attribute access binds a new logger
+    log_function = getattr(
+        logger, level if level in ("error", "warning", "critical", "info") else "error"
+    )
 
     # Log the message
     log_function(message)
@@ -0,0 +1,123 @@
+import pytest
+
+from bam_masterdata.checker.masterdata_validator import (
+    AssignmentsIndex,
+    MasterdataValidator,
+    compile_field_rule,
+    compile_validation_rules,
+)
+
+
+@pytest.mark.parametrize(
+    "rule, value, result",
+    [
+        # pattern
+        ({"pattern": "^[A-Z_]+$"}, "CODE_1", [("Invalid format.", "error")]),
+        ({"pattern": "^[A-Z_]+$"}, "CODE", []),
+        ({"pattern": "^[A-Z_]+$"}, None, []),
+        # description and section patterns are warnings
+        (
+            {"pattern": "^.+//.+$", "is_description": True},
+            "Only English",
+            [
+                (
+                    "Invalid format. Description should follow the schema: English Description + '//' + German Description. ",
+                    "warning",
+                )
+            ],
+        ),
+        # boolean
+        ({"is_bool": True}, "True", []),
+        ({"is_bool": True}, "yes", [("Expected a boolean.", "error")]),
+        # data types
+        ({"is_data": True}, "VARCHAR", []),
+        ({"is_data": True}, "OBJECT:INSTRUMENT", []),
+        (
+            {"is_data": True},
+            "OBJECT:",
+            [("The Data Type should be one of the following", "error")],
+        ),
+        # empty values
+        ({"pattern": "^[A-Z_]+$", "allow_empty": True}, "", []),
+        ({"is_bool": True, "allow_empty": True}, None, []),
+    ],
+)
+def test_compile_field_rule(rule: dict, value, result: list):
+    """Test the compiled validator of a field rule."""
+    validator = compile_field_rule(rule)
+    failures = validator(value)
+    assert len(failures) == len(result)
+    for (message, level), (expected_message, expected_level) in zip(failures, result):
+        assert message.startswith(expected_message)
+        assert level == expected_level
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        {},
+        {"pattern": ".*"},
+        {"allow_empty": True},
+        {"extra_validation": "is_reduced_version"},
+    ],
+)
+def test_compile_field_rule_cannot_fail(rule: dict):
+    """Test that rules that cannot fail are not compiled into validators."""
+    assert compile_field_rule(rule) is None
+
+
+def test_compile_validation_rules():
+    """Test that only the fields with failing checks are kept per rule type."""
+    compiled = compile_validation_rules(
+        {
+            "defs_validation": {
+                "code": {"pattern": "^[A-Z_]+$"},
+                "description": {"pattern": ".*"},
+            },
+            "terms_validation": {"url_template": {"allow_empty": True}},
+        }
+    )
+    assert list(compiled) == ["defs_validation", "terms_validation"]
+    assert list(compiled["defs_validation"]) == ["code"]
+    assert compiled["terms_validation"] == {}
+
+
+def test_assignments_index():
+    """Test the index of the assigned properties of the entities of one entity type."""
+    index = AssignmentsIndex(
+        {
+            "A": {"properties": [{"code": "P1"}, {"code": "P2"}]},
+            "B": {"properties": [{"code": "P2"}, {"code": "P1"}]},
+            "C": {"properties": [{"code": "P1"}]},
+        }
+    )
+    assert index.entities_by_codes[frozenset({"P1", "P2"})] == ["A", "B"]
+    assert index.entities_by_codes[frozenset({"P1"})] == ["C"]
+    assert list(index.assignments["B"]) == ["P2", "P1"]
+
+
+def test_compare_same_assigned_properties():
+    """Test that incoming entities with the same properties as other existing entities are reported."""
+    properties = [{"code": "P1", "row_location": 2}, {"code": "P2", "row_location": 3}]
+    current_model = {
+        "object_types": {
+            code: {"defs": {"code": code}, "properties": properties}
+            for code in ["A", "B", "C"]
+        }
+    }
+    new_entities = {
+        "object_types": {
+            "B": {"defs": {"code": "B", "row_location": 1}, "properties": properties},
+            "D": {"defs": {"code": "D", "row_location": 5}, "properties": properties},
+        }
+    }
+    validator = MasterdataValidator(new_entities, current_model, {})
+    results = validator.validate(mode="compare")
+    messages = {
+        code: [message for _, message in entity["_log_msgs"]]
+        for code, entity in results["comparisons"]["object_types"].items()
+    }
+    assert len(messages["B"]) == 2
+    assert "same properties defined as A" in messages["B"][0]
+    assert "same properties defined as C" in messages["B"][1]
+    assert len(messages["D"]) == 3
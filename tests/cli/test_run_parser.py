@@ -1,12 +1,30 @@
+import threading
 from unittest.mock import MagicMock
 
-from bam_masterdata.cli.run_parser import run_parser
-from bam_masterdata.logger import log_storage
+import pytest
+
+from bam_masterdata.cli.run_parser import (
+    _commit_objects,
+    _get_existing_objects,
+    _link_parents,
+    _parser_init,
+    _stream_parsed_items,
+    _upload_datasets,
+    run_parser,
+    run_parser_pipelined,
+)
+from bam_masterdata.logger import log_storage, logger
+from bam_masterdata.metadata.entities import CollectionType
+from bam_masterdata.parsing import StreamingParser
 from tests.conftest import (
+    InstrumentObjectType,
+    PersonObjectType,
     TestParser,
     TestParserWithObjectReference,
+    TestParserWithRelationship,
+    TestStreamingParser,
     # TestParserWithExistingCode,
-    # TestParserWithRelationship,
+    generate_object_type,
 )
 
 
@@ -165,3 +183,345 @@ def test_run_parser_defaults_to_collection_type(cleared_log_storage, mock_openbi
 
 
 # TODO add other tests for the different situations in `run_parser()` and parsers from `conftest.py`
+
+
+def test_get_existing_objects(cleared_log_storage):
+    """Test that `_get_existing_objects` searches the codes in bulk and in chunks."""
+    openbis = MagicMock()
+
+    def get_objects_mock(space, project, collection, code):
+        if "FAIL" in code:
+            raise ValueError("Request too large")
+        return [MagicMock(code=c) for c in code if c.startswith("EXISTING")]
+
+    openbis.get_objects.side_effect = get_objects_mock
+    existing_objects = _get_existing_objects(
+        openbis,
+        codes=[
+            "existing_1",
+            "NEW_1",
+            "EXISTING_2",
+            "EXISTING_1",
+            None,
+            "NEW_2",
+            "FAIL",
+        ],
+        space="SPACE",
+        project="PROJECT",
+        chunk_size=2,
+    )
+
+    assert openbis.get_objects.call_count == 3
+    assert list(existing_objects) == ["EXISTING_1", "EXISTING_2"]
+    assert any(
+        "Failed to search 1 objects" in log["event"] for log in cleared_log_storage
+    )
+
+
+def mock_transactions(fail: callable) -> MagicMock:
+    """
+    Returns a mocked openBIS whose transactions record the committed objects and fail if `fail` returns
+    True for the list of objects in the transaction.
+    """
+    openbis = MagicMock()
+    openbis._commits = []
+
+    def new_transaction():
+        transaction = MagicMock()
+        objects = []
+        transaction.add.side_effect = objects.append
+
+        def commit():
+            openbis._commits.append(list(objects))
+            if fail(objects):
+                raise ValueError("Transaction failed")
+
+        transaction.commit.side_effect = commit
+        return transaction
+
+    openbis.new_transaction.side_effect = new_transaction
+    return openbis
+
+
+def test_commit_objects_retry(cleared_log_storage):
+    """Test that `_commit_objects` retries a failed transaction."""
+    openbis = mock_transactions(fail=lambda objects: len(openbis._commits) < 3)
+    objects = [(f"/S/P/OBJ_{i}", f"obj_{i}") for i in range(4)]
+
+    assert _commit_objects(openbis, objects, max_retries=2, retry_delay=0) == []
+    assert len(openbis._commits) == 3
+    assert openbis._commits[-1] == ["obj_0", "obj_1", "obj_2", "obj_3"]
+
+
+def test_commit_objects_bisect(cleared_log_storage):
+    """Test that `_commit_objects` splits a failing transaction to isolate the failing objects."""
+    openbis = mock_transactions(fail=lambda objects: "obj_2" in objects)
+    objects = [(f"/S/P/OBJ_{i}", f"obj_{i}") for i in range(5)]
+
+    assert _commit_objects(openbis, objects, max_retries=1, retry_delay=0) == [
+        "/S/P/OBJ_2"
+    ]
+    committed = [
+        obj for commit in openbis._commits if "obj_2" not in commit for obj in commit
+    ]
+    assert sorted(committed) == ["obj_0", "obj_1", "obj_3", "obj_4"]
+    assert any(
+        "Failed to commit object /S/P/OBJ_2" in log["event"]
+        for log in cleared_log_storage
+    )
+
+
+def test_upload_datasets():
+    """Test that `_upload_datasets` uploads the datasets concurrently and keeps the order of the results."""
+    openbis = MagicMock()
+    # every upload waits for the other two, so this only passes if they run at the same time
+    barrier = threading.Barrier(3, timeout=5)
+
+    def new_dataset(type, files):
+        barrier.wait()
+        dataset = MagicMock()
+        if files == ["bad.txt"]:
+            dataset.save.side_effect = ValueError("Upload failed")
+        return dataset
+
+    openbis.new_dataset.side_effect = new_dataset
+    results = _upload_datasets(
+        openbis,
+        [
+            {"type": "RAW_DATA", "files": ["a.txt"]},
+            {"type": "RAW_DATA", "files": ["bad.txt"]},
+            {"type": "RAW_DATA", "files": ["b.txt"]},
+        ],
+        workers=3,
+    )
+
+    assert [error is None for _, error in results] == [True, False, True]
+    assert str(results[1][1]) == "Upload failed"
+    assert all(elapsed >= 0 for elapsed, _ in results)
+
+
+def test_link_parents(cleared_log_storage):
+    """Test that `_link_parents` links all the parents of each child at once and fetches the children in bulk."""
+    collection = CollectionType()
+    parent_1 = collection.add(generate_object_type())
+    parent_2 = collection.add(generate_object_type())
+    child_1 = collection.add(generate_object_type())
+    child_2 = collection.add(generate_object_type())
+    not_uploaded = collection.add(generate_object_type())
+    external_parent = {"code": "EXTERNAL", "space": "S"}
+    collection.add_relationship(parent_1, child_1)
+    collection.add_relationship(parent_2, child_1)
+    collection.add_relationship(external_parent, child_1)
+    collection.add_relationship(parent_1, child_2)
+    collection.add_relationship(not_uploaded, child_2)
+    openbis_id_map = {
+        object_id: f"/S/P/{code}"
+        for object_id, code in [
+            (parent_1, "PARENT_1"),
+            (parent_2, "PARENT_2"),
+            (child_1, "CHILD_1"),
+            (child_2, "CHILD_2"),
+        ]
+    }
+
+    openbis = mock_transactions(fail=lambda objects: False)
+    children = {
+        code: MagicMock(code=code, identifier=f"/S/P/{code}")
+        for code in ["CHILD_1", "CHILD_2"]
+    }
+    external = MagicMock(identifier="/S/EXTERNAL")
+
+    def get_object_mock(identifiers=None, **kwargs):
+        if kwargs:
+            return external
+        return [children[identifier.split("/")[-1]] for identifier in identifiers]
+
+    openbis.get_object.side_effect = get_object_mock
+    assert (
+        _link_parents(openbis, collection.relationships.values(), openbis_id_map) == []
+    )
+
+    # children fetched in a single request
+    assert openbis.get_object.call_count == 2
+    children["CHILD_1"].add_parents.assert_called_once_with(
+        ["/S/P/PARENT_1", "/S/P/PARENT_2", external]
+    )
+    children["CHILD_2"].add_parents.assert_called_once_with(["/S/P/PARENT_1"])
+    # children saved in a single transaction
+    assert openbis._commits == [[children["CHILD_1"], children["CHILD_2"]]]
+    assert any("Skipping relationship" in log["event"] for log in cleared_log_storage)
+
+
+def test_parser_init_workers(cleared_log_storage, mock_openbis):
+    """Test that `_parser_init` merges the results of the parsers run in worker processes."""
+    files_parser = {
+        TestParserWithRelationship(): ["file_1.txt", "file_2.txt"],
+        TestParser(): ["file_3.txt"],
+    }
+    collection, *_ = _parser_init(
+        openbis=mock_openbis,
+        space_name="TEST_SPACE",
+        project_name="TEST_PROJECT",
+        collection_name="TEST_COLLECTION",
+        files_parser=files_parser,
+        parser_workers=2,
+        split_files=True,
+    )
+
+    assert len(collection.attached_objects) == 5
+    assert len(collection.relationships) == 2
+    for parent, child in collection.relationships.values():
+        assert collection.attached_objects[parent].name == "Parent"
+        assert collection.attached_objects[child].name == "Child"
+
+
+@pytest.mark.parametrize(
+    "files_parser, num_objects",
+    [
+        # every parser without files
+        ({TestParser(): [], TestParserWithRelationship(): []}, 3),
+        # a single task
+        ({TestParser(): ["file_1.txt"]}, 1),
+    ],
+)
+def test_parser_init_workers_serial(
+    cleared_log_storage, mock_openbis, files_parser: dict, num_objects: int
+):
+    """Test that `_parser_init` parses in the same process, like the serial path, when there are not
+    several tasks for the worker processes."""
+    collection, *_ = _parser_init(
+        openbis=mock_openbis,
+        space_name="TEST_SPACE",
+        project_name="TEST_PROJECT",
+        collection_name="TEST_COLLECTION",
+        files_parser=files_parser,
+        parser_workers=2,
+        split_files=True,
+    )
+
+    assert len(collection.attached_objects) == num_objects
+
+
+def test_streaming_parser_parse():
+    """Test that `StreamingParser.parse` populates the collection with the streamed items."""
+    collection = CollectionType()
+    TestStreamingParser().parse(["file_1.txt"], collection, logger=logger)
+
+    assert len(collection.attached_objects) == 3
+    assert len(collection.relationships) == 2
+    parent_id = next(
+        object_id
+        for object_id, obj in collection.attached_objects.items()
+        if obj.code == "PARENT_0"
+    )
+    assert len(collection.children_of(parent_id)) == 2
+
+
+def test_stream_parsed_items():
+    """Test that `_stream_parsed_items` yields the objects and relationships with local object IDs."""
+    files_parser = {
+        TestStreamingParser(): ["file_1.txt"],
+        TestParserWithRelationship(): ["file_2.txt"],
+    }
+    items = list(_stream_parsed_items(files_parser))
+
+    assert [item[0] for item in items] == [
+        "object",
+        "object",
+        "relationship",
+        "object",
+        "relationship",
+        "object",
+        "object",
+        "relationship",
+    ]
+    object_ids = {item[1]: item[2] for item in items if item[0] == "object"}
+    for _, parent, child in (item for item in items if item[0] == "relationship"):
+        assert object_ids[parent].name == "Parent"
+        assert object_ids[child].name == "Child"
+
+
+def test_stream_parsed_items_unknown_endpoint():
+    """Test that `_stream_parsed_items` fails for relationships with objects not yielded before."""
+
+    class InvalidStreamingParser(StreamingParser):
+        def parse_stream(self, files, logger):
+            yield generate_object_type(), generate_object_type()
+
+    with pytest.raises(ValueError, match="must be yielded by the parser"):
+        list(_stream_parsed_items({InvalidStreamingParser(): ["file.txt"]}))
+
+
+def test_run_parser_pipelined(cleared_log_storage):
+    """Test that `run_parser_pipelined` uploads the objects while parsing and links the relationships."""
+    events = []
+
+    def commit(objects):
+        events.append("commit")
+        return False
+
+    openbis = mock_transactions(fail=commit)
+    openbis.username = "testuser"
+    # the children are fetched by identifier to link them to their parents
+    openbis.get_object.side_effect = lambda identifiers: [
+        MagicMock(code=identifier.split("/")[-1], identifier=identifier)
+        for identifier in identifiers
+    ]
+    parser = TestStreamingParser()
+    parser.events = events
+
+    run_parser_pipelined(
+        openbis=openbis,
+        space_name="TEST_SPACE",
+        project_name="TEST_PROJECT",
+        collection_name="TEST_COLLECTION",
+        files_parser={parser: ["file_1.txt", "file_2.txt"]},
+        chunk_size=2,
+        queue_size=1,
+    )
+
+    # the first objects are committed before the parser reaches the second file
+    assert events.index("commit") < events.index("parsed PARENT_1")
+    assert openbis.new_object.call_count == 6
+    # 3 transactions of objects and 1 transaction of the 2 parents with their children
+    assert len(openbis._commits) == 4
+    assert len(openbis._commits[-1]) == 4
+    assert any(
+        "6 objects committed successfully" in log["event"]
+        for log in cleared_log_storage
+    )
+
+
+def test_run_parser_pipelined_object_reference_across_batches(cleared_log_storage):
+    """Test that `run_parser_pipelined` resolves the OBJECT references to objects committed in an earlier
+    batch to their openBIS identifiers, also when their codes were renamed as duplicates."""
+
+    class ReferencingStreamingParser(StreamingParser):
+        def parse_stream(self, files, logger):
+            yield PersonObjectType(name="Jane Doe", code="PERSON_001")
+            person = PersonObjectType(name="John Doe", code="PERSON_001")
+            yield person
+            # in the next batch
+            instrument = InstrumentObjectType(name="Instrument 1", code="INS_001")
+            instrument.responsible_person = person
+            yield instrument
+
+    openbis = mock_transactions(fail=lambda objects: False)
+    openbis.username = "testuser"
+
+    run_parser_pipelined(
+        openbis=openbis,
+        space_name="TEST_SPACE",
+        project_name="TEST_PROJECT",
+        collection_name="TEST_COLLECTION",
+        files_parser={ReferencingStreamingParser(): ["file_1.txt"]},
+        chunk_size=2,
+    )
+
+    # 2 transactions of objects
+    assert len(openbis._commits) == 2
+    instrument_call = openbis.new_object.call_args_list[-1]
+    assert instrument_call.kwargs["code"] == "INS_001"
+    assert instrument_call.kwargs["props"]["responsible_person"] == (
+        "/TEST_SPACE/TEST_PROJECT/TEST_COLLECTION/PERSON_001__dup1"
+    )
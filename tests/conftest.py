@@ -12,7 +12,7 @@ from bam_masterdata.metadata.definitions import (
     VocabularyTypeDef,
 )
 from bam_masterdata.metadata.entities import BaseEntity, ObjectType, VocabularyType
-from bam_masterdata.parsing import AbstractParser
+from bam_masterdata.parsing import AbstractParser, StreamingParser
 
 if os.getenv("_PYTEST_RAISE", "0") != "0":
 
@@ -311,3 +311,23 @@ class TestParserWithObjectReference(AbstractParser):
         )
         instrument2_id = collection.add(instrument2)
         logger.info(f"Added instrument2 with path reference, ID {instrument2_id}")
+
+
+class TestStreamingParser(StreamingParser):
+    """Test streaming parser yielding a parent object per file with two children"""
+
+    # records the parsed objects, to check that parsing overlaps with uploading
+    events: list[str] = []
+
+    def parse_stream(self, files, logger):
+        for file_index, _ in enumerate(files):
+            parent = generate_object_type(name="Parent", code=f"PARENT_{file_index}")
+            self.events.append(f"parsed {parent.code}")
+            yield parent
+            for child_index in range(2):
+                child = generate_object_type(
+                    name="Child", code=f"CHILD_{file_index}_{child_index}"
+                )
+                self.events.append(f"parsed {child.code}")
+                yield child
+                yield parent, child
@@ -1,9 +1,12 @@
+import os
 import re
+import shutil
 
 import openpyxl
 import pytest
 
 from bam_masterdata.excel import MasterdataExcelExtractor
+from bam_masterdata.excel.excel_to_entities import MaterializedSheet
 from bam_masterdata.metadata.definitions import DataType
 
 
@@ -1386,3 +1389,67 @@ def test_excel_to_entities(excel_extractor, sheets_data, expected_result):
 
     # Assert the extracted entities match the expected structure
     assert result == expected_result, f"Expected: {expected_result}, but got: {result}"
+
+
+def test_excel_to_entities_closes_workbook(tmp_path):
+    """Tests that `excel_to_entities` closes the read-only workbook and releases the file handle."""
+    excel_path = tmp_path / "masterdata.xlsx"
+    shutil.copy("tests/data/checker/example01_codedoesnoteexists.xlsx", excel_path)
+    excel_extractor = MasterdataExcelExtractor(excel_path=str(excel_path))
+    archive = excel_extractor.workbook._archive
+    assert archive.fp is not None
+
+    result = excel_extractor.excel_to_entities()
+    assert result
+    assert archive.fp is None
+    # the sheets were read before closing, so calling it again returns the same entities
+    assert excel_extractor.excel_to_entities() == result
+    # the file is not locked anymore
+    os.remove(excel_path)
+
+
+def test_materialized_sheet():
+    """Tests that `MaterializedSheet` mimics the access to the cells of a worksheet."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.append(["Header1", "Header2", "Header3"])
+    ws.append(["Data1", "", None])
+    ws.append(["", "", ""])
+    ws.append(["Last"])
+
+    sheet = MaterializedSheet(ws)
+    assert sheet.title == "Sheet1"
+    assert (sheet.max_row, sheet.max_column) == (ws.max_row, ws.max_column)
+    assert sheet.cell(row=2, column=1).value == "Data1"
+    assert sheet.cell(row=2, column=1).coordinate == "A2"
+    assert sheet.cell(row=10, column=10).value is None
+    assert sheet["A4"].value == "Last"
+    assert [cell.value for cell in sheet[1]] == ["Header1", "Header2", "Header3"]
+    assert [cell.coordinate for cell in sheet["B"][1:3]] == ["B2", "B3"]
+    assert [sheet.is_row_empty(row) for row in range(1, 5)] == [
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert not sheet.is_empty()
+
+
+@pytest.mark.parametrize(
+    "excel_path",
+    [
+        "tests/data/checker/example01_codedoesnoteexists.xlsx",
+        "tests/data/checker/example02_codeexists_proptype_datatypechanged.xlsx",
+    ],
+)
+def test_excel_to_entities_read_only(excel_path):
+    """Tests that the streaming (read-only) mode extracts the same entities as the full mode."""
+    read_only_result = MasterdataExcelExtractor(
+        excel_path=excel_path, row_cell_info=True
+    ).excel_to_entities()
+    full_result = MasterdataExcelExtractor(
+        excel_path=excel_path, row_cell_info=True, read_only=False
+    ).excel_to_entities()
+    assert read_only_result
+    assert read_only_result == full_result
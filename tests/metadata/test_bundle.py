@@ -0,0 +1,77 @@
+import gzip
+import textwrap
+
+from bam_masterdata.metadata.bundle import BUNDLE_VERSION, build_bundle, load_bundle
+from bam_masterdata.metadata.entities_dict import EntitiesDict
+
+
+def write_module(module_path, extra_source: str = ""):
+    module_path.write_text(
+        textwrap.dedent(
+            """
+            from bam_masterdata.metadata.definitions import ObjectTypeDef, PropertyTypeAssignment
+            from bam_masterdata.metadata.entities import ObjectType
+
+
+            class Instrument(ObjectType):
+                defs = ObjectTypeDef(code="INSTRUMENT", description="Instrument", generated_code_prefix="INS")
+
+                name = PropertyTypeAssignment(
+                    code="$NAME",
+                    data_type="VARCHAR",
+                    property_label="Name",
+                    description="Name",
+                    mandatory=True,
+                    show_in_edit_views=True,
+                    section="General",
+                )
+
+
+            class Camera(Instrument):
+                defs = ObjectTypeDef(code="INSTRUMENT.CAMERA", description="Camera", generated_code_prefix="INS.CAM")
+            """
+        )
+        + extra_source,
+        encoding="utf-8",
+    )
+
+
+def test_build_and_load_bundle(tmp_path):
+    """Test that the bundle contains the same entities as the Python modules and their inheritance."""
+    module_path = tmp_path / "object_types.py"
+    write_module(module_path)
+
+    bundle_path = build_bundle(
+        python_path=str(module_path), bundle_path=tmp_path / "bundle.json.gz"
+    )
+    with gzip.open(bundle_path, "rt") as f:
+        assert f.read(1) == "{"
+
+    bundle = load_bundle(bundle_path, python_path=str(module_path))
+    assert bundle is not None
+    assert bundle.version == BUNDLE_VERSION
+    assert list(bundle.module_hashes) == ["object_types.py"]
+    assert bundle.entities == EntitiesDict(python_path=str(module_path)).single_json()
+    assert bundle.entities["object_types"]["INSTRUMENT"]["defs"]["row_location"] == 6
+    assert bundle.inheritance["object_types"] == {
+        "INSTRUMENT": [],
+        "INSTRUMENT.CAMERA": ["INSTRUMENT"],
+    }
+
+
+def test_load_bundle_stale_or_missing(tmp_path):
+    """Test that outdated, missing or broken bundles are not loaded."""
+    module_path = tmp_path / "object_types.py"
+    write_module(module_path)
+    bundle_path = build_bundle(
+        python_path=str(module_path), bundle_path=tmp_path / "bundle.json.gz"
+    )
+
+    write_module(module_path, extra_source="\n# modified\n")
+    assert load_bundle(bundle_path, python_path=str(module_path)) is None
+    # without `python_path` the bundle is not checked
+    assert load_bundle(bundle_path) is not None
+
+    assert load_bundle(tmp_path / "missing.json.gz") is None
+    (tmp_path / "broken.json.gz").write_text("not a bundle")
+    assert load_bundle(tmp_path / "broken.json.gz") is None
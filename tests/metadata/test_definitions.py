@@ -13,6 +13,9 @@ from bam_masterdata.metadata.definitions import (
     PropertyTypeDef,
     VocabularyTerm,
     VocabularyTypeDef,
+    get_unit_registry,
+    parse_units,
+    units_conversion_factor,
 )
 
 
@@ -484,3 +487,46 @@ class TestVocabularyTerm:
             str,
             bool,
         ]
+
+
+def test_get_unit_registry():
+    """Test that the pint unit registry is created once and shared."""
+    assert get_unit_registry() is get_unit_registry()
+
+
+def test_parse_units():
+    """Test that the units strings are parsed once and invalid ones raise a `ValueError`."""
+    unit = parse_units("l/minute")
+    assert unit == get_unit_registry().Unit("liter / minute")
+    assert parse_units("l/minute") is unit
+    with pytest.raises(ValueError, match="Invalid units format: not_a_real_unit"):
+        parse_units("not_a_real_unit")
+
+
+@pytest.mark.parametrize(
+    "from_units, to_units, factor",
+    [
+        ("mm", "mm", 1.0),
+        ("cm", "mm", 10.0),
+        ("kW", "W", 1000.0),
+        ("cm/min", "mm/s", 1 / 6),
+        ("deg", "rad", 0.017453292519943295),
+    ],
+)
+def test_units_conversion_factor(from_units: str, to_units: str, factor: float):
+    """Test the conversion factors between compatible units."""
+    assert units_conversion_factor(from_units, to_units) == pytest.approx(factor)
+
+
+@pytest.mark.parametrize(
+    "from_units, to_units",
+    [
+        ("mm", "s"),
+        ("not_a_real_unit", "mm"),
+        ("degC", "K"),
+    ],
+)
+def test_units_conversion_factor_invalid(from_units: str, to_units: str):
+    """Test that invalid, incompatible, or offset units raise a `ValueError`."""
+    with pytest.raises(ValueError):
+        units_conversion_factor(from_units, to_units)
@@ -6,6 +6,7 @@ import h5py
 import pytest
 
 from bam_masterdata.metadata.definitions import (
+    DataType,
     ObjectTypeDef,
     PropertyTypeAssignment,
     VocabularyTypeDef,
@@ -17,6 +18,7 @@ from bam_masterdata.metadata.entities import (
     generate_object_id,
     generate_object_relationship_id,
 )
+from bam_masterdata.openbis.snapshot import OpenbisSnapshot
 from tests.conftest import (
     InstrumentObjectType,
     PersonObjectType,
@@ -118,6 +120,16 @@ class TestBaseEntity:
             "storage_storage_validation_level",
         ]
 
+    def test_property_metadata_shared_by_instances(self):
+        entity = generate_object_type_longer()
+        other_entity = generate_object_type_longer()
+        assert entity._property_metadata is type(entity)._property_metadata
+        assert entity._property_metadata is other_entity._property_metadata
+        assert entity.get_property_metadata() == dict(entity._property_metadata)
+        assert entity._properties["alias"] == DataType.VARCHAR
+        with pytest.raises(TypeError):
+            entity._property_metadata["alias"] = None
+
     def test_base_attrs_only_includes_direct_class_assignments(self):
         entity = generate_object_type_longer()
         assert [prop.code for prop in entity._base_attrs] == ["SETTINGS"]
@@ -142,6 +154,12 @@ class TestObjectType:
             "$STORAGE.STORAGE_VALIDATION_LEVEL",
         ]
 
+        # the properties are computed once per class and copied for each instance
+        other_object_type = generate_object_type_longer()
+        other_object_type.properties.pop()
+        assert len(object_type.properties) == 4
+        assert tuple(object_type.properties) == type(object_type)._ordered_properties
+
     def test_setattr(self):
         """Test the method `__setattr__` from the class `ObjectType`."""
         object_type = generate_object_type()
@@ -237,6 +255,18 @@ class TestObjectType:
         ):
             entity.measured_at = "not-a-timestamp"
 
+    def test_property_setters_compiled_per_class(self):
+        object_type = generate_object_type_longer()
+        setters = type(object_type)._property_setters
+        assert list(setters.keys()) == list(object_type._property_metadata.keys())
+        assert setters["alias"](object_type, "alias", "Alias") == "Alias"
+        with pytest.raises(
+            TypeError, match="Invalid type for 'alias': Expected str, got int"
+        ):
+            setters["alias"](object_type, "alias", 42)
+        with pytest.raises(KeyError, match="Key 'not_a_property' not found"):
+            object_type.not_a_property = "value"
+
     def test_object_property_accepts_object_instance_and_path(self):
         person = PersonObjectType(name="John Doe", code="PERSON_001")
         instrument = InstrumentObjectType(name="Instrument 1")
@@ -343,6 +373,59 @@ class TestObjectType:
             entity.location = "WHATEVER"
         assert entity.location == "WHATEVER"
 
+    def test_to_openbis_shared_snapshot(self):
+        """Test that `to_openbis` lists the existing object types once per shared snapshot."""
+        logger = MagicMock()
+        openbis = MagicMock()
+        openbis.get_object_types.return_value.df = {"code": ["OTHER_OBJECT_TYPE"]}
+        new_object_type = MagicMock()
+        openbis.new_object_type.return_value = new_object_type
+        snapshot = OpenbisSnapshot(openbis)
+
+        entity = generate_object_type().to_openbis(
+            logger=logger, openbis=openbis, snapshot=snapshot
+        )
+        assert entity is new_object_type
+        openbis.new_object_type.assert_called_once()
+
+        # the second push finds the object type created by the first one
+        existing_object_type = MagicMock()
+        existing_object_type.get_property_assignments.return_value = []
+        openbis.get_object_type.return_value = existing_object_type
+        entity = generate_object_type().to_openbis(
+            logger=logger, openbis=openbis, snapshot=snapshot
+        )
+        assert entity is existing_object_type
+        openbis.new_object_type.assert_called_once()
+        openbis.get_object_type.assert_called_once_with("MOCKED_OBJECT_TYPE")
+        openbis.get_object_types.assert_called_once()
+
+    def test_to_openbis_property_types_listed_once(self):
+        """Test that `to_openbis` lists the property types once and only creates the missing ones."""
+        logger = MagicMock()
+        openbis = MagicMock()
+        openbis.get_object_types.return_value.df = {"code": []}
+        openbis.get_property_types.return_value.df = {"code": ["$NAME"]}
+        snapshot = OpenbisSnapshot(openbis)
+
+        generate_object_type().to_openbis(
+            logger=logger, openbis=openbis, snapshot=snapshot
+        )
+        generate_object_type_longer().to_openbis(
+            logger=logger, openbis=openbis, snapshot=snapshot
+        )
+
+        openbis.get_property_types.assert_called_once_with()
+        created_codes = [
+            call.kwargs["code"] for call in openbis.new_property_type.call_args_list
+        ]
+        assert created_codes == [
+            "ALIAS",
+            "$STORAGE.STORAGE_VALIDATION_LEVEL",
+            "SETTINGS",
+        ]
+        assert snapshot.exists("property_types", "SETTINGS")
+
 
 class TestVocabularyType:
     def test_model_validator_after_init(self):
@@ -352,33 +435,37 @@ class TestVocabularyType:
         term_names = [term.code for term in vocabulary_type.terms]
         assert term_names == ["OPTION_A", "OPTION_B"]
 
-    @patch("bam_masterdata.metadata.entities.OpenbisEntities")
-    def test_to_openbis_creates_new_vocabulary(
-        self, mocked_openbis_entities: MagicMock
-    ):
-        mocked_openbis_entities.return_value.get_vocabulary_dict.return_value = {}
+        # the terms are computed once per class and copied for each instance
+        other_vocabulary_type = generate_vocabulary_type()
+        assert other_vocabulary_type.terms == vocabulary_type.terms
+        assert other_vocabulary_type.terms is not vocabulary_type.terms
+        assert tuple(vocabulary_type.terms) == type(vocabulary_type)._ordered_terms
+
+    def test_to_openbis_creates_new_vocabulary(self):
         logger = MagicMock()
         openbis = MagicMock()
         openbis.url = "https://example.openbis"
+        openbis.get_vocabularies.return_value.df = {"code": []}
         new_vocabulary = MagicMock()
         openbis.new_vocabulary.return_value = new_vocabulary
+        snapshot = OpenbisSnapshot(openbis)
 
-        entity = generate_vocabulary_type().to_openbis(logger=logger, openbis=openbis)
+        entity = generate_vocabulary_type().to_openbis(
+            logger=logger, openbis=openbis, snapshot=snapshot
+        )
 
         openbis.new_vocabulary.assert_called_once()
         new_vocabulary.save.assert_called_once()
         assert entity is new_vocabulary
+        # the created vocabulary is recorded in the snapshot without listing the vocabularies again
+        assert snapshot.exists("vocabularies", "MOCKED_VOCABULARY_TYPE")
+        openbis.get_vocabularies.assert_called_once()
 
-    @patch("bam_masterdata.metadata.entities.OpenbisEntities")
-    def test_to_openbis_adds_only_missing_terms(
-        self, mocked_openbis_entities: MagicMock
-    ):
-        mocked_openbis_entities.return_value.get_vocabulary_dict.return_value = {
-            "MOCKED_VOCABULARY_TYPE": True
-        }
+    def test_to_openbis_adds_only_missing_terms(self):
         logger = MagicMock()
         openbis = MagicMock()
         openbis.url = "https://example.openbis"
+        openbis.get_vocabularies.return_value.df = {"code": ["MOCKED_VOCABULARY_TYPE"]}
         existing_vocabulary = MagicMock()
         existing_vocabulary.get_terms.return_value.df.code = ["OPTION_A"]
         openbis.get_vocabulary.return_value = existing_vocabulary
@@ -509,3 +596,147 @@ class TestCollectionType:
         assert len(ids) == 2
         assert ids[0] == parent_id
         assert ids[1] == child_id
+
+    def test_id_of(self):
+        """Test the method `id_of` from the class `CollectionType`."""
+        collection = CollectionType()
+        entity_type = generate_object_type()
+        assert collection.id_of(entity_type) is None
+
+        entity_id = collection.add(entity_type)
+        other_id = collection.add(generate_object_type())
+        assert collection.id_of(entity_type) == entity_id
+        assert collection.id_of(collection.attached_objects[other_id]) == other_id
+        # identity lookup, not equality
+        assert collection.id_of(generate_object_type()) is None
+
+        collection.remove(entity_id)
+        assert collection.id_of(entity_type) is None
+        assert collection.id_of(collection.attached_objects[other_id]) == other_id
+
+    def test_id_of_copies(self):
+        """Test that `id_of` finds the objects of copies and the objects placed directly in `attached_objects`."""
+        collection = CollectionType()
+        entity_id = collection.add(generate_object_type())
+
+        copied_collection = collection.model_copy(deep=True)
+        copied_entity_type = copied_collection.attached_objects[entity_id]
+        assert copied_entity_type is not collection.attached_objects[entity_id]
+        assert copied_collection.id_of(copied_entity_type) == entity_id
+        assert collection.id_of(copied_entity_type) is None
+
+        entity_type = generate_object_type()
+        collection.attached_objects["DIRECT_ID"] = entity_type
+        assert collection.id_of(entity_type) == "DIRECT_ID"
+
+        replaced_entity_type = generate_object_type()
+        collection.attached_objects["DIRECT_ID"] = replaced_entity_type
+        assert collection.id_of(entity_type) is None
+        assert collection.id_of(replaced_entity_type) == "DIRECT_ID"
+
+    def test_id_of_miss(self):
+        """Test that `id_of` does not rebuild the index of an up to date `CollectionType` on a miss."""
+        collection = CollectionType()
+        entity_id = collection.add(generate_object_type())
+        collection._object_ids[-1] = "SENTINEL"
+        assert collection.id_of(generate_object_type()) is None
+        assert collection._object_ids[-1] == "SENTINEL"
+        assert collection.id_of(collection.attached_objects[entity_id]) == entity_id
+
+    def test_relationship_graph(self):
+        """Test the parents, children, and topological order of the relationships in `CollectionType`."""
+        collection = CollectionType()
+        child_id = collection.add(generate_object_type())
+        parent_id = collection.add(generate_object_type())
+        grandparent_id = collection.add(generate_object_type())
+        existing = {"code": "EXISTING"}
+
+        relationship_id = collection.add_relationship(parent_id, child_id)
+        collection.add_relationship(grandparent_id, parent_id)
+        collection.add_relationship(existing, child_id)
+        assert collection.parents_of(child_id) == [parent_id, existing]
+        assert collection.children_of(existing) == [child_id]
+        assert collection.children_of(grandparent_id) == [parent_id]
+        assert not collection.has_cycle()
+        assert list(collection.topological_order()) == [
+            grandparent_id,
+            parent_id,
+            child_id,
+        ]
+
+        collection.add_relationship(child_id, grandparent_id)
+        assert collection.has_cycle()
+        with pytest.raises(ValueError):
+            list(collection.topological_order())
+
+        collection.remove_relationship(relationship_id)
+        assert not collection.has_cycle()
+        assert collection.parents_of(child_id) == [existing]
+
+    def test_relationship_graph_remove(self):
+        """Test that the objects removed from `CollectionType` are removed from its relationships graph."""
+        collection = CollectionType()
+        child_id = collection.add(generate_object_type())
+        parent_id = collection.add(generate_object_type())
+        collection.add_relationship(parent_id, child_id)
+
+        collection.remove(parent_id)
+        assert collection.parents_of(child_id) == []
+        assert collection.children_of(parent_id) == []
+        assert list(collection.topological_order()) == [child_id]
+
+    def test_relationship_graph_direct_changes(self):
+        """Test that the relationships graph of `CollectionType` follows the direct changes of `relationships`
+        and `attached_objects`, and the copies of the collection type."""
+        collection = CollectionType()
+        child_id = collection.add(generate_object_type())
+        parent_id = collection.add(generate_object_type())
+        assert list(collection.topological_order()) == [child_id, parent_id]
+
+        collection.relationships["DIRECT_ID"] = (parent_id, child_id)
+        assert collection.parents_of(child_id) == [parent_id]
+        assert list(collection.topological_order()) == [parent_id, child_id]
+
+        copied_collection = collection.model_copy(deep=True)
+        copied_collection.relationships.clear()
+        assert copied_collection.parents_of(child_id) == []
+        assert collection.parents_of(child_id) == [parent_id]
+
+        del collection.relationships["DIRECT_ID"]
+        assert collection.parents_of(child_id) == []
+        grandparent_id = "DIRECT_OBJECT_ID"
+        collection.attached_objects[grandparent_id] = generate_object_type()
+        collection.add_relationship(grandparent_id, child_id)
+        assert collection.parents_of(child_id) == [grandparent_id]
+        assert list(collection.topological_order()) == [
+            parent_id,
+            grandparent_id,
+            child_id,
+        ]
+
+    def test_merge(self):
+        """Test the method `merge` from the class `CollectionType`."""
+        other = CollectionType()
+        parent = generate_object_type()
+        parent_id = other.add(parent)
+        child_id = other.add(generate_object_type())
+        other.add_relationship(parent_id, child_id)
+        other.add_relationship({"code": "EXISTING"}, child_id)
+
+        collection = CollectionType()
+        collection.add(generate_object_type())
+        id_map = collection.merge(other)
+        assert id_map == {parent_id: parent_id, child_id: child_id}
+        assert collection.id_of(parent) == parent_id
+        assert collection.parents_of(child_id) == [parent_id, {"code": "EXISTING"}]
+
+        # merging again remaps the identifiers already used
+        id_map = collection.merge(other)
+        assert parent_id not in id_map.values()
+        assert child_id not in id_map.values()
+        assert len(collection.attached_objects) == 5
+        assert len(collection.relationships) == 4
+        assert collection.parents_of(id_map[child_id]) == [
+            id_map[parent_id],
+            {"code": "EXISTING"},
+        ]
@@ -5,7 +5,7 @@ from enum import Enum
 
 import pytest
 
-from bam_masterdata.metadata.entities_dict import EntitiesDict
+from bam_masterdata.metadata.entities_dict import EntitiesDict, clear_entities_cache
 
 
 def normalize_data(data):
@@ -381,3 +381,69 @@ class TestEntitiesDict:
             "beta": {"module_path": "/tmp/beta.py"},
             "alpha": {"module_path": "/tmp/alpha.py"},
         }
+
+    @pytest.mark.parametrize("chunk_size", [None, 1, 5])
+    def test_single_json_parallel(self, chunk_size):
+        """Test that loading the modules in worker processes gives the same result as loading them serially."""
+        python_path = "./tests/data/checker/example_incoming_python"
+        data = EntitiesDict(python_path=python_path).single_json()
+        parallel_data = EntitiesDict(
+            python_path=python_path, workers=2, chunk_size=chunk_size
+        ).single_json()
+        assert json.dumps(parallel_data) == json.dumps(data)
+
+    def test_to_dict_chunks(self):
+        """Test that merging the chunks of a module gives the dictionary of the whole module."""
+        module_path = "./bam_masterdata/datamodel/collection_types.py"
+        entities_dict = EntitiesDict()
+        data = entities_dict.to_dict(module_path=module_path)
+        merged_data: dict = {}
+        for index in range(3):
+            merged_data.update(entities_dict.to_dict(module_path, chunk=(index, 3)))
+        assert list(merged_data) == list(data)
+        assert merged_data == data
+
+    def test_single_json_cache(self, tmp_path, monkeypatch):
+        """Test that the dictionaries of the unchanged modules are read from the cache."""
+        python_path = tmp_path / "datamodel"
+        python_path.mkdir()
+        for name in ["collection_types", "dataset_types"]:
+            source = f"./tests/data/checker/example_incoming_python/{name}.py"
+            (python_path / f"{name}.py").write_text(open(source).read())
+        cache_dir = tmp_path / "cache"
+        # `listdir_py_modules` skips the paths containing a `tmp` folder
+        monkeypatch.setattr(
+            "bam_masterdata.metadata.entities_dict.listdir_py_modules",
+            lambda directory_path, logger: sorted(
+                str(path) for path in python_path.glob("*.py")
+            ),
+        )
+
+        data = EntitiesDict(python_path=str(python_path)).single_json()
+        cached_data = EntitiesDict(
+            python_path=str(python_path), use_cache=True, cache_dir=cache_dir
+        ).single_json()
+        assert cached_data == data
+        assert all(data.values())
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+        # only the modified module is processed again
+        processed_modules = []
+        to_dict = EntitiesDict.to_dict
+
+        def counting_to_dict(self, module_path, chunk=None):
+            processed_modules.append(os.path.basename(module_path))
+            return to_dict(self, module_path, chunk)
+
+        monkeypatch.setattr(EntitiesDict, "to_dict", counting_to_dict)
+        with open(python_path / "dataset_types.py", "a") as f:
+            f.write("\n# modified\n")
+        cached_data = EntitiesDict(
+            python_path=str(python_path), use_cache=True, cache_dir=cache_dir
+        ).single_json()
+        assert processed_modules == ["dataset_types.py"]
+        assert cached_data == data
+        assert list(cached_data) == list(data)
+
+        assert clear_entities_cache(cache_dir) == 3
+        assert list(cache_dir.glob("*.json")) == []
@@ -0,0 +1,78 @@
+import pytest
+
+from bam_masterdata.metadata.relationship_graph import RelationshipGraph
+
+
+class TestRelationshipGraph:
+    def test_add_edge(self):
+        """Test the method `add_edge` from the class `RelationshipGraph`."""
+        graph = RelationshipGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.add_edge("D", "C", parent_value={"code": "D"})
+        graph.add_edge("A", "B")  # duplicated relationships are stored once
+        assert len(graph) == 3
+        assert "A" in graph
+        assert "E" not in graph
+        assert graph.children("A") == ["B", "C"]
+        assert graph.parents("C") == ["A", {"code": "D"}]
+        assert graph.parents("A") == []
+        assert graph.parents("E") == []
+
+    def test_remove_edge(self):
+        """Test the method `remove_edge` from the class `RelationshipGraph`."""
+        graph = RelationshipGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.remove_edge("A", "B")
+        graph.remove_edge("A", "B")
+        graph.remove_edge("A", "E")
+        assert len(graph) == 1
+        assert graph.children("A") == ["C"]
+        assert graph.parents("B") == []
+        assert "B" in graph
+
+    def test_remove_node(self):
+        """Test the method `remove_node` from the class `RelationshipGraph`."""
+        graph = RelationshipGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("B", "C")
+        graph.add_edge("B", "B")
+        graph.add_node("D")
+        graph.remove_node("B")
+        graph.remove_node("E")
+        assert len(graph) == 0
+        assert "B" not in graph
+        assert graph.children("A") == []
+        assert graph.parents("C") == []
+        assert not graph.has_cycle()
+        assert list(graph.topological_order()) == ["A", "C", "D"]
+
+        graph.add_edge("C", "B")
+        assert graph.parents("B") == ["C"]
+        assert list(graph.topological_order()) == ["A", "C", "D", "B"]
+
+    def test_topological_order(self):
+        """Test the method `topological_order` from the class `RelationshipGraph`."""
+        graph = RelationshipGraph()
+        for node in ["C", "B", "A", "E"]:
+            graph.add_node(node)
+        graph.add_edge("A", "B")
+        graph.add_edge("B", "C")
+        graph.add_edge("A", "C")
+        assert not graph.has_cycle()
+        assert list(graph.topological_order()) == ["A", "E", "B", "C"]
+
+    def test_cycle(self):
+        """Test the cycle detection of the class `RelationshipGraph`."""
+        graph = RelationshipGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("B", "C")
+        graph.add_edge("C", "A")
+        graph.add_edge("D", "E")
+        assert graph.has_cycle()
+        with pytest.raises(ValueError, match="The relationships contain a cycle"):
+            list(graph.topological_order())
+        graph.remove_edge("C", "A")
+        assert not graph.has_cycle()
+        assert list(graph.topological_order()) == ["A", "D", "B", "E", "C"]
@@ -0,0 +1,76 @@
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from bam_masterdata.metadata.vocabulary_index import (
+    VocabularyIndex,
+    clear_vocabulary_indexes,
+    get_vocabulary_index,
+    get_vocabulary_terms,
+)
+from bam_masterdata.utils import DATAMODEL_DIR
+
+EXAMPLE_VOCABULARY = "tests/data/metadata/example_vocabulary.py"
+
+
+class TestVocabularyIndex:
+    def test_terms(self):
+        """Test the method `terms` from the class `VocabularyIndex`."""
+        index = VocabularyIndex(EXAMPLE_VOCABULARY)
+        assert index.terms("$DEFAULT_COLLECTION_VIEWS") == frozenset(
+            {"FORM_VIEW", "LIST_VIEW"}
+        )
+        # resolved by class name as in `code_to_class_name`
+        assert index.terms("DEFAULT_COLLECTION_VIEWS") == frozenset(
+            {"FORM_VIEW", "LIST_VIEW"}
+        )
+        assert index.terms("VOCABULARY_NOT_FOUND") is None
+        assert index.vocabulary_codes == frozenset({"$DEFAULT_COLLECTION_VIEWS"})
+
+    @pytest.mark.parametrize(
+        "value, result",
+        [
+            ("FORM_VIEW", True),
+            ("NOT_A_TERM", False),
+            (42, False),
+            (["FORM_VIEW"], False),
+        ],
+    )
+    def test_is_term(self, value, result):
+        """Test the method `is_term` from the class `VocabularyIndex`."""
+        index = VocabularyIndex(EXAMPLE_VOCABULARY)
+        assert index.is_term("$DEFAULT_COLLECTION_VIEWS", value) is result
+
+    def test_rebuild_on_invalidate(self, tmp_path):
+        """Test that the index is built once and only rebuilt after `invalidate`."""
+        vocab_path = tmp_path / "vocabulary_types.py"
+        shutil.copy(EXAMPLE_VOCABULARY, vocab_path)
+        index = VocabularyIndex(str(vocab_path))
+        assert not index.is_term("$DEFAULT_COLLECTION_VIEWS", "TABLE_VIEW")
+
+        with open(vocab_path, "a", encoding="utf-8") as f:
+            f.write(
+                "\n    table_view = VocabularyTerm(\n"
+                '        code="TABLE_VIEW",\n'
+                '        label="Table view",\n'
+                '        description="""""",\n'
+                "    )\n"
+            )
+        # the lookups do not check the module file
+        with patch("os.stat", side_effect=AssertionError("os.stat called")):
+            assert not index.is_term("$DEFAULT_COLLECTION_VIEWS", "TABLE_VIEW")
+
+        index.invalidate()
+        assert index.is_term("$DEFAULT_COLLECTION_VIEWS", "TABLE_VIEW")
+
+
+def test_get_vocabulary_index():
+    """Test the process-wide vocabulary indexes."""
+    clear_vocabulary_indexes()
+    index = get_vocabulary_index(DATAMODEL_DIR)
+    assert get_vocabulary_index(DATAMODEL_DIR) is index
+    assert "BOX" in get_vocabulary_terms("$STORAGE.STORAGE_VALIDATION_LEVEL")
+
+    with pytest.raises(FileNotFoundError, match="vocabulary_types.py"):
+        get_vocabulary_index("tests/data/cli")
@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock
+
+from bam_masterdata.openbis.snapshot import OpenbisSnapshot
+
+
+def test_openbis_snapshot():
+    """Test that `OpenbisSnapshot` lists each kind of entity types once and updates the codes locally."""
+    openbis = MagicMock()
+    openbis.get_object_types.return_value.df = {"code": ["SAMPLE", "PERSON.BAM"]}
+    openbis.get_vocabularies.return_value.df = {"code": []}
+    snapshot = OpenbisSnapshot(openbis)
+
+    assert snapshot.exists("object_types", "PERSON.BAM")
+    assert not snapshot.exists("object_types", "INSTRUMENT")
+    assert not snapshot.exists("vocabularies", "PERSON.BAM")
+    snapshot.add("object_types", "INSTRUMENT")
+    assert snapshot.codes("object_types") == {"SAMPLE", "PERSON.BAM", "INSTRUMENT"}
+    openbis.get_object_types.assert_called_once()
+    openbis.get_vocabularies.assert_called_once()
+
+    # refreshing discards the local changes and lists the entity types again
+    snapshot.refresh("object_types")
+    assert not snapshot.exists("object_types", "INSTRUMENT")
+    assert openbis.get_object_types.call_count == 2
+    snapshot.refresh()
+    snapshot.codes("vocabularies")
+    assert openbis.get_vocabularies.call_count == 2
@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_DEPENDENCIES = ("pybis", "h5py", "rdflib", "openpyxl", "pint")
+
+
+def imported_heavy_dependencies(statement: str) -> list[str]:
+    """
+    Runs `statement` in a fresh interpreter without `OPENBIS_URL` and returns the heavy dependencies imported.
+    """
+    code = (
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_DEPENDENCIES!r} if m in sys.modules]))"
+    )
+    env = {key: value for key, value in os.environ.items() if key != "OPENBIS_URL"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "statement, allowed",
+    [
+        ("import bam_masterdata.metadata.entities", []),
+        ("import bam_masterdata.metadata.entities_dict", []),
+        ("from bam_masterdata.datamodel.object_types import Instrument", []),
+        ("from bam_masterdata.checker import MasterdataChecker", []),
+        ("import bam_masterdata.cli", []),
+        ("from bam_masterdata.excel import MasterdataExcelExtractor", ["openpyxl"]),
+    ],
+)
+def test_no_heavy_imports(statement: str, allowed: list[str]):
+    """Test that heavy optional dependencies are only imported when used."""
+    assert imported_heavy_dependencies(statement) == allowed
@@ -2,7 +2,12 @@ from collections.abc import Callable
 
 import pytest
 
-from bam_masterdata.logger import logger
+from bam_masterdata.logger import (
+    collect_logs,
+    configure_log_storage,
+    log_storage,
+    logger,
+)
 
 
 @pytest.mark.parametrize(
@@ -29,3 +34,51 @@ def test_logger_info_message(
     assert cleared_log_storage[0]["event"] == message
     assert cleared_log_storage[0]["level"] == level
     assert "timestamp" in cleared_log_storage[0]
+
+
+def test_log_storage_ring_buffer(cleared_log_storage: list):
+    """Tests that the `log_storage` keeps only the last `max_entries` messages."""
+    try:
+        configure_log_storage(max_entries=2)
+        for i in range(3):
+            logger.info(f"Message {i}")
+        assert [log["event"] for log in cleared_log_storage] == [
+            "Message 1",
+            "Message 2",
+        ]
+        assert cleared_log_storage[-1]["event"] == "Message 2"
+    finally:
+        configure_log_storage()
+
+
+def test_log_storage_disabled(cleared_log_storage: list):
+    """Tests that no messages are stored when the `log_storage` is disabled."""
+    try:
+        configure_log_storage(enabled=False)
+        logger.info("Not stored message.")
+        assert len(cleared_log_storage) == 0
+    finally:
+        configure_log_storage()
+
+
+def test_collect_logs(cleared_log_storage: list):
+    """Tests that `collect_logs` collects only the messages emitted inside its scope."""
+    logger.info("Outside message.")
+    try:
+        configure_log_storage(enabled=False)
+        with collect_logs() as logs:
+            logger.warning("Inside message.")
+            with collect_logs() as nested_logs:
+                logger.info("Nested message.")
+    finally:
+        configure_log_storage()
+    logger.info("Outside message.")
+
+    assert [log["event"] for log in logs] == ["Inside message.", "Nested message."]
+    assert logs[0]["level"] == "warning"
+    assert "timestamp" in logs[0]
+    assert [log["event"] for log in nested_logs] == ["Nested message."]
+    assert [log["event"] for log in log_storage] == [
+        "Outside message.",
+        "Outside message.",
+    ]
@@ -0,0 +1,109 @@
+import importlib
+import inspect
+import sys
+import textwrap
+
+import pytest
+
+from bam_masterdata.utils.lazy_modules import (
+    LazyModuleFinder,
+    index_class_spans,
+    install_lazy_modules,
+)
+
+MODULE_SOURCE = textwrap.dedent(
+    """
+    BUILT = []
+
+
+    class Base:
+        BUILT.append("Base")
+
+
+    class Child(Base):
+        BUILT.append("Child")
+
+
+    # comment between classes
+    class Other:
+        BUILT.append("Other")
+        child = Child
+    """
+)
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    """Creates a package whose submodules are loaded lazily."""
+    package_dir = tmp_path / "lazy_test_package"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "types.py").write_text(MODULE_SOURCE)
+    (package_dir / "eager.py").write_text(
+        MODULE_SOURCE + "\nOTHER_CHILD = Other.child\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+    install_lazy_modules("lazy_test_package")
+    yield "lazy_test_package"
+    for name in list(sys.modules):
+        if name.startswith("lazy_test_package"):
+            del sys.modules[name]
+
+
+def test_index_class_spans():
+    """Test the indexing of the top-level classes of a module source."""
+    header_end, spans = index_class_spans(MODULE_SOURCE.splitlines(keepends=True))
+    assert header_end == 4
+    assert {name: (span.start, span.end) for name, span in spans.items()} == {
+        "Base": (5, 6),
+        "Child": (9, 10),
+        "Other": (14, 16),
+    }
+    assert spans["Child"].bases == ("Base",)
+    assert index_class_spans((MODULE_SOURCE + "\nX = 1\n").splitlines()) is None
+
+
+def test_install_lazy_modules(lazy_package):
+    """Test that only the requested classes and their dependencies are built."""
+
+    def n_finders():
+        return sum(
+            isinstance(finder, LazyModuleFinder) and finder.package == lazy_package
+            for finder in sys.meta_path
+        )
+
+    assert n_finders() == 1
+    install_lazy_modules(lazy_package)
+    assert n_finders() == 1
+
+    types = importlib.import_module(f"{lazy_package}.types")
+
+    assert types.BUILT == []
+    assert types.Child.__mro__[1] is types.Base
+    assert types.BUILT == ["Base", "Child"]
+    assert inspect.getsourcelines(types.Child)[1] == 9
+
+    # classes used in the body of another class are built on demand
+    assert types.Other.child is types.Child
+    assert types.BUILT == ["Base", "Child", "Other"]
+
+    with pytest.raises(AttributeError):
+        types.Missing  # noqa: B018
+
+
+def test_lazy_module_enumeration(lazy_package):
+    """Test that the full enumeration of a lazy module builds every class."""
+    types = importlib.import_module(f"{lazy_package}.types")
+
+    classes = [name for name, _ in inspect.getmembers(types, inspect.isclass)]
+    assert classes == ["Base", "Child", "Other"]
+    assert sorted(types.BUILT) == ["Base", "Child", "Other"]
+
+
+def test_lazy_module_fallback(lazy_package):
+    """Test that modules with other top-level statements after the classes are executed eagerly."""
+    eager = importlib.import_module(f"{lazy_package}.eager")
+
+    assert eager.BUILT == ["Base", "Child", "Other"]
+    assert eager.OTHER_CHILD is eager.Child
@@ -2,6 +2,7 @@ import inspect
 import json
 import os
 import shutil
+import sys
 from pathlib import Path
 
 import pytest
@@ -12,6 +13,7 @@ from bam_masterdata.utils import (
     delete_and_create_dir,
     duplicated_property_types,
     import_module,
+    invalidate_module_cache,
     is_reduced_version,
     listdir_py_modules,
     load_validation_rules,
@@ -74,6 +76,7 @@ def test_delete_and_create_dir(
         (
             "./tests/utils",
             [
+                "./tests/utils/test_lazy_modules.py",
                 "./tests/utils/test_paths.py",
                 "./tests/utils/test_users.py",
                 "./tests/utils/test_utils.py",
@@ -125,6 +128,39 @@ def test_import_module():
     ]
 
 
+def test_import_module_cache(tmp_path):
+    """Tests that `import_module` executes a module only once until it changes or is invalidated."""
+    counter_path = tmp_path / "executions.txt"
+    module_path = tmp_path / "counted_module.py"
+    module_path.write_text(
+        f"with open({str(counter_path)!r}, 'a') as f:\n    f.write('x')\n",
+        encoding="utf-8",
+    )
+
+    def n_executions() -> int:
+        return len(counter_path.read_text(encoding="utf-8"))
+
+    module = import_module(str(module_path))
+    assert import_module(str(module_path)) is module
+    # relative and absolute paths share the same cached module
+    assert import_module(os.path.relpath(module_path)) is module
+    assert n_executions() == 1
+    assert "counted_module" not in sys.modules
+
+    # explicit reload and invalidation
+    assert import_module(str(module_path), reload=True) is not module
+    assert n_executions() == 2
+    invalidate_module_cache(str(module_path))
+    import_module(str(module_path))
+    assert n_executions() == 3
+
+    # changes in the file re-execute the module
+    with open(module_path, "a", encoding="utf-8") as f:
+        f.write("value = 1\n")
+    assert import_module(str(module_path)).value == 1
+    assert n_executions() == 4
+
+
 @pytest.mark.parametrize(
     "code, entity_type, result",
     [
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+
+import argparse
+import contextlib
+import copy
+import os
+import re
+import time
+
+from bam_masterdata.checker.masterdata_validator import MasterdataValidator
+from bam_masterdata.logger import configure_log_storage, logger
+from bam_masterdata.metadata.definitions import DataType
+from bam_masterdata.metadata.entities_dict import EntitiesDict
+from bam_masterdata.utils import (
+    DATAMODEL_DIR,
+    is_reduced_version,
+    load_validation_rules,
+)
+
+
+def legacy_store_log_message(logger, entity_ref, message, level="error"):
+    """
+    `store_log_message` as done before resolving only the logging method of `level`.
+    """
+    log_function = {
+        "error": logger.error,
+        "warning": logger.warning,
+        "critical": logger.critical,
+        "info": logger.info,
+    }.get(level, logger.error)
+    log_function(message)
+    if "_log_msgs" not in entity_ref:
+        entity_ref["_log_msgs"] = []
+    entity_ref["_log_msgs"].append((level, message))
+
+
+class LegacyMasterdataValidator(MasterdataValidator):
+    """
+    Validator interpreting the validation rules for every field, as done before compiling them.
+    """
+
+    def _validate_fields(
+        self,
+        data: dict,
+        rule_type: str,
+        entity_type: str,
+        entity_name: str,
+        row_location: str,
+        parent_entity: dict,
+    ):
+        """
+        Validate a dictionary of fields against the corresponding validation rules.
+
+        Args:
+            data (dict): The fields to validate.
+            rule_type (str): The rule section to use ("defs_validation", "properties_validation", or "terms_validation").
+            entity_type (str): The entity type being validated.
+            entity_name (str): The specific entity name (ID if available).
+            row_location (str): The row where the entity is located in the source file.
+            parent_entity (dict): The entity dictionary where _log_msgs should be stored.
+        """
+
+        # Determine where the issue is occurring (in properties, terms, or main entity fields)
+        extra_location = {
+            "properties_validation": "in 'properties'.",
+            "terms_validation": "in 'terms'.",
+        }.get(rule_type, ".")
+
+        for field, value in data.items():
+            rule = self.validation_rules.get(rule_type, {}).get(field)
+
+            extra_location_str = f" {extra_location} " if extra_location else " "
+
+            log_message = (
+                f"Invalid '{value}' value found in the '{field}' field at line {row_location} "
+                f"in entity '{entity_name}' of '{entity_type}'{extra_location_str}"
+            )
+
+            if not rule:
+                continue  # Skip fields with no validation rules
+
+            # Handle empty fields
+            if "allow_empty" in rule and (value is None or value == "" or not value):
+                continue  # Skip check if empty fields are allowed
+
+            # Validate pattern (regex)
+            if "pattern" in rule and value is not None:
+                if not re.match(rule["pattern"], str(value)):
+                    log_message = f"{log_message}Invalid format."
+                    level = "error"
+                    if "is_description" in rule:
+                        log_message = f"{log_message} Description should follow the schema: English Description + '//' + German Description. "
+                        level = "warning"
+                    if "is_section" in rule:
+                        log_message = f"{log_message} First letter of every word starts with capitalized lettter."
+                        level = "warning"
+                    legacy_store_log_message(
+                        logger, parent_entity, log_message, level=level
+                    )
+
+            # Validate boolean fields
+            if "is_bool" in rule and str(value).strip().lower() not in [
+                "true",
+                "false",
+            ]:
+                legacy_store_log_message(
+                    logger,
+                    parent_entity,
+                    f"{log_message}Expected a boolean.",
+                    level="error",
+                )
+
+            # Validate data types
+            if "is_data" in rule:
+                str_val = str(value)
+                is_valid_standard = str_val in [dt.value for dt in DataType]
+                is_valid_dynamic = False
+
+                if not is_valid_standard and (
+                    str_val.startswith("OBJECT") or str_val.startswith("SAMPLE")
+                ):
+                    els = str_val.split(":")
+
+                    if len(els) == 2 and els[1].strip():
+                        is_valid_dynamic = True
+
+                if not is_valid_standard and not is_valid_dynamic:
+                    legacy_store_log_message(
+                        logger,
+                        parent_entity,
+                        f"{log_message}The Data Type should be one of the following: {[dt.value for dt in DataType]} or follow the format 'SAMPLE:<CODE>' or 'OBJECT:<CODE>'",
+                        level="error",
+                    )
+
+            # Validate special cases (e.g., extra validation functions)
+            if "extra_validation" in rule:
+                validation_func = getattr(self, rule["extra_validation"], None)
+                if validation_func == "is_reduced_version" and not is_reduced_version(
+                    value, entity_name
+                ):
+                    legacy_store_log_message(
+                        logger,
+                        parent_entity,
+                        f"{log_message}The generated code should be a part of the code.",
+                        level="warning",
+                    )
+
+
+def time_validation(
+    validator_cls, current_model: dict, rules: dict, repeat: int
+) -> float:
+    """
+    Returns the best time of `repeat` runs of the validation of `current_model` in the `self` mode.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        validator = validator_cls({}, copy.deepcopy(current_model), rules)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            validator.validate(mode="self")
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(datamodel_dir: str, repeat: int) -> None:
+    configure_log_storage(enabled=False)
+    rules = load_validation_rules(logger)
+    current_model = EntitiesDict(python_path=datamodel_dir, logger=logger).single_json()
+
+    legacy_time = time_validation(
+        LegacyMasterdataValidator, current_model, rules, repeat
+    )
+    compiled_time = time_validation(MasterdataValidator, current_model, rules, repeat)
+
+    print(f"Datamodel:       {datamodel_dir}")
+    print(f"Legacy rules:    {legacy_time:.3f} s")
+    print(f"Compiled rules:  {compiled_time:.3f} s")
+    print(f"Speedup:         {legacy_time / compiled_time:.2f}x")
+
+
+# * In the root folder, run `python tools/scripts/benchmark_checker.py` to compare the validation times
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--datamodel-dir", default=DATAMODEL_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.datamodel_dir, args.repeat)
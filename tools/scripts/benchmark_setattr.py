@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+
+import argparse
+import datetime
+import importlib.util
+import inspect
+import os
+import time
+
+from bam_masterdata.datamodel import object_types, vocabulary_types
+from bam_masterdata.metadata.definitions import DataType, PropertyTypeAssignment
+from bam_masterdata.metadata.entities import ObjectType
+from bam_masterdata.metadata.vocabulary_index import get_vocabulary_index
+from bam_masterdata.utils import DATAMODEL_DIR, code_to_class_name, listdir_py_modules
+
+# Institutional vocabularies are not defined in the datamodel and raise a warning when assigned
+INSTITUTIONAL_VOCABULARIES = {
+    "BAM_FLOOR",
+    "BAM_HOUSE",
+    "BAM_LOCATION",
+    "BAM_LOCATION_COMPLETE",
+    "BAM_OE",
+    "BAM_ROOM",
+    "PERSON_STATUS",
+}
+
+
+def legacy_import_module(module_path: str):
+    """
+    `import_module` as done in the baseline: the module is executed again on every call.
+    """
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_property_metadata(instance: ObjectType) -> dict:
+    """
+    `get_property_metadata` as done in the baseline: the MRO of the class is walked on every call.
+    """
+    prop_meta_dict: dict = {}
+    for base in type(instance).__mro__:
+        for attr_name, attr_value in getattr(base, "__dict__", {}).items():
+            if isinstance(attr_value, PropertyTypeAssignment):
+                prop_meta_dict[attr_name] = attr_value
+    return prop_meta_dict
+
+
+def legacy_validate_controlled_vocabulary(meta: dict, key: str, value) -> None:
+    """
+    `_validate_controlled_vocabulary` as done in the baseline: the datamodel directory is listed and the
+    vocabulary module executed and scanned on every assignment.
+    """
+    vocabulary_code = meta[key].vocabulary_code
+    vocab_path = None
+    for file in listdir_py_modules(DATAMODEL_DIR):
+        if "vocabulary_types.py" in file:
+            vocab_path = file
+            break
+    module = legacy_import_module(vocab_path)
+    vocabulary_class = None
+    for name, obj in inspect.getmembers(module, inspect.isclass):
+        if name == code_to_class_name(vocabulary_code):
+            vocabulary_class = obj()
+            break
+    if vocabulary_class is None:
+        raise ValueError(vocabulary_code)
+    codes = [term.code for term in vocabulary_class.terms]
+    if value not in codes:
+        raise ValueError(value)
+
+
+def legacy_setattr(instance: ObjectType, key: str, value) -> None:
+    """
+    `ObjectType.__setattr__` as done in the baseline: the property metadata is searched through the MRO,
+    the data type of the property is compared against each special case, and the vocabulary terms are
+    loaded from the vocabulary module on every assignment.
+    """
+    if key in ["_property_metadata", "_properties", "code", "properties", "datasets"]:
+        return object.__setattr__(instance, key, value)
+
+    for base in type(instance).__mro__:
+        if not callable(getattr(base, "get_property_metadata", None)):
+            continue
+        meta = (
+            legacy_property_metadata(instance)
+            if base is not type(instance)
+            else instance._property_metadata
+        )
+        if key not in meta:
+            continue
+        expected_type = meta[key].data_type.pytype
+        if expected_type is datetime.datetime:
+            if isinstance(value, datetime.datetime):
+                value = value.strftime("%Y-%m-%d %H:%M:%S")
+            else:
+                datetime.datetime.fromisoformat(value)
+            expected_type = str
+        if expected_type and not isinstance(value, expected_type):
+            raise TypeError(key)
+        data_type = meta[key].data_type
+        if data_type == "OBJECT":
+            return object.__setattr__(
+                instance, key, instance._set_object_value(key, value)
+            )
+        if data_type == "CONTROLLEDVOCABULARY":
+            legacy_validate_controlled_vocabulary(meta, key, value)
+        return object.__setattr__(instance, key, value)
+    raise KeyError(key)
+
+
+def sample_value(prop):
+    """
+    Returns a valid value for the data type of the property `prop`, or None if the property is skipped.
+    """
+    data_type = prop.data_type
+    if data_type == DataType.CONTROLLEDVOCABULARY:
+        if prop.vocabulary_code in INSTITUTIONAL_VOCABULARIES:
+            return None
+        # the baseline only finds the vocabulary types by their class name
+        if not hasattr(vocabulary_types, code_to_class_name(prop.vocabulary_code)):
+            return None
+        terms = get_vocabulary_index().terms(prop.vocabulary_code)
+        return min(terms) if terms else None
+    return {
+        DataType.BOOLEAN: True,
+        DataType.DATE: datetime.date(2024, 1, 1),
+        DataType.HYPERLINK: "https://example.org",
+        DataType.INTEGER: 1,
+        DataType.MULTILINE_VARCHAR: "text",
+        DataType.OBJECT: "/SPACE/PROJECT/COLLECTION/OBJECT",
+        DataType.REAL: 1.0,
+        DataType.TIMESTAMP: "2024-01-01 10:00:00",
+        DataType.VARCHAR: "text",
+        DataType.XML: "<xml/>",
+    }.get(data_type)
+
+
+def build_workload(n_sets: int) -> list[tuple[ObjectType, str, object]]:
+    """
+    Builds `n_sets` assignments distributed over all the object types defined in the datamodel.
+    """
+    assignments = []
+    for _, cls in inspect.getmembers(object_types, inspect.isclass):
+        if not issubclass(cls, ObjectType) or cls is ObjectType:
+            continue
+        instance = cls()
+        for key, prop in cls._property_metadata.items():
+            value = sample_value(prop)
+            if value is not None:
+                assignments.append((instance, key, value))
+    return [assignments[i % len(assignments)] for i in range(n_sets)]
+
+
+def run_benchmark(n_sets: int, baseline_sets: int) -> None:
+    workload = build_workload(n_sets)
+    # the baseline executes the vocabulary module for every CONTROLLEDVOCABULARY assignment, so it is
+    # timed on an evenly spaced sample of the workload
+    baseline_workload = workload[:: max(1, n_sets // baseline_sets)]
+
+    start = time.perf_counter()
+    for instance, key, value in baseline_workload:
+        legacy_setattr(instance, key, value)
+    baseline_time = (time.perf_counter() - start) / len(baseline_workload)
+
+    start = time.perf_counter()
+    for instance, key, value in workload:
+        setattr(instance, key, value)
+    compiled_time = (time.perf_counter() - start) / len(workload)
+
+    print(f"Assignments:      {len(baseline_workload)} baseline, {n_sets} compiled")
+    print(f"Baseline setattr: {baseline_time * 1e6:.2f} us per assignment")
+    print(f"Compiled setters: {compiled_time * 1e6:.2f} us per assignment")
+    print(f"Speedup:          {baseline_time / compiled_time:.2f}x")
+
+
+# * In the root folder, run `python tools/scripts/benchmark_setattr.py` to compare the assignment times
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-sets", type=int, default=1_000_000)
+    parser.add_argument("--baseline-sets", type=int, default=1_000)
+    args = parser.parse_args()
+    run_benchmark(args.n_sets, args.baseline_sets)